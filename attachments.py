@@ -0,0 +1,114 @@
+"""
+Content-addressed attachment store for the images embedded in MHTML files.
+
+Every image is stored once under the hash of its content (`attachments/<hash>.png` in the Obsidian
+project folder), so the same screenshot in many chats, or a chat exported again, adds no bytes.
+Image links of the Markdown that point to an embedded image become Obsidian embeds (`![[<hash>.png]]`).
+"""
+
+import hashlib
+import mimetypes
+import os
+import re
+
+from mhtml import iter_image_parts
+
+
+DEFAULT_ATTACHMENTS_DIR = "attachments"
+
+# Hex digits of the sha256 used in the file name (128 bits)
+NAME_DIGITS = 32
+
+EXTENSIONS = {
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/svg+xml': '.svg',
+    'image/avif': '.avif',
+    'image/bmp': '.bmp',
+}
+
+# Markdown image `![alt](url)` / `![alt](<url> "title")` as written by html2text and markdownify
+IMAGE_LINK_PATTERN = re.compile(r'!\[[^\]\n]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"\n]*")?\s*\)')
+
+
+class AttachmentStore:
+    """
+    Folder of attachments named by content hash.
+
+    Args:
+        root (str): Attachments folder.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def add(self, chunks, content_type):
+        """
+        Stores an attachment unless a file with the same content is already there.
+
+        The content is read twice: hashed first, then written only if it is new.
+
+        Args:
+            chunks (Callable[[], Iterable[bytes]]): Returns a fresh iterator over the content.
+            content_type (str): MIME type, gives the file extension.
+
+        Returns:
+            Tuple[str, int]: File name in the store and the number of bytes written (0 if it existed).
+        """
+        digest = hashlib.sha256()
+        for chunk in chunks():
+            digest.update(chunk)
+        extension = EXTENSIONS.get(content_type) or mimetypes.guess_extension(content_type) or '.bin'
+        name = digest.hexdigest()[:NAME_DIGITS] + extension
+        path = os.path.join(self.root, name)
+        if os.path.exists(path):
+            return name, 0
+
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        written = 0
+        try:
+            with open(tmp_path, 'wb') as file:
+                for chunk in chunks():
+                    file.write(chunk)
+                    written += len(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return name, written
+
+
+def extract_attachments(file_path, store):
+    """
+    Stores the images of an MHTML file.
+
+    Returns:
+        Tuple[dict, int]: {image reference in the HTML: file name in the store} and the bytes written.
+    """
+    names = {}
+    written = 0
+    for references, content_type, chunks in iter_image_parts(file_path):
+        name, size = store.add(chunks, content_type)
+        written += size
+        for reference in references:
+            names[reference] = name
+    return names, written
+
+
+def embed_attachments(md_text, names):
+    """
+    Replaces the Markdown image links to stored images with Obsidian embeds (`![[<file name>]]`);
+    links to other images are kept.
+    """
+    if not names:
+        return md_text
+
+    def replacer(match):
+        name = names.get(match.group(1))
+        return f'![[{name}]]' if name else match.group(0)
+
+    return IMAGE_LINK_PATTERN.sub(replacer, md_text)
@@ -0,0 +1,218 @@
+"""
+Headless batch converter MHTML → Obsidian Markdown.
+
+Converts many files in parallel (one process per file) with the same pipeline as the GUI.
+
+    python -m batch_convert D:/Downloads/gpt/*.mhtml D:/Downloads/deepseek -o D:/Projects/Obsidian/Projects
+    python -m batch_convert chat.mhtml --split-pages --range "1-3,(6,5-7)" --jobs 4
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from converter import ExportOptions, convert_mhtml, export_markdown, open_cache
+from perfreport import open_report
+from settings import CONFIG_PATH, cached_settings, load_config
+
+
+MHTML_EXTENSIONS = ('.mhtml', '.mht')
+
+
+def collect_files(sources):
+    """
+    Expands files, glob patterns and directories into a list of MHTML files.
+
+    Directories are scanned recursively for *.mhtml / *.mht files.
+    Duplicates are removed, the order of the sources is kept.
+
+    Args:
+        sources (List[str]): Files, glob patterns or directories.
+
+    Returns:
+        List[str]: MHTML file paths.
+    """
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            for root, _dirs, names in os.walk(source):
+                files.extend(os.path.join(root, name) for name in sorted(names)
+                             if name.lower().endswith(MHTML_EXTENSIONS))
+        elif os.path.isfile(source):
+            files.append(source)
+        else:
+            files.extend(path for path in sorted(glob.glob(source, recursive=True))
+                         if os.path.isfile(path) and path.lower().endswith(MHTML_EXTENSIONS))
+
+    return list(dict.fromkeys(os.path.abspath(path) for path in files))
+
+
+def export_names(files):
+    """
+    Gives every file its own export folder name: the file name, with the parent folder added to a name
+    shared by several files (and a number if that is still not enough). Names are compared ignoring case,
+    as on Windows.
+
+        a/chat.mhtml, b/chat.mhtml, notes.mhtml → 'chat (a)', 'chat (b)', 'notes'
+
+    Args:
+        files (List[str]): MHTML file paths.
+
+    Returns:
+        Dict[str, str]: {file path: export folder name}.
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in files]
+    counts = Counter(stem.casefold() for stem in stems)
+    names = {}
+    used = set()
+    for path, stem in zip(files, stems):
+        name = stem
+        if counts[stem.casefold()] > 1:
+            name = f"{stem} ({os.path.basename(os.path.dirname(path))})"
+        unique_name = name
+        number = 2
+        while unique_name.casefold() in used:
+            unique_name = f"{name} ({number})"
+            number += 1
+        used.add(unique_name.casefold())
+        names[path] = unique_name
+    return names
+
+
+def convert_file(file_path, export_path, options: ExportOptions, config_path=CONFIG_PATH, diagnostics=False,
+                 use_cache=True, project_path=None, export_name=None):
+    """
+    Converts one MHTML file and exports it into `export_path/<export name>`
+    (or `export_path/exported_<export name>` in incremental mode). The export name is the file name
+    unless given (see `export_names()`). The search index and the attachments are kept in `project_path`
+    (default: `export_path`).
+
+    Runs in a worker process, so everything it needs is passed by value. The settings are kept for the
+    process and read again only when config.ini changes (see `settings.cached_settings()`).
+
+    Returns:
+        Tuple[str, str, int, int, float, dict, list, str]: Source file, export directory, source size, page count,
+            seconds, Markdown backend timings, fix-up pass timings and page write speed.
+    """
+    started = time.perf_counter()
+    config = cached_settings(config_path)
+
+    cache = open_cache(config) if use_cache else None
+    report = open_report(config)
+    report.source = file_path
+
+    with report.collect():
+        result = convert_mhtml(file_path, config, diagnostics=diagnostics, cache=cache)
+
+        if export_name is None:
+            export_name = os.path.splitext(os.path.basename(file_path))[0]
+        if options.incremental:
+            export_name = f"exported_{export_name}"
+        base_path = os.path.join(export_path, export_name)
+        base_path, count, writer = export_markdown(result.md_text, file_path, export_path, options, config,
+                                                   base_path=base_path, project_path=project_path)
+
+    if config.getboolean("Settings", "perf_report", fallback=False):
+        report.save(base_path)
+
+    return (file_path, base_path, os.path.getsize(file_path), count, time.perf_counter() - started,
+            result.backend_timings, result.pass_timings, writer.throughput())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m batch_convert",
+        description="Batch conversion of ChatGPT/DeepSeek MHTML files into Obsidian Markdown.")
+    parser.add_argument("sources", nargs="+", help="MHTML files, glob patterns or directories")
+    parser.add_argument("-o", "--output",
+                        help="Obsidian project folder (default: default_save_path from config.ini)")
+    parser.add_argument("-c", "--config", default=CONFIG_PATH, help="path to config.ini")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of worker processes (default: all cores)")
+    parser.add_argument("--split-pages", action="store_true", help="split the Markdown by pages")
+    parser.add_argument("--range", default="", help="page groups, e.g. '1-3,(6,5-7),6,4-2'")
+    parser.add_argument("--unique-sort", action="store_true",
+                        help="sort and remove duplicated requests inside a page")
+    parser.add_argument("--page-template", default="page", help="page file name template")
+    parser.add_argument("--start-page", type=int, default=1, help="number of the first page")
+    parser.add_argument("--apply-start-to-requests", action="store_true",
+                        help="shift request numbers by the start page number as well")
+    parser.add_argument("--incremental", action="store_true",
+                        help="update the stable folder exported_<file name> in the output folder, "
+                             "rewriting only changed pages (files of the same name from different folders "
+                             "get the folder name added: exported_<file name> (<folder>))")
+    parser.add_argument("--no-cache", action="store_true", help="do not use the conversion cache (cache_dir)")
+    parser.add_argument("--diagnostics", action="store_true",
+                        help="also run the alternate Markdown backends and print backend and fix-up pass timings")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.sources)
+    if not files:
+        print("No MHTML files found.", file=sys.stderr)
+        return 1
+
+    config = load_config(args.config)
+    output = args.output or config.get("Settings", "default_save_path", fallback=".")
+    if args.incremental:
+        export_path = output
+    else:
+        export_path = os.path.join(output, f"exported_{datetime.now().strftime('%Y%m%d%H%M%S')}")
+
+    options = ExportOptions(
+        split_pages=args.split_pages,
+        range_text=args.range,
+        unique_sorted=args.unique_sort,
+        page_template=args.page_template,
+        start_page_number=args.start_page,
+        apply_start_request_number=args.apply_start_to_requests,
+        incremental=args.incremental,
+    )
+
+    started = time.perf_counter()
+    total_bytes = 0
+    total_pages = 0
+    failed = []
+
+    # Files of the same name from different folders must not be exported into the same folder
+    names = export_names(files)
+
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs or 1, len(files)))) as executor:
+        futures = {executor.submit(convert_file, path, export_path, options, args.config,
+                                   args.diagnostics, not args.no_cache, output, names[path]): path
+                   for path in files}
+        for future in as_completed(futures):
+            try:
+                (file_path, base_path, size, count, seconds,
+                 backend_timings, pass_timings, write_speed) = future.result()
+            except Exception as e:
+                failed.append(futures[future])
+                print(f"[FAIL] {futures[future]}: {e}", file=sys.stderr)
+                continue
+
+            total_bytes += size
+            total_pages += count
+            print(f"[ OK ] {file_path} → {base_path}: {count} pages, "
+                  f"{size / 2**20:.1f} MB in {seconds:.2f} s ({size / 2**20 / max(seconds, 1e-9):.1f} MB/s), "
+                  f"pages written at {write_speed[0] / 2**20:.1f} MB/s, {write_speed[1]:.0f} files/s")
+            if args.diagnostics:
+                print("       backends: " + ", ".join(f"{name} {backend_seconds:.3f} s"
+                                                     for name, backend_seconds in backend_timings.items()))
+                slowest = sorted(pass_timings, key=lambda timing: timing.seconds, reverse=True)[:3]
+                print("       slowest passes: " + ", ".join(f"{timing.name} {timing.seconds:.3f} s"
+                                                           for timing in slowest))
+
+    elapsed = time.perf_counter() - started
+    print(f"\nConverted {len(files) - len(failed)}/{len(files)} files, {total_pages} pages, "
+          f"{total_bytes / 2**20:.1f} MB in {elapsed:.2f} s "
+          f"({total_bytes / 2**20 / max(elapsed, 1e-9):.1f} MB/s, {len(files) / max(elapsed, 1e-9):.2f} files/s)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
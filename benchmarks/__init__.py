@@ -0,0 +1,3 @@
+"""
+Performance benchmarks. Run from the project root, e.g. `python -m benchmarks.bench_tagger`.
+"""
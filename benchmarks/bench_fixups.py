@@ -0,0 +1,131 @@
+"""
+Fix-up scanner benchmark: the `linescan` scanners vs the former backtracking patterns on adversarial input.
+
+    python -m benchmarks.bench_fixups
+    python -m benchmarks.bench_fixups --sizes 1000 64000 --budget 5 --fuzz 20000
+
+Every case is a text that makes its former pattern retry from every line: blank lines without a marker,
+tables without their end line, requests without an answer and so on. The size doubles from the first to
+the last of `--sizes`. The scanner time must grow linearly (its time per 1000 lines stays flat).
+A former pattern is no longer run once one size took more than `--budget` seconds. Wherever both ran,
+the matches must be the same. `--fuzz` also compares them on random texts made of the tokens that
+the patterns look for.
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+import linescan
+
+
+# Former patterns (fixups before the scanners)
+CHATGPT_MARK = r"(?:КопироватьРедактировать|Всегда\s+показывать\s+подробности.+?Копировать)"
+MARKER_FLAGS = re.MULTILINE | re.DOTALL | re.VERBOSE
+
+# name: (former pattern, scanner, groups, adversarial text of n lines)
+CASES = {
+    'marker spacing': (re.compile(r'(^\s+$)\s+$(\s+' + CHATGPT_MARK + ')', MARKER_FLAGS),
+                       linescan.iter_marker_spacing, (1, 2), lambda n: ' \n' * n + 'text'),
+    'marker headings': (re.compile(r'(^\s+\w+$\s+$\s+' + CHATGPT_MARK + ')', MARKER_FLAGS),
+                        linescan.iter_marker_headings, (1,), lambda n: ' python\n' + ' \n' * n + 'text'),
+    'marker code blocks': (re.compile(r'^\s+(\w+)$\s+$\s+' + CHATGPT_MARK + '(.+?^$)', MARKER_FLAGS),
+                           linescan.iter_marker_code_blocks, (1, 2),
+                           lambda n: ' python\n \n КопироватьРедактировать\n' * n + 'text'),
+    'marker details': (re.compile(r'(^\s+$)\s+$(\s+' + CHATGPT_MARK + ')', MARKER_FLAGS),
+                       linescan.iter_marker_spacing, (1, 2),
+                       lambda n: '\n \n \n Всегда показывать подробности\n' * n),
+    'table_restore': (re.compile(r"^((---\|)+---\s*$)(.+?)(^\s{2}$)", re.MULTILINE | re.DOTALL),
+                      linescan.iter_table_blocks, (1, 2, 3, 4), lambda n: '---|---\n| a | b |\n' * n),
+    'fix_code_blocks': (re.compile(r'```(\w+)(.*?)```', re.DOTALL),
+                        linescan.iter_code_blocks, (1, 2), lambda n: '```python\n' + '    code\n' * n),
+    'request_format': (re.compile(r'##### Вы сказали:\n(.*?)\n\s*###### ChatGPT сказал:', re.DOTALL),
+                       linescan.iter_request_blocks, (1,), lambda n: '##### Вы сказали:\nrequest\n' * n),
+}
+
+FUZZ_TOKENS = [' ', ' ', '\n', '\n', '\n', '\t', '\r', '\xa0', 'x', 'py', '_', '|', '---|', '---', '```', '````',
+               'КопироватьРедактировать', 'Всегда показывать подробности', 'Всегда\nпоказывать  подробности',
+               'Копировать', '##### Вы сказали:\n', '###### ChatGPT сказал:', '#', '  \n', '\n\n', 'a b']
+
+
+def spans(matches, groups):
+    return [(match.start(), match.end()) + tuple((match.start(group), match.end(group)) for group in groups)
+            for match in matches]
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def run_case(name, sizes, budget):
+    """
+    Times the former pattern and the scanner on the adversarial text of every size.
+
+    Returns:
+        bool: Whether the matches were the same wherever the former pattern ran.
+    """
+    pattern, scanner, groups, make_text = CASES[name]
+    same = True
+    former_running = True
+    print(f"\n{name}")
+    for size in sizes:
+        text = make_text(size)
+        found, seconds = timed(lambda: spans(scanner(text), groups))
+        line = f"  {size:>8} lines  scanner {seconds:8.4f} s ({seconds / size * 1000 * 1000:6.2f} ms per 1000)"
+        if former_running:
+            expected, former_seconds = timed(lambda: spans(pattern.finditer(text), groups))
+            same = same and expected == found
+            line += f"  former {former_seconds:9.4f} s  same: {expected == found}"
+            former_running = former_seconds <= budget
+        print(line, flush=True)
+    return same
+
+
+def fuzz(count, seed=0):
+    """
+    Compares the scanners with the former patterns on random texts.
+
+    Returns:
+        int: Number of texts with different matches.
+    """
+    rnd = random.Random(seed)
+    different = 0
+    for _ in range(count):
+        text = ''.join(rnd.choice(FUZZ_TOKENS) for _ in range(rnd.randint(0, 40)))
+        for name, (pattern, scanner, groups, _make_text) in CASES.items():
+            if spans(pattern.finditer(text), groups) != spans(scanner(text), groups):
+                different += 1
+                print(f"{name}: different matches in {text!r}")
+    return different
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs=2, type=int, default=[100, 51200], metavar=("FIRST", "LAST"),
+                        help="number of lines of the adversarial texts, doubled from FIRST to LAST")
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="seconds after which a former pattern is not run on larger texts")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--fuzz", type=int, default=5000, help="random texts to compare (0 — none)")
+    args = parser.parse_args(argv)
+
+    sizes = []
+    size = args.sizes[0]
+    while size <= args.sizes[1]:
+        sizes.append(size)
+        size *= 2
+
+    same = all([run_case(name, sizes, args.budget) for name in args.cases])
+    different = fuzz(args.fuzz) if args.fuzz else 0
+    print(f"\nsame matches on the adversarial texts: {same}")
+    if args.fuzz:
+        print(f"random texts with different matches: {different} of {args.fuzz}")
+    return 0 if same and not different else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
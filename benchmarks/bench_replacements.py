@@ -0,0 +1,122 @@
+"""
+[Hard_replacements] benchmark: the single-pass `multireplace.Replacer` vs applying the rules one by one.
+
+    python -m benchmarks.bench_replacements
+    python -m benchmarks.bench_replacements --rules 200 --mb 50 --fuzz 20000
+
+A synthetic Markdown document of `--mb` million characters gets `--rules` rules: literal ones for tag-like
+structures (`<module>` → `<_module_>`) with a regex rule among every `--regex-every`. Both ways are timed
+and must give the same text. `--fuzz` also compares them on random rules and texts over a small alphabet,
+where rules overlap and feed each other all the time.
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from multireplace import Replacer, replace_in_order
+
+
+LINES = [
+    "Обычный текст ответа с `inline code`, ссылкой [docs](https://example.com) и **выделением**.",
+    "    def handler(event, context):",
+    "| колонка | значение |",
+    "- пункт списка с примером",
+    "",
+]
+
+FUZZ_ALPHABET = 'ab<>\n'
+
+
+def make_rules(count, regex_every):
+    """
+    Returns `count` rules: literal tag replacements with a regex rule among every `regex_every`.
+    """
+    rules = []
+    for index in range(count):
+        if regex_every and index % regex_every == regex_every - 1:
+            rules.append((re.compile(fr'^[+]{index}\b', re.MULTILINE), fr'\\+{index}'))
+        else:
+            rules.append((f'<tag{index}>', f'<_tag{index}_>'))
+    return rules
+
+
+def make_document(size, rules, seed=0):
+    """
+    Returns about `size` characters of Markdown lines, every fourth one with an original of a rule.
+    """
+    rnd = random.Random(seed)
+    originals = [original if isinstance(original, str) else f'+{index}'
+                 for index, (original, _replacement) in enumerate(rules)]
+    lines = []
+    length = 0
+    while length < size:
+        line = rnd.choice(LINES)
+        if rnd.random() < 0.25:
+            line = f"{rnd.choice(originals)} {line}"
+        lines.append(line)
+        length += len(line) + 1
+    return '\n'.join(lines)
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def random_rule(rnd):
+    if rnd.random() < 0.15:
+        return re.compile(rnd.choice(['a+', '^b', '<.', 'b$', 'ab', '>']), re.MULTILINE), rnd.choice(['', 'b', r'\\a'])
+    return (''.join(rnd.choice(FUZZ_ALPHABET) for _ in range(rnd.randint(1, 3))),
+            ''.join(rnd.choice(FUZZ_ALPHABET) for _ in range(rnd.randint(0, 3))))
+
+
+def fuzz(count, seed=0):
+    """
+    Compares `Replacer` with `replace_in_order()` on random rules and texts.
+
+    Returns:
+        int: Number of different results.
+    """
+    rnd = random.Random(seed)
+    different = 0
+    for _ in range(count):
+        rules = [random_rule(rnd) for _ in range(rnd.randint(1, 8))]
+        text = ''.join(rnd.choice(FUZZ_ALPHABET) for _ in range(rnd.randint(0, 40)))
+        if Replacer(rules).apply(text) != replace_in_order(rules, text):
+            different += 1
+            print(f"different results: {rules!r} on {text!r}")
+    return different
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--mb", type=float, default=50, help="document size in millions of characters")
+    parser.add_argument("--regex-every", type=int, default=50, help="one regex rule per this many rules (0 — none)")
+    parser.add_argument("--fuzz", type=int, default=5000, help="random rule sets to compare (0 — none)")
+    args = parser.parse_args(argv)
+
+    rules = make_rules(args.rules, args.regex_every)
+    replacer, plan_seconds = timed(Replacer, rules)
+    text = make_document(int(args.mb * 1_000_000), rules)
+    print(f"{len(rules)} rules in {len(replacer.passes)} passes (planned in {plan_seconds * 1000:.1f} ms), "
+          f"{len(text) / 1_000_000:.1f} M characters")
+
+    expected, in_order_seconds = timed(replace_in_order, rules, text)
+    print(f"  one by one   {in_order_seconds:8.3f} s", flush=True)
+    found, seconds = timed(replacer.apply, text)
+    same = found == expected
+    print(f"  passes       {seconds:8.3f} s  x{in_order_seconds / seconds:5.1f}  same: {same}")
+
+    different = fuzz(args.fuzz) if args.fuzz else 0
+    if args.fuzz:
+        print(f"random rule sets with different results: {different} of {args.fuzz}")
+    return 0 if same and not different else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
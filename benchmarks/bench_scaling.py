@@ -0,0 +1,177 @@
+"""
+Scaling benchmark of the whole pipeline on synthetic chats (see `benchmarks.mhtml_gen`).
+
+    python -m benchmarks.bench_scaling
+    python -m benchmarks.bench_scaling --turns 10 100 --kinds chatgpt -o before.json
+    python -m benchmarks.bench_scaling --compare before.json after.json
+    python -m benchmarks.bench_scaling --turns 1000 5000 --kinds chatgpt --no-split
+
+For every chat kind and size the stages are timed separately: `decode` (`read_mhtml()`), `convert`
+(`convert_to_markdown()`) and `save` (`export_markdown()` with one page per request, or everything in one
+file with `--no-split`). A second run under tracemalloc measures the peak Python heap every stage allocates
+on top of its input. Results are saved as JSON with the commit
+they were measured on, so runs of different commits can be compared with `--compare`.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.mhtml_gen import generate
+from converter import ExportOptions, convert_to_markdown, export_markdown, read_mhtml
+from settings import CONFIG_PATH, load_config
+
+
+STAGES = ('decode', 'convert', 'save')
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.strip()
+    except OSError:
+        return ''
+
+
+def run_stages(file_path, export_path, config, measure_memory=False, split_pages=True):
+    """
+    Runs decode → convert → save once.
+
+    Returns:
+        Tuple[dict, int]: {stage: seconds or peak bytes} and the number of saved pages.
+    """
+    results = {}
+    pages = 0
+    value = None
+    for stage in STAGES:
+        if measure_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        # The pipeline prints the detected chat type; keep the benchmark output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            if stage == 'decode':
+                value = read_mhtml(file_path)
+            elif stage == 'convert':
+                value = convert_to_markdown(value, config)
+            else:
+                _base_path, pages, _writer = export_markdown(value.md_text, file_path, export_path,
+                                                             ExportOptions(split_pages=split_pages), config)
+        if measure_memory:
+            _current, results[stage] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            results[stage] = time.perf_counter() - started
+    return results, pages
+
+
+def benchmark(kinds, turns_list, config, repeat=1, measure_memory=True, seed=0, split_pages=True):
+    """
+    Generates the chats and measures every stage (best time of `repeat` runs).
+
+    Returns:
+        List[dict]: One record per chat kind and size.
+    """
+    records = []
+    with tempfile.TemporaryDirectory(prefix='gpt2md_bench_') as work_dir:
+        for kind in kinds:
+            for turns in turns_list:
+                file_path = os.path.join(work_dir, f'{kind}_{turns}.mhtml')
+                with open(file_path, 'wb') as file:
+                    file.write(generate(kind, turns, seed))
+
+                seconds = {stage: float('inf') for stage in STAGES}
+                pages = 0
+                for _ in range(repeat):
+                    timings, pages = run_stages(file_path, tempfile.mkdtemp(dir=work_dir), config,
+                                                split_pages=split_pages)
+                    seconds = {stage: min(seconds[stage], timings[stage]) for stage in STAGES}
+                peak = (run_stages(file_path, tempfile.mkdtemp(dir=work_dir), config, True, split_pages)[0]
+                        if measure_memory else {})
+
+                record = {
+                    'kind': kind,
+                    'turns': turns,
+                    'mhtml_bytes': os.path.getsize(file_path),
+                    'pages': pages,
+                    'split_pages': split_pages,
+                    'seconds': seconds,
+                    'peak_bytes': peak,
+                }
+                records.append(record)
+                print(format_record(record), flush=True)
+    return records
+
+
+def format_record(record):
+    stages = '  '.join(f"{stage} {record['seconds'][stage]:8.3f} s" for stage in STAGES)
+    peaks = '  '.join(f"{stage} {record['peak_bytes'][stage] / 2**20:6.1f}" for stage in STAGES
+                      if stage in record['peak_bytes'])
+    return (f"{record['kind']:<9}{record['turns']:>6} turns {record['mhtml_bytes'] / 2**20:7.1f} MB  {stages}"
+            + (f"  peak MB: {peaks}" if peaks else ""))
+
+
+def compare(old_path, new_path):
+    """
+    Prints the speedup of every stage between two result files (old / new time).
+    """
+    with open(old_path, encoding='utf-8') as file:
+        old = json.load(file)
+    with open(new_path, encoding='utf-8') as file:
+        new = json.load(file)
+
+    print(f"{old_path} ({old.get('commit') or '?'}) → {new_path} ({new.get('commit') or '?'})")
+    old_records = {(record['kind'], record['turns']): record for record in old['results']}
+    for record in new['results']:
+        before = old_records.get((record['kind'], record['turns']))
+        if before is None:
+            continue
+        ratios = '  '.join(f"{stage} x{before['seconds'][stage] / max(record['seconds'][stage], 1e-9):5.2f}"
+                           for stage in STAGES)
+        print(f"{record['kind']:<9}{record['turns']:>6} turns  {ratios}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kinds", nargs="+", choices=("chatgpt", "deepseek"), default=["chatgpt", "deepseek"])
+    parser.add_argument("--turns", nargs="+", type=int, default=[10, 100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=1, help="runs per size, the best time is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--no-split", action="store_true", help="save everything into one page")
+    parser.add_argument("-c", "--config", default=CONFIG_PATH)
+    parser.add_argument("-o", "--output", help="JSON results file (default: bench_scaling_<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    config = load_config(args.config)
+    commit = git_commit()
+    records = benchmark(args.kinds, args.turns, config, max(1, args.repeat), not args.no_memory,
+                        split_pages=not args.no_split)
+
+    output = args.output or f"bench_scaling_{commit or 'unknown'}.json"
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump({
+            'commit': commit,
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'results': records,
+        }, file, ensure_ascii=False, indent=1)
+    print(f"\nSaved to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
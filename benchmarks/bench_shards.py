@@ -0,0 +1,63 @@
+"""
+Benchmark of rendering one large ChatGPT chat by several processes (`convert_jobs`, see `sharding`).
+
+    python -m benchmarks.bench_shards --turns 5000 --jobs 1 2 4
+
+A synthetic chat (see `benchmarks.mhtml_gen`) is decoded once, then `convert_to_markdown()` is timed
+with every number of processes; the Markdown must be the same as with one process.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from benchmarks.mhtml_gen import generate
+from converter import convert_to_markdown, find_turn_starts, read_mhtml
+from settings import CONFIG_PATH, load_config
+from sharding import plan_shards
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=5000)
+    parser.add_argument("--jobs", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=1, help="runs per number of processes, the best time is kept")
+    parser.add_argument("-c", "--config", default=CONFIG_PATH)
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    config.set("Settings", "turn_pipeline", "yes")
+
+    with tempfile.TemporaryDirectory(prefix='gpt2md_bench_') as work_dir:
+        file_path = os.path.join(work_dir, f'chatgpt_{args.turns}.mhtml')
+        with open(file_path, 'wb') as file:
+            file.write(generate('chatgpt', args.turns))
+        html_content = read_mhtml(file_path)
+
+    offsets = find_turn_starts(html_content) + [len(html_content)]
+    print(f"{args.turns} turns, {len(html_content) / 2**20:.1f} MB of HTML, {os.cpu_count()} cores")
+
+    expected = None
+    baseline = None
+    for jobs in [1] + [jobs for jobs in args.jobs if jobs != 1]:
+        config.set("Settings", "convert_jobs", str(jobs))
+        seconds = float('inf')
+        for _ in range(max(1, args.repeat)):
+            started = time.perf_counter()
+            # The pipeline prints the detected chat type; keep the benchmark output readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                md_text = convert_to_markdown(html_content, config).md_text
+            seconds = min(seconds, time.perf_counter() - started)
+
+        if expected is None:
+            expected, baseline = md_text, seconds
+        shards = len(plan_shards(offsets, jobs)) if jobs > 1 else 1
+        print(f"jobs {jobs:>2}  {shards:>3} shards  {seconds:8.3f} s  x{baseline / seconds:5.2f}"
+              f"  same: {md_text == expected}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Startup benchmark: how long `import main` takes (`python -X importtime`) and which modules it pulls in.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 10 --top 15 --max-ms 400
+
+Every run is a fresh interpreter. The best cumulative import time of `main` is reported together with
+the slowest modules of that run. The conversion libraries (`converter.LAZY_MODULES`) must not be imported
+at startup: the command fails if any of them is, or if the import takes longer than `--max-ms`.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from converter import LAZY_MODULES
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Prints the lazy modules that got imported anyway
+LAZY_CHECK = "import sys, main; print(' '.join(m for m in sys.argv[1:] if m in sys.modules))"
+
+
+def import_times(module='main'):
+    """
+    Imports the module in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        List[Tuple[str, int, int]]: (module, self µs, cumulative µs) in import order.
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                               capture_output=True, text=True, cwd=ROOT, check=True)
+    times = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times.append((name.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def eagerly_imported(modules):
+    completed = subprocess.run([sys.executable, '-c', LAZY_CHECK, *modules],
+                               capture_output=True, text=True, cwd=ROOT, check=True)
+    return completed.stdout.split()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="interpreter runs, the best time is kept")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--max-ms", type=float, help="fail if importing main takes longer")
+    args = parser.parse_args(argv)
+
+    best = None
+    for _ in range(max(1, args.repeat)):
+        times = import_times()
+        if best is None or times[-1][2] < best[-1][2]:
+            best = times
+
+    total_ms = best[-1][2] / 1000
+    print(f"import main: {total_ms:.1f} ms (best of {max(1, args.repeat)})")
+    print(f"\n{'module':<50} {'self, ms':>9} {'cumulative, ms':>15}")
+    for name, self_us, cumulative_us in sorted(best, key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{name:<50} {self_us / 1000:9.1f} {cumulative_us / 1000:15.1f}")
+
+    failed = False
+    eager = eagerly_imported(LAZY_MODULES)
+    if eager:
+        print(f"\nImported at startup, must be lazy: {', '.join(eager)}")
+        failed = True
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"\nStartup budget exceeded: {total_ms:.1f} ms > {args.max_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
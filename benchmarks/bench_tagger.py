@@ -0,0 +1,73 @@
+"""
+Keyword tagging benchmark: Aho-Corasick `KeywordTagger` vs the former per-keyword loop.
+
+    python -m benchmarks.bench_tagger --pages 1000
+"""
+
+import argparse
+import random
+import time
+
+from settings import CONFIG_PATH, load_config
+from tagger import KeywordTagger, convert_tags
+
+
+FILLER = ['lorem', 'ipsum', 'the', 'function', 'return', 'value', 'table', 'код', 'данные', 'запрос']
+
+
+def make_pages(keywords, pages, seed=0):
+    """
+    Generates pages of 200-3000 words with ~5% keyword mentions (in random case).
+    """
+    rnd = random.Random(seed)
+    searches = [search for search, _tag in keywords if search]
+    result = []
+    for _ in range(pages):
+        words = []
+        for _ in range(rnd.randint(200, 3000)):
+            if rnd.random() < 0.05:
+                word = rnd.choice(searches)
+                words.append(word.upper() if rnd.random() < 0.3 else word)
+            else:
+                words.append(rnd.choice(FILLER))
+        result.append(' '.join(words))
+    return result
+
+
+def loop_tags(keywords, content):
+    # Former implementation in save_blocks
+    return [word[1] for word in keywords if word[0].lower() in content.lower()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("-c", "--config", default=CONFIG_PATH)
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    raw_value = config.get("Keywords", "words", fallback="")
+    keywords = convert_tags([line.strip() for line in raw_value.strip().splitlines() if line.strip()])
+    pages = make_pages(keywords, args.pages)
+    size = sum(map(len, pages))
+
+    started = time.perf_counter()
+    tagger = KeywordTagger(keywords)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = [loop_tags(keywords, page) for page in pages]
+    loop = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = [tagger.tags(page) for page in pages]
+    automaton = time.perf_counter() - started
+
+    print(f"{len(keywords)} keywords, {len(pages)} pages, {size / 2**20:.1f} MB")
+    print(f"loop:       {loop:8.3f} s")
+    print(f"automaton:  {automaton:8.3f} s  (build {build * 1000:.1f} ms, x{loop / automaton:.1f})")
+    print(f"same tags:  {expected == actual}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Synthetic MHTML chats in the ChatGPT and DeepSeek DOM shapes the converter recognises.
+
+    python -m benchmarks.mhtml_gen --kind chatgpt --turns 1000 -o chat_1000.mhtml
+    python -m benchmarks.mhtml_gen --kind deepseek --turns 100 --images 0.2 -o deepseek_100.mhtml
+
+Every turn has a request and an answer with paragraphs and lists; code blocks, canvas panels (ChatGPT),
+tables and embedded images are added with the given probabilities. Output is deterministic for a seed.
+"""
+
+import argparse
+import base64
+import quopri
+import random
+
+
+BOUNDARY = '----MultipartBoundary--benchmark'
+
+WORDS = ['данные', 'запрос', 'функция', 'таблица', 'индекс', 'Python', 'Docker', 'Kafka', 'SQL', 'Redis',
+         'pipeline', 'schema', 'value', 'cache', 'thread', 'процесс', 'ответ', 'пример', 'the', 'и', 'в', 'на']
+
+CODE_LINES = ['def handler(event, context):', '    items = load(event["items"])', '    for item in items:',
+              '        if item.value < LIMIT and item.ok:', '            yield transform(item)',
+              '    return {"status": 200}', 'SELECT id, name FROM users WHERE id > 10;',
+              'docker run --rm -it -p 8080:8080 app:latest']
+
+LANGUAGES = ['python', 'sql', 'bash', 'javascript', 'yaml']
+
+
+def _sentence(rnd, words=12):
+    return ' '.join(rnd.choice(WORDS) for _ in range(rnd.randint(words // 2, words))).capitalize() + '.'
+
+
+def _escape(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _code(rnd):
+    return '\n'.join(rnd.choice(CODE_LINES) for _ in range(rnd.randint(3, 15)))
+
+
+def _table(rnd):
+    columns = rnd.randint(2, 5)
+    head = ''.join(f'<th>{rnd.choice(WORDS)}</th>' for _ in range(columns))
+    rows = ''.join('<tr>' + ''.join(f'<td>{rnd.choice(WORDS)} {rnd.randint(0, 999)}</td>' for _ in range(columns))
+                   + '</tr>' for _ in range(rnd.randint(2, 8)))
+    return f'<table><thead><tr>{head}</tr></thead><tbody>{rows}</tbody></table>'
+
+
+def _image(rnd, images):
+    url = f'https://files.example.com/file-{len(images):06}.png'
+    images.append((url, bytes(rnd.getrandbits(8) for _ in range(rnd.randint(2000, 20000)))))
+    return f'<img src="{url}" alt="image" width="512">'
+
+
+def chatgpt_html(turns, seed=0, code=0.5, canvas=0.1, tables=0.2, images=0.05, image_list=None):
+    """
+    Builds a ChatGPT chat page.
+
+    Args:
+        turns (int): Number of request/answer turns.
+        seed (int): Random seed.
+        code, canvas, tables, images (float): Probability of a code block / canvas panel / table / image per turn.
+        image_list (list): Receives (url, bytes) of the embedded images.
+
+    Returns:
+        str: HTML.
+    """
+    rnd = random.Random(seed)
+    image_list = [] if image_list is None else image_list
+    parts = ['<!DOCTYPE html><html lang="ru"><head><meta charset="utf-8"><title>ChatGPT</title>'
+             '<style>.sr-only{position:absolute}</style></head><body><div id="__next">'
+             '<nav><a href="/">ChatGPT</a><div>New chat</div></nav><main class="chat">']
+    for turn in range(turns):
+        parts.append(f'<article data-testid="conversation-turn-{2 * turn + 1}"><h5 class="sr-only">Вы сказали:</h5>'
+                     f'<div data-message-author-role="user"><div class="whitespace-pre-wrap">'
+                     f'{_escape(_sentence(rnd, 30))} &lt;module&gt; {turn}</div></div></article>')
+        parts.append(f'<article data-testid="conversation-turn-{2 * turn + 2}"><h6 class="sr-only">ChatGPT сказал:</h6>'
+                     '<div data-message-author-role="assistant"><div class="markdown prose">')
+        parts.append(f'<p>{_sentence(rnd, 40)}</p><h3>{_sentence(rnd, 4)}</h3>'
+                     f'<ul><li>{_sentence(rnd)}</li><li>{_sentence(rnd)}</li></ul><p>{_sentence(rnd, 40)}</p>')
+        if rnd.random() < code:
+            language = rnd.choice(LANGUAGES)
+            parts.append(f'<pre class="overflow-visible"><div class="contain-inline-size"><div>{language}</div>'
+                         '<div><button>Копировать</button><button>Редактировать</button></div>'
+                         f'<div class="overflow-y-auto"><code class="language-{language}">{_escape(_code(rnd))}'
+                         '</code></div></div></pre>')
+        if rnd.random() < tables:
+            parts.append(_table(rnd))
+        if rnd.random() < images:
+            parts.append(_image(rnd, image_list))
+        if rnd.random() < canvas:
+            language = rnd.choice(LANGUAGES)
+            lines = ''.join(f'<div class="cm-line"><span class="tok">{_escape(line)}</span></div>'
+                            for line in _code(rnd).splitlines())
+            parts.append('<main class="relative flex min-h-0 flex-auto grow flex-col">'
+                         f'<h2>{_sentence(rnd, 4)}</h2><div class="cm-editor"><div class="cm-gutters">'
+                         + ''.join(f'<div>{n}</div>' for n in range(1, 4)) +
+                         f'</div><div class="cm-content" data-language="{language}">{lines}</div></div></main>')
+        parts.append('</div></div></article>')
+    parts.append('</main></div></body></html>')
+    return ''.join(parts)
+
+
+def deepseek_html(turns, seed=0, code=0.5, tables=0.2, images=0.05, image_list=None):
+    """
+    Builds a DeepSeek chat page (see `converter.fix_deepseek_html()` for the request markup it relies on).
+
+    Args:
+        turns (int): Number of request/answer turns.
+        seed (int): Random seed.
+        code, tables, images (float): Probability of a code block / table / image per turn.
+        image_list (list): Receives (url, bytes) of the embedded images.
+
+    Returns:
+        str: HTML.
+    """
+    rnd = random.Random(seed)
+    image_list = [] if image_list is None else image_list
+    parts = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>DeepSeek - Into the Unknown</title></head>'
+             '<body><div id="root"><div class="ds-theme">']
+    for turn in range(turns):
+        parts.append(f'<div class="_9663006"><div class="fbb737a4">{_escape(_sentence(rnd, 30))} {turn}</div>'
+                     '<div class="_78e0558"><div class="_43c05b5">'
+                     '<div class="ds-flex _965abe9" style="align-items: flex-end; gap: 0px;">'
+                     '<div class="ds-icon-button"><svg viewBox="0 0 20 20"></svg></div></div></div></div></div>')
+        parts.append(f'<div class="ds-markdown ds-markdown--block"><p>{_sentence(rnd, 40)}</p>'
+                     f'<ul><li>{_sentence(rnd)}</li><li>{_sentence(rnd)}</li></ul>')
+        if rnd.random() < code:
+            language = rnd.choice(LANGUAGES)
+            parts.append(f'<div class="md-code-block"><div class="md-code-block-banner"><span>{language}</span>'
+                         '<div><button><svg></svg> Copy</button> <button><svg></svg> Download</button></div></div>'
+                         f'<pre>{_escape(_code(rnd))}</pre></div>')
+        if rnd.random() < tables:
+            parts.append(_table(rnd))
+        if rnd.random() < images:
+            parts.append(_image(rnd, image_list))
+        parts.append('</div>')
+    parts.append('<div>New chat</div><div>DeepThink (R1)</div><div>Search ...</div></div></div></body></html>')
+    return ''.join(parts)
+
+
+def build_mhtml(html, images=(), url='https://chatgpt.com/c/benchmark'):
+    """
+    Packs the page and its images into an MHTML file the way Chrome saves it
+    (quoted-printable HTML, base64 images).
+
+    Returns:
+        bytes: MHTML file content.
+    """
+    parts = [f'From: <Saved by Blink>\r\nSnapshot-Content-Location: {url}\r\nSubject: benchmark\r\n'
+             'MIME-Version: 1.0\r\nContent-Type: multipart/related;\r\n\ttype="text/html";\r\n'
+             f'\tboundary="{BOUNDARY}"\r\n\r\n\r\n']
+    qp = quopri.encodestring(html.encode('utf-8')).decode('ascii').replace('\n', '\r\n')
+    parts.append(f'--{BOUNDARY}\r\nContent-Type: text/html\r\nContent-ID: <frame-0@mhtml.blink>\r\n'
+                 f'Content-Transfer-Encoding: quoted-printable\r\nContent-Location: {url}\r\n\r\n{qp}\r\n\r\n')
+    for image_url, data in images:
+        encoded = base64.encodebytes(data).decode('ascii').replace('\n', '\r\n')
+        parts.append(f'--{BOUNDARY}\r\nContent-Type: image/png\r\nContent-Transfer-Encoding: base64\r\n'
+                     f'Content-Location: {image_url}\r\n\r\n{encoded}\r\n')
+    parts.append(f'--{BOUNDARY}--\r\n')
+    return ''.join(parts).encode('ascii')
+
+
+def generate(kind, turns, seed=0, code=0.5, canvas=0.1, tables=0.2, images=0.05):
+    """
+    Generates a chat of the given kind ('chatgpt' or 'deepseek').
+
+    Returns:
+        bytes: MHTML file content.
+    """
+    image_list = []
+    if kind == 'chatgpt':
+        html = chatgpt_html(turns, seed, code, canvas, tables, images, image_list)
+        return build_mhtml(html, image_list, 'https://chatgpt.com/c/benchmark')
+    if kind == 'deepseek':
+        html = deepseek_html(turns, seed, code, tables, images, image_list)
+        return build_mhtml(html, image_list, 'https://chat.deepseek.com/a/chat/s/benchmark')
+    raise ValueError(f"Unknown chat kind: {kind}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kind", choices=("chatgpt", "deepseek"), default="chatgpt")
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--code", type=float, default=0.5, help="probability of a code block per turn")
+    parser.add_argument("--canvas", type=float, default=0.1, help="probability of a canvas panel per turn (ChatGPT)")
+    parser.add_argument("--tables", type=float, default=0.2, help="probability of a table per turn")
+    parser.add_argument("--images", type=float, default=0.05, help="probability of an embedded image per turn")
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+
+    data = generate(args.kind, args.turns, args.seed, args.code, args.canvas, args.tables, args.images)
+    with open(args.output, 'wb') as file:
+        file.write(data)
+    print(f"{args.output}: {args.kind}, {args.turns} turns, {len(data) / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+On-disk cache of conversion stages.
+
+Artifacts (decoded HTML, raw Markdown, final Markdown) are stored as zlib-compressed files named
+by a key derived from the MHTML content hash and the settings the stage depends on; the least
+recently used ones are evicted when the cache grows over its size limit.
+"""
+
+import hashlib
+import os
+import zlib
+
+
+class ConversionCache:
+    """
+    Size-limited LRU cache of text artifacts in a directory.
+
+    Args:
+        cache_dir (str): Cache directory (created on demand).
+        max_bytes (int): Size limit; oldest artifacts are evicted after each write.
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 2**20):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Builds a cache key from strings (e.g. a parent key and the settings of the stage).
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    @staticmethod
+    def file_key(file_path, version=''):
+        """
+        Builds a key from the file content and the pipeline version.
+        """
+        digest = hashlib.sha256(str(version).encode('utf-8') + b'\0')
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key, kind):
+        return os.path.join(self.cache_dir, f'{key}.{kind}')
+
+    def get(self, key, kind):
+        """
+        Returns the cached text or None. A hit marks the artifact as recently used.
+        """
+        path = self._path(key, kind)
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+            text = zlib.decompress(data).decode('utf-8', 'surrogatepass')
+        except (OSError, zlib.error, UnicodeDecodeError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key, kind, text):
+        """
+        Stores the text and evicts the least recently used artifacts over the size limit.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key, kind)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(zlib.compress(text.encode('utf-8', 'surrogatepass'), 1))
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self.evict()
+
+    def entries(self):
+        """
+        Returns (mtime, size, path) of all cached artifacts.
+        """
+        result = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.endswith('.tmp'):
+                        stat = entry.stat()
+                        result.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return result
+
+    def size(self):
+        return sum(size for _mtime, size, _path in self.entries())
+
+    def evict(self):
+        entries = sorted(self.entries())
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Removes all cached artifacts.
+
+        Returns:
+            int: Number of freed bytes.
+        """
+        freed = 0
+        for _mtime, size, path in self.entries():
+            try:
+                os.remove(path)
+                freed += size
+            except OSError:
+                pass
+        return freed
@@ -0,0 +1,166 @@
+"""
+Encoding resolution of the HTML part.
+
+Declared encodings are tried first: the MIME charset, a byte order mark and `<meta charset>` from the
+start of the document, then utf-8 and windows-1251. Every candidate is validated while decoding chunk
+by chunk, so a wrong one fails at its first bad chunk. Only if all of them fail, chardet guesses the
+encoding from at most `max_detect_bytes` of the payload instead of the whole file.
+"""
+
+import codecs
+import re
+import time
+
+
+# Size of the chunks decoded (and validated) at once
+DECODE_CHUNK_SIZE = 1 << 20
+
+# Size of the chunks fed to the detector
+DETECT_CHUNK_SIZE = 64 << 10
+
+# Bytes of the payload chardet may look at
+DEFAULT_DETECT_MAX_BYTES = 256 << 10
+
+# `<meta charset>` must be within the first 1024 bytes (HTML encoding sniffing)
+META_PRESCAN_BYTES = 1024
+
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]*?charset\s*=\s*["\']?\s*([-\w.:]+)', re.IGNORECASE)
+
+# Longest first: the utf-32 BOM starts with the utf-16 one
+BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+FALLBACK_ENCODINGS = ('utf-8', 'windows-1251')
+
+
+class EncodingDecision:
+    """
+    How the encoding of a payload was chosen.
+
+    Attributes:
+        encoding (str): Encoding the payload was decoded with.
+        source (str): Where it came from: 'mime', 'bom', 'meta', 'fallback' or 'detected'.
+        rejected (List[str]): Candidates that failed to decode the payload.
+        detected_bytes (int): Bytes fed to the detector (0 if it did not run).
+        seconds (float): Time spent resolving and decoding.
+    """
+    __slots__ = ('encoding', 'source', 'rejected', 'detected_bytes', 'seconds')
+
+    def __init__(self, encoding, source, rejected=(), detected_bytes=0, seconds=0.0):
+        self.encoding = encoding
+        self.source = source
+        self.rejected = list(rejected)
+        self.detected_bytes = detected_bytes
+        self.seconds = seconds
+
+    def __str__(self):
+        text = f"{self.encoding} ({self.source})"
+        if self.rejected:
+            text += f", rejected: {', '.join(self.rejected)}"
+        if self.detected_bytes:
+            text += f", detector read {self.detected_bytes} bytes"
+        return f"{text}, {self.seconds * 1000:.1f} ms"
+
+
+def normalize_encoding(name):
+    """
+    Returns the canonical codec name, or None for an unknown encoding.
+    """
+    try:
+        return codecs.lookup(name.strip()).name
+    except (LookupError, AttributeError, UnicodeError):
+        return None
+
+
+def sniff_bom(raw_bytes):
+    for bom, encoding in BOMS:
+        if raw_bytes.startswith(bom):
+            return encoding
+    return None
+
+
+def sniff_meta_charset(raw_bytes):
+    match = META_CHARSET_PATTERN.search(raw_bytes, 0, META_PRESCAN_BYTES)
+    return match.group(1).decode('ascii', 'replace') if match else None
+
+
+def decode_strict(raw_bytes, encoding):
+    """
+    Decodes the payload chunk by chunk, giving up at the first chunk that is invalid in the encoding.
+
+    Returns:
+        str | None: Decoded text, None if the payload is not valid in the encoding.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    view = memoryview(raw_bytes)
+    pieces = []
+    try:
+        for start in range(0, len(view), DECODE_CHUNK_SIZE):
+            pieces.append(decoder.decode(view[start:start + DECODE_CHUNK_SIZE]))
+        pieces.append(decoder.decode(b'', final=True))
+    except UnicodeDecodeError:
+        return None
+    return ''.join(pieces)
+
+
+def detect_encoding(raw_bytes, max_bytes=DEFAULT_DETECT_MAX_BYTES):
+    """
+    Guesses the encoding with chardet, feeding it at most `max_bytes` of the payload.
+
+    Returns:
+        Tuple[str | None, int]: Detected encoding (None if unknown) and the number of bytes read.
+    """
+    from chardet.universaldetector import UniversalDetector
+
+    detector = UniversalDetector()
+    view = memoryview(raw_bytes)[:max(0, max_bytes)]
+    fed = 0
+    for start in range(0, len(view), DETECT_CHUNK_SIZE):
+        chunk = view[start:start + DETECT_CHUNK_SIZE]
+        detector.feed(bytes(chunk))
+        fed += len(chunk)
+        if detector.done:
+            break
+    detector.close()
+    return detector.result['encoding'], fed
+
+
+def decode_payload(raw_bytes, charset=None, max_detect_bytes=DEFAULT_DETECT_MAX_BYTES):
+    """
+    Decodes the HTML part with the first candidate encoding that is valid for it
+    (MIME charset, BOM, `<meta charset>`, utf-8, windows-1251), otherwise with the detected one.
+
+    Args:
+        raw_bytes (bytes): Payload of the HTML part.
+        charset (str): Charset parameter of the part's Content-Type, if any.
+        max_detect_bytes (int): Bytes of the payload the detector may read.
+
+    Returns:
+        Tuple[str, EncodingDecision]: Decoded text and how its encoding was chosen.
+    """
+    started = time.perf_counter()
+    candidates = [(charset, 'mime'), (sniff_bom(raw_bytes), 'bom'), (sniff_meta_charset(raw_bytes), 'meta')]
+    candidates += [(encoding, 'fallback') for encoding in FALLBACK_ENCODINGS]
+
+    tried = set()
+    rejected = []
+    for name, source in candidates:
+        encoding = normalize_encoding(name) if name else None
+        if encoding is None or encoding in tried:
+            continue
+        tried.add(encoding)
+        text = decode_strict(raw_bytes, encoding)
+        if text is not None:
+            return text, EncodingDecision(encoding, source, rejected, 0, time.perf_counter() - started)
+        rejected.append(encoding)
+
+    encoding, detected_bytes = detect_encoding(raw_bytes, max_detect_bytes)
+    encoding = normalize_encoding(encoding) if encoding else None
+    text = raw_bytes.decode(encoding or 'utf-8', errors='replace')
+    return text, EncodingDecision(encoding or 'utf-8', 'detected', rejected, detected_bytes,
+                                  time.perf_counter() - started)
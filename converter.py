@@ -0,0 +1,1328 @@
+"""
+Conversion pipeline MHTML → Obsidian Markdown without any GUI dependencies.
+
+Used by the PySide6 application (main.py) and by the headless batch converter (batch_convert.py).
+
+The conversion libraries (bs4, html2text, markdownify, chardet) are imported on first use, so importing
+this module is cheap and the GUI shows its window before they load (see `warm_up()`).
+"""
+
+import importlib
+import os
+import re
+import quopri
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+
+from attachments import DEFAULT_ATTACHMENTS_DIR, AttachmentStore, embed_attachments, extract_attachments
+from cache import ConversionCache
+from charsets import DEFAULT_DETECT_MAX_BYTES, decode_payload
+from fixups import (REQUEST_HEADING, REQUEST_NUMBER_HEADER, FixContext, format_timings, get_passes,
+                    iter_turn_segments, run_passes, run_passes_by_turn)
+from mhtml import locate_html_part
+from pagegroups import parse_page_groups, validate_page_groups
+from perfreport import stage
+from searchindex import RowSpool, SearchIndex, index_path
+from writers import IncrementalPageWriter, PageWriter, ParallelPageWriter, unique_export_path
+
+
+# Bump when a change in the pipeline makes the cached conversion stages stale
+PIPELINE_VERSION = "1"
+DEFAULT_CACHE_DIR = ".gpt2md_cache"
+
+REQUEST_LIST_NAME = '_request list_'
+
+# Pipeline stages reported to the `progress` callback
+STAGE_MIME_PARSE = "MIME parse"
+STAGE_DECODE = "decode"
+STAGE_CANVAS_FIX = "canvas fix"
+STAGE_HTML2TEXT = "html2text"
+STAGE_REGEX_FIXES = "regex fixes"
+STAGE_PAGE_WRITE = "page write"
+
+CONVERSION_STAGES = (STAGE_MIME_PARSE, STAGE_DECODE, STAGE_CANVAS_FIX, STAGE_HTML2TEXT, STAGE_REGEX_FIXES)
+
+
+class ConversionCancelled(Exception):
+    """Raised by a `progress` callback to stop the pipeline between stages or page writes."""
+
+
+def report_progress(progress, stage, done=0, total=1):
+    """
+    Calls the optional `progress(stage, done, total)` callback.
+
+    The callback may raise `ConversionCancelled` to stop the pipeline.
+    """
+    if progress is not None:
+        progress(stage, done, total)
+
+
+@dataclass
+class ExportOptions:
+    """
+    Export parameters (the same ones set in the GUI "Параметры экспорта" block).
+
+    Attributes:
+        split_pages: Split the Markdown into pages (otherwise one page + request list).
+        range_text: Page groups in the format '1-3,(6,5-7),6,4-2'. Empty means every request on its own page.
+        unique_sorted: Sort and dedupe requests inside every group.
+        page_template: Page file name template ('page' → 'page 001.md').
+        start_page_number: Number of the first page (used only with split_pages).
+        apply_start_request_number: Propagate start_page_number into request numbers.
+        incremental: Export into the stable folder `exported_<source file name>` and rewrite only changed pages.
+    """
+    split_pages: bool = False
+    range_text: str = ""
+    unique_sorted: bool = False
+    page_template: str = "page"
+    start_page_number: int = 1
+    apply_start_request_number: bool = False
+    incremental: bool = False
+
+    def get_start_page_number(self):
+        return self.start_page_number if self.split_pages else 0
+
+    def get_page_template(self):
+        page_template = self.page_template.strip()
+        return 'page' if page_template == '' else page_template
+
+
+@dataclass
+class ConversionResult:
+    """
+    Result of `convert_to_markdown()`.
+
+    Attributes:
+        md_text: Final Markdown text ready to be split into requests.
+        ui_type: Detected source ('ChatGPT', 'DeepSeek' or '').
+        test_list: Intermediate artifacts for test mode: {name: (extension, content)}.
+        backend_timings: Seconds spent by every Markdown backend that was run: {backend: seconds}.
+        pass_timings: `fixups.PassTiming` of every fix-up pass in the order they were applied.
+    """
+    md_text: str
+    ui_type: str
+    test_list: dict = field(default_factory=dict)
+    backend_timings: dict = field(default_factory=dict)
+    pass_timings: list = field(default_factory=list)
+
+
+# Imported on first use (see `warm_up()`)
+LAZY_MODULES = ('bs4', 'html2text', 'markdownify', 'chardet.universaldetector', 'email.parser', 'email.policy')
+
+
+def html2text_backend(html):
+    import html2text
+    return html2text.html2text(html)
+
+
+def markdownify_backend(html):
+    from markdownify import markdownify
+    return markdownify(html)
+
+
+# HTML → Markdown converter backends: {name: function(html) -> markdown}
+MARKDOWN_BACKENDS = {
+    'html2text': html2text_backend,
+    'markdownify': markdownify_backend,
+}
+
+# Backend used for every source type unless overridden by `<type>_backend` in [Settings]
+DEFAULT_BACKENDS = {
+    'ChatGPT': 'html2text',
+    'DeepSeek': 'markdownify',
+}
+
+
+def warm_up():
+    """
+    Imports the conversion libraries ahead of the first conversion (e.g. on a background thread
+    while the GUI waits for the user to pick a file).
+    """
+    for module in LAZY_MODULES:
+        importlib.import_module(module)
+    html_entities()
+
+
+def detect_ui_type(html_content):
+    """
+    Returns the source type of a chat page: 'DeepSeek', 'ChatGPT' or '' if unknown.
+    """
+    if "DeepSeek" in html_content:
+        return 'DeepSeek'
+    if "ChatGPT" in html_content:
+        return 'ChatGPT'
+    return ''
+
+
+def use_turn_pipeline(config, ui_type):
+    """
+    Tells whether the chat is converted turn by turn (see `convert_turns()`): ChatGPT pages converted
+    with html2text, unless [Settings] `turn_pipeline = no`.
+    """
+    return (ui_type == 'ChatGPT' and config.getboolean("Settings", "turn_pipeline", fallback=True)
+            and MARKDOWN_BACKENDS.get(get_backend_name(config, ui_type)) is html2text_backend)
+
+
+def register_backend(name, convert):
+    """
+    Adds an HTML → Markdown backend that can then be selected in config.ini
+    (e.g. `chatgpt_backend = <name>`).
+
+    Args:
+        name (str): Backend name.
+        convert (callable): Function `convert(html) -> markdown`.
+    """
+    MARKDOWN_BACKENDS[name] = convert
+
+
+def get_backend_name(config, ui_type):
+    """
+    Returns the backend configured for the source type (`chatgpt_backend` / `deepseek_backend`).
+
+    Raises:
+        ValueError: If the configured backend is not registered.
+    """
+    name = config.get("Settings", f"{ui_type.lower()}_backend", fallback=DEFAULT_BACKENDS[ui_type]).strip()
+    if name not in MARKDOWN_BACKENDS:
+        raise ValueError(f"Неизвестный конвертер '{name}' для {ui_type}. Доступны: {', '.join(MARKDOWN_BACKENDS)}")
+    return name
+
+
+def run_backends(html_content, config, ui_type, diagnostics=False):
+    """
+    Converts HTML to Markdown with the backend configured for the source type.
+
+    With diagnostics every other registered backend is run too, so their results and timings
+    can be compared.
+
+    Args:
+        html_content (str): Prepared HTML.
+        config (Settings): Loaded config.ini (see `settings.load_config()`).
+        ui_type (str): Source type ('ChatGPT' or 'DeepSeek').
+        diagnostics (bool): Also run the alternate backends.
+
+    Returns:
+        Tuple[str, dict, dict]: Markdown of the configured backend, {backend: markdown} of all
+            backends that were run and {backend: seconds}.
+    """
+    selected = get_backend_name(config, ui_type)
+    names = [selected] + [name for name in MARKDOWN_BACKENDS if name != selected] if diagnostics else [selected]
+
+    results = {}
+    timings = {}
+    for name in names:
+        started = time.perf_counter()
+        results[name] = MARKDOWN_BACKENDS[name](html_content)
+        timings[name] = time.perf_counter() - started
+
+    return results[selected], results, timings
+
+
+def read_mhtml(file_path, progress=None, detect_max_bytes=DEFAULT_DETECT_MAX_BYTES):
+    """
+    Opens and parses an MHTML (.mhtml/.mht) file, extracts the HTML content
+    and detects its encoding.
+
+    Locates the HTML part by scanning MIME boundaries (see `mhtml.locate_html_part()`),
+    falls back to full MIME parsing for unusual files, then resolves the encoding
+    (see `charsets.decode_payload()`; the decision is noted in the perf report).
+
+    Args:
+        file_path (str): Path to the MHTML file.
+        progress (callable): Optional `progress(stage, done, total)` callback.
+        detect_max_bytes (int): Bytes of the HTML part the encoding detector may read.
+
+    Returns:
+        str: The decoded HTML content.
+
+    Raises:
+        ValueError: If no HTML part is found in the MHTML file.
+        ConversionCancelled: If the `progress` callback cancelled the reading.
+    """
+    with stage('read_mhtml', os.path.getsize(file_path)) as read_record:
+        report_progress(progress, STAGE_MIME_PARSE)
+
+        with stage(STAGE_MIME_PARSE) as record:
+            # Fast path: scan MIME boundaries and decode only the first text/html part
+            located = locate_html_part(file_path)
+            if located is not None:
+                report_progress(progress, STAGE_DECODE)
+                raw_bytes, charset = located
+            else:
+                # Fallback for unusual files: full MIME parsing
+                raw_bytes, charset = parse_html_part(file_path, progress)
+            record.output_size = len(raw_bytes or b'')
+
+        html_content = None
+        with stage(STAGE_DECODE, len(raw_bytes or b'')) as record:
+            if raw_bytes is not None:
+                html_content, decision = decode_payload(raw_bytes, charset, detect_max_bytes)
+                record.note = str(decision)
+            record.output_size = read_record.output_size = len(html_content or '')
+
+    # If no HTML part was found in the MHTML
+    if not html_content:
+        raise ValueError("HTML content not found in .mhtml file.")
+
+    return html_content
+
+
+def parse_html_part(file_path, progress=None):
+    """
+    Extracts the first `text/html` part of an MHTML file with the full email parser.
+
+    Slower than `mhtml.locate_html_part()` but handles any MIME structure.
+
+    Args:
+        file_path (str): Path to the MHTML file.
+        progress (callable): Optional `progress(stage, done, total)` callback.
+
+    Returns:
+        Tuple[bytes | None, str | None]: Raw HTML bytes and the charset of the part.
+    """
+    from email import policy
+    from email.parser import BytesParser
+
+    # Read and parse the MHTML file using email-style parser
+    with open(file_path, 'rb') as f:
+        msg = BytesParser(policy=policy.default).parse(f)
+
+    # If the MHTML is multipart, iterate over parts; otherwise treat as single part
+    if msg.is_multipart():
+        parts = msg.iter_parts()
+    else:
+        parts = [msg]
+
+    # Iterate through each part of the MHTML
+    for part in parts:
+        if part.get_content_type() == "text/html":
+            report_progress(progress, STAGE_DECODE)
+
+            # Get raw HTML payload (not yet decoded)
+            raw = part.get_payload(decode=False)
+            transfer_encoding = (part.get('Content-Transfer-Encoding') or '').lower()
+
+            # Decode quoted-printable content if specified
+            if transfer_encoding == 'quoted-printable':
+                raw_bytes = quopri.decodestring(raw)
+            else:
+                # decode=True automatically decodes common encodings like base64
+                raw_bytes = part.get_payload(decode=True)
+
+            return raw_bytes, part.get_content_charset()  # Stop after finding the first HTML part
+
+    return None, None
+
+
+def convert_to_markdown(html_content: str, config, test_mode="", progress=None, diagnostics=None):
+    """
+    Converts raw HTML content into cleaned and formatted Markdown text.
+
+    Applies multiple regex-based fixes and formatting improvements to enhance Markdown compatibility,
+    including code block detection, request formatting, table restoration, and tag-based replacements.
+
+    Args:
+        html_content (str): The HTML content to be converted.
+        config (Settings): Loaded config.ini (see `settings.load_config()`).
+        test_mode (str): Non-empty value enables saving of intermediate artifacts.
+        progress (callable): Optional `progress(stage, done, total)` callback.
+        diagnostics (bool): Run the alternate Markdown backends and keep intermediate artifacts
+            (defaults to `test_mode`).
+
+    Returns:
+        ConversionResult: Markdown text, detected source type, test artifacts and backend timings.
+
+    Raises:
+        ConversionCancelled: If the `progress` callback cancelled the conversion.
+    """
+    if diagnostics is None:
+        diagnostics = bool(test_mode)
+
+    with stage('convert_to_markdown', len(html_content)) as record:
+        if not diagnostics and not test_mode and use_turn_pipeline(config, detect_ui_type(html_content)):
+            result = convert_turns(html_content, config, progress)
+        else:
+            result = render_markdown(html_content, config, test_mode, progress, diagnostics)
+            result = fix_markdown(result, config, progress, diagnostics)
+        record.output_size = len(result.md_text)
+    return result
+
+
+def convert_turns(html_content: str, config, progress=None):
+    """
+    `convert_to_markdown()` of a ChatGPT page, turn by turn: every turn is rendered
+    (see `iter_turn_markdown()`) and fixed up (see `fixups.run_passes_by_turn()`) before the next one,
+    so neither the whole raw Markdown nor the intermediate texts of the passes are ever held.
+
+    Returns:
+        ConversionResult: Markdown text, source type, html2text and pass timings.
+    """
+    print("ChatGPT")
+
+    request_md_tag = config.get("Settings", "request_md_tag", fallback=".")
+    backend_timings = {}
+    pass_timings = []
+    with stage('convert turns', len(html_content)) as record:
+        turns = iter_turn_markdown(html_content, progress, record, backend_timings, config.convert_jobs)
+        fixed = run_passes_by_turn(iter_turn_segments(turns), get_passes('ChatGPT'),
+                                   FixContext(request_md_tag, config), pass_timings)
+        md_text = ''.join(fixed)
+        record.output_size = len(md_text)
+    return ConversionResult(md_text, 'ChatGPT', backend_timings=backend_timings, pass_timings=pass_timings)
+
+
+def render_markdown(html_content: str, config, test_mode="", progress=None, diagnostics=False):
+    """
+    First half of `convert_to_markdown()`: detects the source type, prepares the HTML
+    and converts it with the configured backend.
+
+    Returns:
+        ConversionResult: Raw (not yet fixed) Markdown, source type, test artifacts and backend timings.
+    """
+    markdown_text = ""
+    test_list = {}
+    backend_timings = {}
+
+    ########### Define the source type and converting ###########
+
+    ui_type = detect_ui_type(html_content)
+    if ui_type == 'DeepSeek':
+        print("DeepSeek")
+
+        html_content = re.sub(r"""(class="ds-segmented-button ds-segmented-button--selected">)Code""", r'\1mermaid', html_content, flags=re.MULTILINE)
+        html_content = fix_deepseek_html(html_content)
+    elif ui_type == 'ChatGPT' and not diagnostics and not test_mode and use_turn_pipeline(config, ui_type):
+        print("ChatGPT")
+
+        with stage(STAGE_HTML2TEXT, len(html_content)) as record:
+            markdown_text = ''.join(iter_turn_markdown(html_content, progress, record, backend_timings,
+                                                       config.convert_jobs))
+            record.output_size = len(markdown_text)
+        return ConversionResult(markdown_text, ui_type, backend_timings=backend_timings)
+    elif ui_type == 'ChatGPT':
+        print("ChatGPT")
+
+        report_progress(progress, STAGE_CANVAS_FIX)
+        with stage(STAGE_CANVAS_FIX, len(html_content)) as record:
+            html_content = fix_chatgpt_html(html_content)
+            html_content = canvas_fix(html_content)
+            record.output_size = len(html_content)
+
+    # TODO: Add more types
+
+    if ui_type:
+        report_progress(progress, STAGE_HTML2TEXT)
+        with stage(STAGE_HTML2TEXT, len(html_content)) as record:
+            markdown_text, backend_results, backend_timings = run_backends(html_content, config, ui_type,
+                                                                           diagnostics)
+            record.output_size = len(markdown_text)
+        if diagnostics:
+            for name, backend_markdown in backend_results.items():
+                test_list[name] = ('md', backend_markdown)
+            test_list['backend_timings'] = ('txt', '\n'.join(
+                f'{name}: {seconds:.3f} s' for name, seconds in backend_timings.items()))
+
+    if bool(test_mode):
+        print(f'test_mode: {test_mode}')
+        save_text_file(html_content, 'test.html')
+
+    if diagnostics:
+        test_list['html'] = ('html', html_content)
+
+    return ConversionResult(markdown_text, ui_type, test_list, backend_timings)
+
+
+def fix_markdown(result: ConversionResult, config, progress=None, diagnostics=False):
+    """
+    Second half of `convert_to_markdown()`: applies the fix-up passes of the source type
+    to the raw Markdown in `result`.
+
+    Returns:
+        ConversionResult: The same result with the final Markdown and pass timings.
+    """
+    request_md_tag = config.get("Settings", "request_md_tag", fallback=".")
+
+    ########### Start of fix block ###########
+
+    report_progress(progress, STAGE_REGEX_FIXES)
+
+    # Precompiled passes for the source type, timed one by one
+    passes = get_passes(result.ui_type)
+    context = FixContext(request_md_tag, config)
+    pass_timings = []
+    with stage(STAGE_REGEX_FIXES, len(result.md_text)) as record:
+        if not diagnostics and use_turn_pipeline(config, result.ui_type):
+            # Turn by turn, as `convert_turns()` fixes them
+            fixed = run_passes_by_turn(iter_turn_segments([result.md_text]), passes, context, pass_timings)
+            result.md_text = ''.join(fixed)
+        else:
+            result.md_text = run_passes(result.md_text, passes, context, pass_timings)
+        record.output_size = len(result.md_text)
+    result.pass_timings = pass_timings
+    if diagnostics:
+        result.test_list['pass_timings'] = ('txt', format_timings(pass_timings))
+
+    ########### End of fix block ###########
+
+    return result
+
+
+def convert_mhtml(file_path, config, test_mode="", progress=None, diagnostics=None, cache=None):
+    """
+    Reads an MHTML file and converts it to Markdown (`read_mhtml()` + `convert_to_markdown()`),
+    reusing cached stages.
+
+    Stage keys: decoded HTML — file content, `PIPELINE_VERSION` and the detector budget; raw Markdown — plus the backends
+    and `turn_pipeline`;
+    final Markdown — plus `request_md_tag` and [Hard_replacements]. So after changing e.g.
+    `request_md_tag` only the fix-up passes run again. Diagnostics bypass the cache.
+
+    Args:
+        file_path (str): Path to the MHTML file.
+        config (Settings): Loaded config.ini (see `settings.load_config()`).
+        test_mode (str): Non-empty value enables saving of intermediate artifacts.
+        progress (callable): Optional `progress(stage, done, total)` callback.
+        diagnostics (bool): See `convert_to_markdown()`.
+        cache (ConversionCache): Stage cache, None disables caching.
+
+    Returns:
+        ConversionResult: Markdown text, detected source type, test artifacts and timings.
+    """
+    if diagnostics is None:
+        diagnostics = bool(test_mode)
+
+    detect_max_bytes = config.detect_max_bytes
+    if cache is None or diagnostics:
+        return convert_to_markdown(read_mhtml(file_path, progress, detect_max_bytes), config, test_mode, progress,
+                                   diagnostics)
+
+    html_key = cache.make_key(cache.file_key(file_path, PIPELINE_VERSION), detect_max_bytes)
+    markdown_key = cache.make_key(html_key, *(get_backend_name(config, ui_type) for ui_type in DEFAULT_BACKENDS),
+                                  config.getboolean("Settings", "turn_pipeline", fallback=True))
+    final_key = cache.make_key(markdown_key, config.get("Settings", "request_md_tag", fallback="."),
+                               config.get("Hard_replacements", "replacements", fallback=""))
+
+    # Cached artifacts are stored as "<ui_type>\n<text>"
+    with stage('cache lookup') as record:
+        cached = cache.get(final_key, 'final.md')
+        record.output_size = len(cached or '')
+    if cached is not None:
+        ui_type, _, md_text = cached.partition('\n')
+        return ConversionResult(md_text, ui_type)
+
+    cached = cache.get(markdown_key, 'raw.md')
+    if cached is not None:
+        ui_type, _, md_text = cached.partition('\n')
+        result = ConversionResult(md_text, ui_type)
+    else:
+        html_content = cache.get(html_key, 'html')
+        if html_content is None:
+            html_content = read_mhtml(file_path, progress, detect_max_bytes)
+            cache.put(html_key, 'html', html_content)
+
+        result = render_markdown(html_content, config, test_mode, progress)
+        cache.put(markdown_key, 'raw.md', f'{result.ui_type}\n{result.md_text}')
+
+    result = fix_markdown(result, config, progress)
+    cache.put(final_key, 'final.md', f'{result.ui_type}\n{result.md_text}')
+    return result
+
+
+def cache_location(config):
+    """
+    Reads [Settings] `cache_dir` / `cache_max_mb`.
+
+    Returns:
+        Tuple[str, int] | None: Cache directory and size limit in bytes, None if `cache_dir` is empty.
+    """
+    cache_dir = config.get("Settings", "cache_dir", fallback=DEFAULT_CACHE_DIR).strip()
+    if not cache_dir:
+        return None
+    return cache_dir, config.cache_max_bytes
+
+
+def open_cache(config):
+    """
+    Creates the conversion cache from [Settings] `cache_dir` / `cache_max_mb`.
+
+    Returns:
+        ConversionCache | None: None if `cache_dir` is empty.
+    """
+    location = cache_location(config)
+    return ConversionCache(*location) if location is not None else None
+
+
+def fix_deepseek_html(html_text):
+    """
+    Applies regex-based fixes to the Markdown text for DeepSeek.
+    Defines the request block and marks like in ChatGPT.
+
+    Args:
+        html_text (str): Input Markdown text.
+
+    Returns:
+        str: Cleaned and modified text.
+
+    """
+    def replacer(match):
+        fix_str = match.group(1)
+        fix_str = fix_str.replace('&lt;', r'\&lt;')
+        return f"""##### Вы сказали:\n{fix_str}\n\n\n###### ChatGPT сказал:{match.group(2)}"""
+
+    pattern = r'([^>]+?)(</div>(?:<div class="[^"]+">){2}<div class="ds-flex [^"]+" style="align-items: flex-end; gap: 0px;")'
+
+    return re.sub(pattern, replacer, html_text, flags=re.MULTILINE)
+
+
+def fix_chatgpt_html(html_text):
+    """
+    Applies regex-based fixes to the Markdown text for ChatGPT canvas.
+
+    Args:
+        html_text (str): Input Markdown text.
+
+    Returns:
+        str: Cleaned and modified text.
+
+    """
+    def replacer(match):
+        fix_str = match.group(2)
+        fix_str = re.sub(r'</?span[^>]*>', '', fix_str)
+        return f"""{match.group(1)}{fix_str}{match.group(3)}"""
+
+    pattern = r'(<div class="cm-line">)(.+?)(</div>)(?=<div class=)'
+
+    return re.sub(pattern, replacer, html_text, flags=re.MULTILINE | re.DOTALL)
+
+
+CANVAS_MAIN_CLASS = "relative flex min-h-0 flex-auto grow flex-col"
+CANVAS_MAIN_OPEN_PATTERN = re.compile(r'<main\b[^>]*>', re.IGNORECASE)
+MAIN_TAG_PATTERN = re.compile(r'<(/?)main\b[^>]*>', re.IGNORECASE)
+
+
+# Text between tags: character references are decoded there the way BeautifulSoup (html.parser) does
+HTML_TAG_OR_CHARREF_PATTERN = re.compile(
+    r'<[a-zA-Z/!?](?:"[^"]*"|\'[^\']*\'|[^\'">])*>'
+    r'|&(?:#([0-9]+)|#[xX]([0-9a-fA-F]+)|([a-zA-Z][-.a-zA-Z0-9]*));?'
+)
+ESCAPED_CHARACTERS = {'&': '&amp;', '<': '&lt;', '>': '&gt;'}
+
+
+@lru_cache(maxsize=None)
+def html_entities():
+    """
+    Returns the {entity name: character} table BeautifulSoup decodes with.
+    """
+    from bs4.dammit import EntitySubstitution
+    return EntitySubstitution.HTML_ENTITY_TO_CHARACTER
+
+
+def _decode_charref(match):
+    decimal, hexadecimal, name = match.groups()
+    if name is not None:
+        character = html_entities().get(name)
+        if character is None:
+            return '&amp;' + name  # unknown entity: the literal text, without the ';'
+    elif decimal is None and hexadecimal is None:
+        return match.group(0)  # a tag
+    else:
+        number = int(decimal) if decimal is not None else int(hexadecimal, 16)
+        character = None
+        if number < 256:
+            # Numeric references below 256 are taken as windows-1252 (e.g. &#150; is '–')
+            try:
+                character = bytes([number]).decode('windows-1252')
+            except UnicodeDecodeError:
+                pass
+        if not character:
+            try:
+                character = chr(number)
+            except (ValueError, OverflowError):
+                character = '\N{REPLACEMENT CHARACTER}'
+    return ''.join(ESCAPED_CHARACTERS.get(ch, ch) for ch in character)
+
+
+def decode_charrefs(html_text):
+    """
+    Decodes character references in the text of an HTML fragment (tags are left as they are),
+    keeping only `&amp;`, `&lt;` and `&gt;` escaped.
+
+    This is what a BeautifulSoup round trip (`str(BeautifulSoup(html, "html.parser"))`) does to the
+    text, and html2text renders decoded characters (e.g. `&nbsp;`, `&mdash;`) differently from
+    references, so the parts of the document `canvas_fix()` does not parse go through it.
+
+    Args:
+        html_text (str): HTML.
+
+    Returns:
+        str: HTML with the text references decoded.
+    """
+    if '&' not in html_text:
+        return html_text
+    return HTML_TAG_OR_CHARREF_PATTERN.sub(_decode_charref, html_text)
+
+
+def find_canvas_mains(text):
+    """
+    Finds the source ranges of the top-level canvas `<main>` elements without parsing the document.
+
+    Args:
+        text (str): ChatGPT HTML.
+
+    Returns:
+        List[Tuple[int, int]]: (start, end) of every canvas `<main>...</main>` (nested ones are inside).
+    """
+    ranges = []
+    position = 0
+    while True:
+        match = CANVAS_MAIN_OPEN_PATTERN.search(text, position)
+        if match is None:
+            return ranges
+        if CANVAS_MAIN_CLASS not in match.group(0):
+            position = match.end()
+            continue
+
+        # Matching </main>, taking nested <main> tags into account; an unclosed one runs to the end
+        depth = 0
+        end = len(text)
+        for tag in MAIN_TAG_PATTERN.finditer(text, match.start()):
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                end = tag.end()
+                break
+        ranges.append((match.start(), end))
+        position = end
+
+
+def canvas_to_markdown(canvas_html):
+    """
+    Converts the HTML of a canvas `<main>` into Markdown.
+    """
+    import html2text
+
+    # html2text keeps the output of every `handle()` call, so a converter serves one document only
+    markdown_converter = html2text.HTML2Text()
+    markdown_converter.ignore_links = False
+    markdown_converter.ignore_images = True
+    markdown_converter.body_width = 0
+    markdown_converter.protect_links = True
+    return markdown_converter.handle(canvas_html)
+
+
+def canvas_fix(text):
+    """
+    Replaces ChatGPT canvas panels (`<main>` with CodeMirror `cm-content` blocks) with their Markdown
+    wrapped in `<pre><code>`, so the code survives the HTML → Markdown conversion.
+
+    Only the canvas `<main>` elements are parsed; in the rest of the document only the character
+    references are decoded (see `decode_charrefs()`).
+
+    Args:
+        text (str): ChatGPT HTML.
+
+    Returns:
+        str: HTML with the canvas panels replaced.
+    """
+    if CANVAS_MAIN_CLASS not in text:
+        return decode_charrefs(text)
+
+    from bs4 import BeautifulSoup
+
+    parts = []
+    position = 0
+    for start, end in find_canvas_mains(text):
+        soup = BeautifulSoup(text[start:end], "html.parser")
+
+        # Поиск всех <main class="..."> (включая вложенные)
+        for tag in soup.find_all("main", class_=CANVAS_MAIN_CLASS):
+
+            for code_tag in tag.find_all("div", class_="cm-content"):
+                code_block = extract_canvas_code_block(code_tag)
+                code_tag.clear()
+                code_tag.append(code_block)
+
+            # Преобразуем HTML в Markdown
+            markdown_content = canvas_to_markdown(str(tag))
+
+            # Заворачиваем в <pre><code>...</code></pre>
+            markdown_replacement = f"<pre><code>{markdown_content}</code></pre>"
+
+            # Очищаем оригинальный <main> и вставляем Markdown-вставку
+            tag.clear()
+            tag.append(BeautifulSoup(markdown_replacement, "html.parser"))
+
+        parts.append(decode_charrefs(text[position:start]))
+        parts.append(str(soup))
+        position = end
+
+    parts.append(decode_charrefs(text[position:]))
+    return ''.join(parts)
+
+
+def extract_canvas_code_block(content_div):
+    """
+    Builds a fenced code block from a CodeMirror `cm-content` element.
+
+    Args:
+        content_div (bs4.Tag): `<div class="cm-content">` with one `<div class="cm-line">` per code line.
+
+    Returns:
+        bs4.Tag: `<pre><code>` element with the code between ``` fences.
+    """
+    from bs4 import BeautifulSoup
+
+    language = content_div.get("data-language")
+
+    # Извлечь строки кода из <div class="cm-line">
+    lines = [line_div.get_text() for line_div in content_div.find_all("div", class_="cm-line")]
+
+    # Собрать кодовый блок с тройными кавычками и языком
+    soup = BeautifulSoup("", "html.parser")
+    pre = soup.new_tag("pre")
+    code = soup.new_tag("code")
+    code.string = f'```{language}\n\n' + '\n'.join(lines) + '\n\n```'
+    pre.append(code)
+    return pre
+
+
+# Request heading of a ChatGPT page, the turns of the page start there
+CHATGPT_REQUEST_PATTERN = re.compile(r'<h5\b[^>]*>\s*Вы сказали:', re.IGNORECASE)
+
+# html2text keeps non-breaking spaces as this placeholder until the end of the document
+HTML2TEXT_NBSP_PLACEHOLDER = '&nbsp_place_holder;'
+
+
+def find_turn_starts(html_content):
+    """
+    Finds where the turns of a ChatGPT page start: at every request heading outside the canvas panels.
+
+    Args:
+        html_content (str): ChatGPT HTML.
+
+    Returns:
+        List[int]: 0 (the page head before the first turn) and the offset of every turn.
+    """
+    canvas_ranges = find_canvas_mains(html_content) if CANVAS_MAIN_CLASS in html_content else []
+    starts = [0]
+    for match in CHATGPT_REQUEST_PATTERN.finditer(html_content):
+        position = match.start()
+        while canvas_ranges and canvas_ranges[0][1] <= position:
+            canvas_ranges.pop(0)
+        if canvas_ranges and canvas_ranges[0][0] <= position:
+            continue  # a canvas `<main>` is converted as a whole by `canvas_fix()`
+        if position > starts[-1]:
+            starts.append(position)
+    return starts
+
+
+def new_html2text():
+    """
+    Returns an html2text converter set up as `html2text.html2text()` sets it up.
+    """
+    import html2text
+
+    converter = html2text.HTML2Text()
+    converter.start = True
+    return converter
+
+
+def iter_html2text(fragments, timings=None, converter=None):
+    """
+    Converts consecutive HTML fragments of one document with a single html2text converter,
+    yielding the Markdown turn by turn.
+
+    The output is taken from the converter after every fragment and cut before the last request
+    heading line. The wrapping (`optwrap()`) works line by line and a heading line does not depend on
+    the lines before it, so the pieces joined equal `html2text.html2text()` of the whole document.
+
+    Args:
+        fragments (Iterable[str]): HTML fragments in document order.
+        timings (dict): Optional dict that receives the seconds spent in html2text under 'html2text'.
+        converter (html2text.HTML2Text): Converter to feed (default: a new one, see `new_html2text()`).
+
+    Yields:
+        str: Markdown pieces, every one but the first starting with a request heading.
+    """
+    converter = new_html2text() if converter is None else converter
+    nbsp = '\xa0' if converter.unicode_snob else ' '
+    seconds = 0.0
+
+    pending = ''
+    for fragment in fragments:
+        started = time.perf_counter()
+        converter.feed(fragment)
+        # html2text collects its output in `outtextlist` until `finish()`
+        pending += ''.join(converter.outtextlist)
+        converter.outtextlist = []
+        cut = pending.rfind('\n' + REQUEST_HEADING)
+        piece = None
+        if cut != -1:
+            piece = converter.optwrap(pending[:cut].replace(HTML2TEXT_NBSP_PLACEHOLDER, nbsp))
+            pending = pending[cut + 1:]
+        seconds += time.perf_counter() - started
+        if piece is not None:
+            yield piece
+
+    started = time.perf_counter()
+    converter.feed('')
+    pending += converter.finish()
+    piece = converter.optwrap(pending.replace(HTML2TEXT_NBSP_PLACEHOLDER, nbsp))
+    seconds += time.perf_counter() - started
+    if timings is not None:
+        timings['html2text'] = timings.get('html2text', 0.0) + seconds
+    yield piece
+
+
+def prepare_turn_html(fragment):
+    """
+    Prepares the HTML of one ChatGPT turn for html2text (`fix_chatgpt_html()` and `canvas_fix()`).
+    """
+    return canvas_fix(fix_chatgpt_html(fragment))
+
+
+def iter_turn_markdown(html_content, progress=None, record=None, timings=None, jobs=1):
+    """
+    Renders a ChatGPT page turn by turn: the fragment of every turn is prepared (see `prepare_turn_html()`)
+    and fed to one html2text converter (see `iter_html2text()`).
+
+    Only the current turn is copied, so the memory is bounded by the largest turn rather than the chat,
+    and the first turns are ready before the last ones are converted. Joined, the pieces equal the raw
+    Markdown `render_markdown()` makes of the whole page.
+
+    A large page is rendered by `jobs` processes (see `sharding`) with the same result.
+
+    Args:
+        html_content (str): ChatGPT HTML.
+        progress (callable): Optional `progress(stage, done, total)` callback, called before every turn.
+        record (StageRecord): Receives the number of turns and the size of the largest one in its note.
+        timings (dict): Optional dict that receives the html2text seconds (see `iter_html2text()`).
+        jobs (int): Worker processes for a large page (1 — render in this process).
+
+    Yields:
+        str: Raw Markdown pieces, cut before the request headings.
+    """
+    offsets = find_turn_starts(html_content) + [len(html_content)]
+    total = len(offsets) - 1
+    largest = max(end - start for start, end in zip(offsets, offsets[1:]))
+    note = f"turn by turn: {total - 1} turns, largest {largest} characters"
+
+    if jobs > 1:
+        from sharding import iter_sharded_markdown, plan_shards
+
+        shards = plan_shards(offsets, jobs)
+        if len(shards) > 1:
+            shard_note = yield from iter_sharded_markdown(html_content, offsets, shards, jobs, progress, timings)
+            if record is not None:
+                record.note = f"{note}, {shard_note}"
+            return
+
+    def fragments():
+        for number, (start, end) in enumerate(zip(offsets, offsets[1:])):
+            report_progress(progress, STAGE_HTML2TEXT, number, total)
+            yield prepare_turn_html(html_content[start:end])
+
+    yield from iter_html2text(fragments(), timings)
+    report_progress(progress, STAGE_HTML2TEXT, total, total)
+    if record is not None:
+        record.note = note
+
+
+class Turn:
+    """
+    One request/answer turn of the converted Markdown.
+
+    The text is not copied: a turn keeps offsets into the Markdown buffer it was found in, and its
+    header placeholder `REQUEST_NUMBER_HEADER` is replaced with the request number on access.
+
+    Attributes:
+        number (int): Request number.
+        buffer (str): Whole converted Markdown text.
+        start (int): Offset of the request header.
+        request_end (int): Offset where the request block ends (the next line starting with '#').
+        end (int): Offset of the next turn (or the end of the buffer).
+    """
+    __slots__ = ('number', 'buffer', 'start', 'request_end', 'end')
+
+    def __init__(self, number, buffer, start, request_end, end):
+        self.number = number
+        self.buffer = buffer
+        self.start = start
+        self.request_end = request_end
+        self.end = end
+
+    @property
+    def header(self):
+        return REQUEST_NUMBER_HEADER.replace('_', str(self.number))
+
+    @property
+    def request(self):
+        """Request block: numbered header and the request callout."""
+        return self.header + self.buffer[self.start + len(REQUEST_NUMBER_HEADER):self.request_end]
+
+    @property
+    def answer(self):
+        return self.buffer[self.request_end:self.end]
+
+    @property
+    def text(self):
+        """Whole turn: request block and answer."""
+        return self.header + self.buffer[self.start + len(REQUEST_NUMBER_HEADER):self.end]
+
+    def __repr__(self):
+        return f"Turn({self.number}, {self.start}:{self.end})"
+
+
+def count_turns(md_text):
+    """
+    Returns the number of turns `split_turns()` finds in the text.
+    """
+    return md_text.count(REQUEST_NUMBER_HEADER)
+
+
+def split_turns(md_text, rqn=1):
+    """
+    Splits the converted Markdown text into turns at the request headers
+    (the text before the first header is skipped).
+
+    Args:
+        md_text (str): Converted Markdown text.
+        rqn (int): Number of the first request.
+
+    Returns:
+        List[Turn]: Turns in the order of the chat.
+    """
+    starts = []
+    position = md_text.find(REQUEST_NUMBER_HEADER)
+    while position != -1:
+        starts.append(position)
+        position = md_text.find(REQUEST_NUMBER_HEADER, position + len(REQUEST_NUMBER_HEADER))
+    ends = starts[1:] + [len(md_text)]
+
+    turns = []
+    for idx, (start, end) in enumerate(zip(starts, ends)):
+        # The request block lasts until the next heading of the turn
+        request_end = md_text.find('\n#', start + len(REQUEST_NUMBER_HEADER), end)
+        turns.append(Turn(idx + rqn, md_text, start, end if request_end == -1 else request_end, end))
+
+    return turns
+
+
+# Request number span of a request header, see `link_request()`
+REQUEST_NUMBER_PATTERN = re.compile(r'(# <span style="color:gray">)\s*(\d+)\s*(</span>)')
+
+
+# Quote markers and the title line of the request callout (`> [!important] Запрос:`), not indexed for search
+CALLOUT_MARKUP_PATTERN = re.compile(r'^[ \t]*>[ \t]?(?:\[![^\]\n]*\][^\n]*)?', re.MULTILINE)
+# Request number header and footer lines (`# <span style="color:green"> + </span>`), not indexed either
+SPAN_HEADING_PATTERN = re.compile(r'^[ \t]*#+ <span style="color:(?:gray|green)">[^<\n]*</span>[ \t]*$', re.MULTILINE)
+
+
+def link_request(request, page_name, page_number):
+    """
+    Turns the request number of a request block into a wiki-link to its page
+    (e.g. `[[page 003# <span style="color:gray">7</span>|7]]`).
+
+    Args:
+        request (str): Request block (`Turn.request`).
+        page_name (str): Page file name template.
+        page_number (int): Number of the page the request is saved on.
+
+    Returns:
+        str: Request block with the link.
+    """
+    def replacer(match):
+        return f'[[{page_name} {page_number:03}{match.group(1)}{match.group(2)}{match.group(3)}|{match.group(2)}]]'
+
+    return REQUEST_NUMBER_PATTERN.sub(replacer, request)
+
+
+def merge_blocks(turns, options: ExportOptions):
+    """
+    Distributes the turns into pages according to user-defined page group ranges.
+
+    Args:
+        turns (List[Turn]): Turns of the chat.
+        options (ExportOptions): Export parameters.
+
+    Returns:
+        Tuple[List[List[Turn]], List[PageGroup]]:
+            - turns of every page
+            - associated request ID groups (parsed from `range_text`)
+
+    Raises:
+        ValueError: If the page groups are invalid or a requested index is out of the valid range
+            (checked before the pages are assembled).
+    """
+    # Parse the page groups based on the user's input in the range field
+    parsed_groups, _raw_groups = parse_page_groups(options.range_text, options.unique_sorted)
+
+    # Determine page grouping strategy
+    if not options.split_pages:
+        # If page splitting is disabled, treat all turns as one group
+        page_groups = [range(1, len(turns) + 1)]
+    elif not options.range_text.strip():
+        # If range input is empty, each turn goes on its own page
+        page_groups = [range(i, i + 1) for i in range(1, len(turns) + 1)]
+    else:
+        # Use user-defined page groups, checked before any page is assembled
+        validate_page_groups(parsed_groups, len(turns))
+        page_groups = parsed_groups
+
+    pages = [[turns[i - 1] for i in group] for group in page_groups]
+
+    # Return the pages and the associated page groups
+    return pages, parsed_groups
+
+
+def page_parts(head, turns):
+    """
+    Yields the text of a page part by part: `head`, then the turns separated by blank lines.
+    """
+    yield head
+    for number, turn in enumerate(turns):
+        if number:
+            yield "\n\n"
+        yield turn.text.strip()
+
+
+def save_blocks(pages, page_groups, base_path, file_path, options: ExportOptions, config,
+                test_list=None, test_mode="", progress=None, writer=None, index_rows=None):
+    """
+    Saves the turns of each page to separate files and writes an index file listing request headers.
+
+    Adds navigation links and tags to each file based on keywords and configuration settings.
+
+    Args:
+        pages (List[List[Turn]]): Turns of every page to be saved.
+        page_groups (List[List[int]]):
+            The request ID groups assigned to each output page.
+        base_path (str): Export directory.
+        file_path (str): Source MHTML file.
+        options (ExportOptions): Export parameters.
+        config (Settings): Loaded config.ini (see `settings.load_config()`).
+        test_list (dict): Intermediate artifacts saved in test mode.
+        test_mode (str): Non-empty value enables saving of `test_list`.
+        progress (callable): Optional `progress(stage, done, total)` callback, called before every page.
+        writer (PageWriter): Destination of the pages (default: plain writes into `base_path`).
+        index_rows (list | RowSpool): Receives (number, request, answer, tags, page file name) of every
+            turn for the search index.
+
+    Returns:
+        int: Number of saved pages.
+
+    Raises:
+        ConversionCancelled: If the `progress` callback cancelled the export (what happens to the pages
+            already written is up to `writer.close()`).
+    """
+
+    if writer is None:
+        writer = PageWriter(base_path)
+
+    # for test only!
+    if bool(test_mode):
+        print(f'test_mode: {test_mode}')
+        for k, v in (test_list or {}).items():
+            writer.write(f'__{k}.{v[0]}', v[1])
+
+    # Optional subfolder inside base_path (unused here)
+    folder_path = ''
+
+    # Extract base file name without extension
+    file_name = os.path.splitext(os.path.basename(file_path))[0]
+
+    # Starting page number from user-defined input or default
+    spn = options.get_start_page_number()
+
+    # Page name template; fallback to 'page' if empty
+    page_page_template = options.get_page_template()
+
+    # Number of tags per row when writing tag blocks
+    tag_string_len = config.tag_string_len
+
+    # Keyword automaton built once per config.ini (see `settings.Settings`)
+    tagger = config.keyword_tagger
+
+    request_ids = []
+
+    range_text = options.range_text.strip()
+
+    # Main request list file, streamed page by page along with the pages
+    with writer.open(f'{REQUEST_LIST_NAME}.md') as request_list:
+        # Write range_input comment if present
+        if range_text:
+            request_list.write(f'%%  Запросы:  {range_text}  %%')
+
+        request_list.write(f'\n### <span style="color:green">Source file:  </span>{file_name}\n')
+        request_list.write(file_path + '\n\n---')
+
+        # Iterate through each page to generate individual markdown files
+        for idx, turns in enumerate(pages):
+            report_progress(progress, STAGE_PAGE_WRITE, idx, len(pages))
+
+            # Handle request ID(s) depending on page grouping
+            if not page_groups and options.split_pages:
+                request_ids.append(turns[0].number)
+            else:
+                request_ids = [turn.number for turn in turns]
+
+            # Turn request ID list into a string like "(1, 2, 3)" or "(5)"
+            request_id_list_str = str(tuple(request_ids)).replace(',)', ')')
+
+            # Create output filename with padded index (e.g. "page 001.md")
+            filename = f"{page_page_template} {idx + spn:03}.md"
+
+            # Build navigation links (previous, index, next)
+            prev_link = f"[[{folder_path}{page_page_template} {idx - 1 + spn:03}|{page_page_template} {idx - 1 + spn:03}]]  <" + " " * 10 if idx > 0 else ""
+            header_link = f"[[{folder_path}{REQUEST_LIST_NAME}|{REQUEST_LIST_NAME}]]" + " " * 10
+            next_link = f">  [[{folder_path}{page_page_template} {idx + 1 + spn:03}|{page_page_template} {idx + 1 + spn:03}]]" if idx < len(
+                pages) - 1 else ""
+
+            # Show request ID range in a hidden block (Obsidian comment)
+            range_info = f"\n%%  Запросы:  {request_id_list_str}  %%\n" if options.range_text.replace('%', '').strip() else ""
+
+            # Combine navigation into a Markdown block
+            nav = f"\n---{range_info}\n{prev_link}{header_link}{next_link}\n\n---\n"
+
+            # Auto-tag based on keyword presence in content (scanned turn by turn)
+            tags = [f"#{tag}" for tag in tagger.tags_in(turn.text.strip() for turn in turns)]
+
+            # Format tags into blocks of `tag_string_len` words
+            tag_block = "\n".join(" ".join(tags[i:i + tag_string_len]) for i in range(0, len(tags), tag_string_len))
+
+            # Write the page turn by turn: navigation, tags and the request bodies
+            writer.write_parts(filename, page_parts(f"\n{nav}\n{tag_block}\n\n---\n", turns))
+
+            if index_rows is not None:
+                index_rows.extend((turn.number, CALLOUT_MARKUP_PATTERN.sub('', turn.request[len(turn.header):]).strip(),
+                                   SPAN_HEADING_PATTERN.sub('', turn.answer).strip(), " ".join(tags), filename)
+                                  for turn in turns)
+
+            # Append the request headers with links to this page to the request list,
+            # prefixed with the request IDs if grouped pages are used
+            request_list.write("\n\n")
+            if page_groups:
+                request_list.write('# ' + request_id_list_str + '\n')
+            for number, turn in enumerate(turns):
+                request_list.write(("\n\n" if number else "") +
+                                   link_request(turn.request.strip(), page_page_template, idx + spn))
+
+    report_progress(progress, STAGE_PAGE_WRITE, len(pages), len(pages))
+
+    return len(pages)
+
+
+def export_markdown(md_text, file_path, export_path, options: ExportOptions, config,
+                    test_list=None, test_mode="", base_path=None, progress=None, project_path=None):
+    """
+    Splits the converted Markdown into requests, groups them into pages and saves
+    everything into a new `exported_<timestamp>` directory
+    (or into the stable `exported_<source file name>` directory in incremental mode).
+
+    Images embedded in the MHTML are stored once by content hash in the `attachments_dir` folder of the
+    project folder and their links become Obsidian embeds (see `attachments`, disabled by an empty
+    [Settings] `attachments_dir`).
+
+    A new directory appears only when the export is complete (see `writers.ParallelPageWriter`).
+    Then its turns replace those of the same directory in the search index of the project folder
+    (see `searchindex.SearchIndex`, disabled by [Settings] `search_index = no`), unless the directory
+    holds the export of another source file.
+
+    Args:
+        md_text (str): Converted Markdown text.
+        file_path (str): Source MHTML file.
+        export_path (str): Parent directory for the export.
+        options (ExportOptions): Export parameters.
+        config (Settings): Loaded config.ini (see `settings.load_config()`).
+        test_list (dict): Intermediate artifacts saved in test mode.
+        test_mode (str): Non-empty value enables saving of `test_list`.
+        base_path (str): Explicit export directory instead of the default one (a new export gets
+            a `_2`, `_3`, … suffix if it exists).
+        progress (callable): Optional `progress(stage, done, total)` callback.
+        project_path (str): Obsidian project folder holding the search index and the attachments
+            (default: `export_path`).
+
+    Returns:
+        Tuple[str, int, PageWriter]: Export directory, number of pages and the writer with its statistics.
+
+    Raises:
+        ValueError: If the page groups are invalid.
+        ConversionCancelled: If the `progress` callback cancelled the export.
+        FileExistsError: If the new export directory was created by another export meanwhile
+            (nothing is merged into it).
+        ExportConflict: If the export directory is indexed with the turns of another source file.
+    """
+    # Determine the starting request number
+    rqn = options.start_page_number if options.apply_start_request_number else 1
+
+    if base_path is None:
+        if options.incremental:
+            # Stable folder per source file, so re-exports update it in place
+            file_name = os.path.splitext(os.path.basename(file_path))[0]
+            base_path = os.path.join(export_path, f"exported_{file_name}")
+        else:
+            # Get current timestamp and create base export directory
+            now = datetime.now().strftime("%Y%m%d%H%M%S")
+            base_path = os.path.join(export_path, f"exported_{now}")
+    if not options.incremental:
+        # A new export never goes into an existing folder: a second one within the same second gets `_2`
+        base_path = unique_export_path(base_path)
+
+    project_path = export_path if project_path is None else project_path
+    use_index = config.getboolean("Settings", "search_index", fallback=True)
+    if use_index and os.path.isfile(index_path(project_path)):
+        # The indexed turns of another chat exported into the same folder are never replaced silently
+        with SearchIndex(index_path(project_path)) as index:
+            index.claim_export(os.path.relpath(base_path, project_path), file_path, os.path.isdir(base_path))
+
+    attachments_dir = config.get("Settings", "attachments_dir", fallback=DEFAULT_ATTACHMENTS_DIR).strip()
+    if attachments_dir and os.path.isfile(file_path):
+        with stage('attachments', os.path.getsize(file_path)) as record:
+            store = AttachmentStore(os.path.join(project_path, attachments_dir))
+            names, record.output_size = extract_attachments(file_path, store)
+            md_text = embed_attachments(md_text, names)
+
+    with stage('split_turns', len(md_text)) as record:
+        turns = split_turns(md_text, rqn)
+        record.output_size = len(turns)
+
+    # Distribute the turns into pages
+    with stage('merge_blocks', len(turns)) as record:
+        pages, page_groups = merge_blocks(turns, options)
+        record.output_size = len(pages)
+
+    index_rows = RowSpool() if use_index else None
+    complete = False
+    try:
+        if options.incremental:
+            os.makedirs(base_path, exist_ok=True)
+            writer = IncrementalPageWriter(base_path)
+        else:
+            # Pages are written in parallel into a temporary folder renamed to base_path at the end
+            # (removed if the export is cancelled or fails)
+            writer = ParallelPageWriter(base_path)
+        try:
+            # Save all the resulting pages
+            with stage('save_blocks', len(md_text)) as record:
+                count = save_blocks(pages, page_groups, base_path, file_path, options, config, test_list, test_mode,
+                                    progress, writer, index_rows)
+                record.output_size = writer.bytes_written
+            complete = True
+        finally:
+            with stage('close writer'):
+                writer.close(complete)
+
+        if index_rows is not None:
+            with stage('search index', len(index_rows)), SearchIndex(index_path(project_path)) as index:
+                index.replace_export(os.path.relpath(base_path, project_path), file_path, index_rows)
+    finally:
+        if index_rows is not None:
+            index_rows.close()
+
+    return base_path, count, writer
+
+
+def save_text_file(text, file_path):
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write(text)
@@ -0,0 +1,408 @@
+"""
+Markdown fix-up passes applied after the HTML → Markdown conversion.
+
+Every pass is declared once in `CHATGPT_PASSES` / `DEEPSEEK_PASSES` / `COMMON_PASSES` with its regex
+compiled at import; `run_passes()` applies them in order and records time and sizes per pass.
+`run_passes_by_turn()` applies them to one turn at a time (see `iter_turn_segments()`).
+Patterns that backtracked on large chats are matched by the linear scanners of `linescan` instead.
+"""
+
+import re
+import time
+from collections import namedtuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from linescan import (iter_code_blocks, iter_marker_code_blocks, iter_marker_headings, iter_marker_spacing,
+                      iter_request_blocks, iter_table_blocks, substitute)
+
+
+REQUEST_NUMBER_HEADER = r'# <span style="color:gray">_</span>'
+REQUEST_FOOTER = '# <span style="color:green"> + </span>'
+
+# Marker pattern used in specific UI controls (e.g., "Copy", "Download"); the ChatGPT ones are found by `linescan`
+DEEPSEEK_MARK = r"(?:Copy.+?Download.+?```)"
+
+# Timing of one pass: name, seconds, input and output size in characters
+PassTiming = namedtuple('PassTiming', 'name seconds input_size output_size')
+
+
+@dataclass
+class FixContext:
+    """
+    Settings the passes depend on.
+
+    Attributes:
+        request_md_tag: Obsidian callout type for the request block.
+        config: Loaded config.ini.
+        remaining: Substitutions left to the passes with a `count` limit: {pass name: count}.
+    """
+    request_md_tag: str
+    config: object
+    remaining: dict = field(default_factory=dict)
+
+
+class FixPass:
+    """
+    One named fix-up step: a precompiled regex substitution, a scanner substitution or a function
+    `func(text, context)`.
+
+    Args:
+        name (str): Pass name used in the timings.
+        pattern (str): Regex pattern (compiled once here).
+        repl (str | callable): Replacement for `pattern`, or `repl(match)` for the matches of `scan`.
+        flags (int): Regex flags.
+        count (int): Maximum number of substitutions (0 — all).
+        func (callable): Function pass `func(text, context) -> text` instead of a regex.
+        scan (callable): Scanner `scan(text)` yielding the matches instead of `pattern` (see `linescan`).
+        leading (bool): The pass only changes the start of the text, so turn by turn it is applied
+            to the first turn only.
+    """
+
+    def __init__(self, name, pattern=None, repl=None, flags=0, count=0, func=None, leading=False, scan=None):
+        self.name = name
+        self.regex = re.compile(pattern, flags) if pattern is not None else None
+        self.repl = repl
+        self.count = count
+        self.func = func
+        self.leading = leading
+        self.scan = scan
+
+    def apply(self, text, context):
+        if self.func is not None:
+            return self.func(text, context)
+        if self.scan is not None:
+            return substitute(self.scan, self.repl, text)
+        if not self.count:
+            return self.regex.sub(self.repl, text)
+
+        # The limit holds for the whole chat, also when it is fixed turn by turn
+        remaining = context.remaining.get(self.name, self.count)
+        if remaining <= 0:
+            return text
+        text, replaced = self.regex.subn(self.repl, text, count=remaining)
+        context.remaining[self.name] = remaining - replaced
+        return text
+
+    def __repr__(self):
+        return f"FixPass({self.name!r})"
+
+
+def run_passes(text, passes, context, timings=None):
+    """
+    Applies the passes in order.
+
+    Args:
+        text (str): Markdown text.
+        passes (Iterable[FixPass]): Passes to apply.
+        context (FixContext): Settings the passes depend on.
+        timings (list): Optional list that receives a `PassTiming` per pass.
+
+    Returns:
+        str: Fixed text.
+    """
+    for fix_pass in passes:
+        if timings is None:
+            text = fix_pass.apply(text, context)
+            continue
+
+        input_size = len(text)
+        started = time.perf_counter()
+        text = fix_pass.apply(text, context)
+        timings.append(PassTiming(fix_pass.name, time.perf_counter() - started, input_size, len(text)))
+    return text
+
+
+# Heading html2text makes of a ChatGPT request (`<h5>Вы сказали:</h5>`), where every turn starts
+REQUEST_HEADING = '##### Вы сказали:'
+REQUEST_HEADING_PATTERN = re.compile(r'^##### Вы сказали:', re.MULTILINE)
+
+
+def iter_turn_segments(pieces):
+    """
+    Cuts Markdown into turns before every request heading line; the text before the first request
+    stays with the first turn.
+
+    Args:
+        pieces (Iterable[str]): Consecutive pieces of the Markdown (cut anywhere).
+
+    Yields:
+        str: The turns in order; joined they give the whole text.
+    """
+    pending = ''
+    heading = None  # offset of the request heading of the turn in `pending`
+    yielded = False
+    for piece in pieces:
+        pending += piece
+        start = 0
+        for match in REQUEST_HEADING_PATTERN.finditer(pending, 0 if heading is None else heading + 1):
+            if heading is not None:
+                yield pending[start:match.start()]
+                yielded = True
+                start = match.start()
+            heading = match.start()
+        pending = pending[start:]
+        if heading is not None:
+            heading -= start
+    if pending or not yielded:
+        yield pending
+
+
+def run_passes_by_turn(segments, passes, context, timings=None):
+    """
+    Applies the passes turn by turn (see `iter_turn_segments()`), so no intermediate copy of the
+    whole text is made. Passes marked `leading` run on the first turn only.
+
+    Args:
+        segments (Iterable[str]): Turns of the Markdown text.
+        passes (Iterable[FixPass]): Passes to apply.
+        context (FixContext): Settings the passes depend on.
+        timings (list): Optional list that receives a `PassTiming` per pass (summed over the turns)
+            once the segments are exhausted.
+
+    Yields:
+        str: Fixed turns.
+    """
+    passes = tuple(passes)
+    later_passes = tuple(fix_pass for fix_pass in passes if not fix_pass.leading)
+    totals = {fix_pass.name: [0.0, 0, 0] for fix_pass in passes} if timings is not None else None
+
+    for number, segment in enumerate(segments):
+        segment_timings = [] if totals is not None else None
+        yield run_passes(segment, passes if number == 0 else later_passes, context, segment_timings)
+        for timing in segment_timings or ():
+            total = totals[timing.name]
+            total[0] += timing.seconds
+            total[1] += timing.input_size
+            total[2] += timing.output_size
+
+    if timings is not None:
+        timings.extend(PassTiming(name, *total) for name, total in totals.items())
+
+
+def format_timings(timings):
+    """
+    Formats pass timings as a text table, slowest passes first.
+    """
+    rows = sorted(timings, key=lambda timing: timing.seconds, reverse=True)
+    return '\n'.join(f'{timing.name:<32} {timing.seconds:9.4f} s  {timing.input_size:>12} → {timing.output_size:<12}'
+                     for timing in rows)
+
+
+def request_format(text: str, request_md_tag: str) -> str:
+    """
+    Formats question-and-answer blocks from raw Markdown into a structured request block.
+
+    Specifically targets phrases like "Вы сказали" / "ChatGPT сказал" and replaces them
+    with a formatted quote block and request header (see `linescan.iter_request_blocks()`).
+
+    Args:
+        text (str): The Markdown text to format.
+        request_md_tag (str): Obsidian callout type for the request block.
+
+    Returns:
+        str: The formatted text.
+    """
+    return substitute(
+        iter_request_blocks,
+        lambda match: f"""{REQUEST_NUMBER_HEADER}
+> [!{request_md_tag}] Запрос:
+    > {match.group(1)}
+{REQUEST_FOOTER}
+""",
+        text
+    )
+
+
+TABLE_ROW_START_PATTERN = re.compile(r'^\|', re.MULTILINE)
+
+
+def table_restore(text):
+    """
+    Fixes Markdown tables that have been broken into separate lines by line breaks.
+
+    Joins wrapped table lines back together to ensure they render as a valid table
+    (the tables are found by `linescan.iter_table_blocks()`).
+
+    Args:
+        text (str): The Markdown text containing broken tables.
+
+    Returns:
+        str: The restored table text.
+    """
+
+    def process_table_block(match):
+        start = match.group(1)  # Table separator line (e.g., ---|---|)
+        body = match.group(3)  # Actual table body (potentially broken)
+        end = match.group(4)  # End of table block marker
+
+        lines = body.splitlines()
+        processed_lines = []
+        buffer_line = ""
+
+        for line in lines:
+            # Merge lines without proper Markdown table line endings
+            if not line.endswith("  "):
+                buffer_line += line + " "
+            else:
+                buffer_line += line
+                if buffer_line:
+                    processed_lines.append(buffer_line)
+                buffer_line = ""
+
+        return start + "\n" + "\n".join(processed_lines) + "\n" + end
+
+    text = substitute(iter_table_blocks, process_table_block, text)
+
+    # Fix broken table start rows
+    text = TABLE_ROW_START_PATTERN.sub('-|', text)
+
+    return text
+
+
+def compile_replacements(raw_value):
+    """
+    Parses and compiles the [Hard_replacements] rules (once per config.ini, see `settings.Settings`).
+
+    Args:
+        raw_value (str): Raw `replacements` value from config.ini.
+
+    Returns:
+        Tuple[Tuple[re.Pattern | str, str], ...]: (compiled regex or literal, replacement) per rule.
+    """
+    rules = []
+    replacements = [line.strip() for line in raw_value.strip().splitlines() if line.strip()]
+    for replacement in replacements:
+        r = replacement.split(':')
+        if r[0][0] == 'r':
+            rules.append((re.compile(fr'{r[0][1:]}', re.MULTILINE), fr'{r[1]}'))
+        else:
+            rules.append((r[0], r[1]))
+    return tuple(rules)
+
+
+def fix_text_replace(text, config):
+    """
+    Applies hard-coded string replacements defined in the configuration.
+
+    Replacements are defined in the format 'original:replacement' per line
+    under the config section 'Hard_replacements'. Consecutive literal rules are applied
+    in one pass where the result is the same (see `multireplace.Replacer`).
+
+    Args:
+        text (str): Input Markdown text.
+        config (Settings): Loaded config.ini with the compiled rules.
+
+    Returns:
+        str: Text after replacements.
+    """
+    return config.replacements.apply(text)
+
+
+@lru_cache(maxsize=8)
+def _leading_content_pattern(request_md_tag):
+    return re.compile(fr'^.*?(?=>\s*\[!{request_md_tag}]\s*Запрос:)', re.DOTALL)
+
+
+def fix_text_regexp(text, request_md_tag):
+    """
+    Applies regex-based fixes to the Markdown text.
+
+    This includes trimming leading content before request blocks and
+    replacing table pipe starts with dashes for alignment.
+
+    Args:
+        text (str): Input Markdown text.
+        request_md_tag (str): Obsidian callout type for the request block.
+
+    Returns:
+        str: Cleaned and modified text.
+    """
+    # Remove content before the first request block
+    text = REQUEST_NUMBER_HEADER + _leading_content_pattern(request_md_tag).sub('\n', text)
+    return text
+
+
+def fix_code_blocks(text):
+    """
+    Normalizes indentation inside fenced code blocks (see `linescan.iter_code_blocks()`)
+    to avoid rendering issues.
+
+    Args:
+        text (str): Markdown text containing code blocks.
+
+    Returns:
+        str: Text with fixed code block indentation.
+    """
+
+    def replacer(match):
+        code = match.group(2)
+        count = 4
+        # Remove up to 4 spaces of indentation
+        code = '\n'.join(
+            line[count:] if line.startswith(' ' * count) else line
+            for line in code.splitlines()
+        )
+        if code.startswith('\n'):
+            code = code[1:]
+        return f'```{match.group(1)}{code}\n```'
+
+    return substitute(iter_code_blocks, replacer, text)
+
+
+FOOTER_PATTERN = re.compile(r"New chat\n\nDeepThink.+?\.\.\.", re.DOTALL | re.MULTILINE)
+
+
+def remove_footer(text):
+    return FOOTER_PATTERN.sub('', text)
+
+
+CHATGPT_PASSES = (
+    # Fix spacing issues around blocks with UI elements
+    FixPass('chatgpt: marker spacing', repl=lambda m: f"{m.group(1)}text\n{m.group(2)}", scan=iter_marker_spacing),
+    # Merge headings with UI controls following them
+    FixPass('chatgpt: marker headings', repl=lambda m: f"\n{m.group(1)}", scan=iter_marker_headings),
+    # Convert marked blocks into fenced code blocks
+    FixPass('chatgpt: marker code blocks', repl=lambda m: f"\n```{m.group(1)}{m.group(2)}```\n",
+            scan=iter_marker_code_blocks),
+    # Restore tables broken by markdown conversion
+    FixPass('table_restore', func=lambda text, context: table_restore(text)),
+    # Fix indentation inside code blocks
+    FixPass('fix_code_blocks', func=lambda text, context: fix_code_blocks(text)),
+    # Fix canvas code blocks (historically applied to the first 24 fences only: flags were passed as count)
+    FixPass('canvas: fence indent', r' +(```\w+)', r'\1', count=re.MULTILINE | re.DOTALL),
+    FixPass('canvas: line numbers', r'(?:^\s*\d+\s*$\n?){2,}', r'   \n', re.MULTILINE),
+)
+
+DEEPSEEK_PASSES = (
+    FixPass('deepseek: marker code blocks', r'^\s*(\w+)$\s*$\s*' + DEEPSEEK_MARK,
+            lambda m: f"\n```{m.group(1)}\n\n", re.MULTILINE | re.DOTALL | re.VERBOSE),
+    FixPass('remove_footer', func=lambda text, context: remove_footer(text)),
+)
+
+COMMON_PASSES = (
+    # Add placeholder lines before code blocks following Markdown lists
+    FixPass('list code placeholder', r'(^\s*\*+[^*]+?)\n(\s*```)',
+            lambda m: f"{m.group(1)}\n'\n{m.group(2)}", re.MULTILINE | re.VERBOSE),
+    # Apply custom text replacements from config
+    FixPass('fix_text_replace', func=lambda text, context: fix_text_replace(text, context.config)),
+    # Format ChatGPT requests into collapsible blocks
+    FixPass('request_format', func=lambda text, context: request_format(text, context.request_md_tag)),
+    # Additional regex cleanup (headers, tables, etc.)
+    FixPass('fix_text_regexp', func=lambda text, context: fix_text_regexp(text, context.request_md_tag),
+            leading=True),
+    # Add extra hash to headings for better folding behavior in Obsidian
+    FixPass('heading deepening', r'(#{2,}) ', r'\1# ', re.MULTILINE),
+)
+
+PASSES_BY_TYPE = {
+    'ChatGPT': CHATGPT_PASSES + COMMON_PASSES,
+    'DeepSeek': DEEPSEEK_PASSES + COMMON_PASSES,
+}
+
+
+def get_passes(ui_type):
+    """
+    Returns the pass pipeline for the source type.
+    """
+    return PASSES_BY_TYPE.get(ui_type, COMMON_PASSES)
@@ -0,0 +1,303 @@
+"""
+Linear-time scanners for the fix-up passes that used to be backtracking regexes.
+
+The ChatGPT marker passes, `table_restore()`, `fix_code_blocks()` and `request_format()` matched DOTALL
+patterns with nested `\\s+` and lazy `.+?` over the whole text. A run of blank lines, a table without its
+closing line or a request without an answer made the regex engine retry from every line, which took minutes
+on a large chat. The scanners here find the same matches as the former patterns: leftmost, non-overlapping
+and with the same groups. They walk the text forward once and look up every terminator with one forward
+search (see `ForwardSearch`), so a missing terminator is not searched for again from every line.
+`benchmarks.bench_fixups` checks them against the former patterns.
+
+Scanners yield `ScanMatch` objects, and `substitute()` replaces them like `re.sub()` with a function.
+"""
+
+import re
+
+
+# ChatGPT UI markers: "КопироватьРедактировать" or "Всегда показывать подробности … Копировать"
+MARK_COPY_EDIT = 'КопироватьРедактировать'
+MARK_START_PATTERN = re.compile(MARK_COPY_EDIT + r'|Всегда\s+показывать\s+подробности')
+MARK_COPY_PATTERN = re.compile('Копировать')
+
+# An empty line (`^$` after at least one character of the block)
+BLANK_LINE_PATTERN = re.compile(r'^$', re.MULTILINE)
+
+TABLE_SEPARATOR_PATTERN = re.compile(r'^---\|', re.MULTILINE)
+# Line of exactly two whitespace characters that closes a broken table
+TABLE_END_PATTERN = re.compile(r'^\s{2}$', re.MULTILINE)
+
+WHITESPACE_PATTERN = re.compile(r'\s*')
+WORD_PATTERN = re.compile(r'\w*')
+
+FENCE = '```'
+REQUEST_START = '##### Вы сказали:\n'
+ANSWER_HEADING = '###### ChatGPT сказал:'
+
+
+class ScanMatch:
+    """
+    Match found by a scanner, with the part of the `re.Match` interface the replacers use.
+
+    Args:
+        string (str): Scanned text.
+        spans (Tuple[Tuple[int, int], ...]): (start, end) of the whole match, then of every group.
+    """
+    __slots__ = ('string', 'spans')
+
+    def __init__(self, string, spans):
+        self.string = string
+        self.spans = spans
+
+    def start(self, group=0):
+        return self.spans[group][0]
+
+    def end(self, group=0):
+        return self.spans[group][1]
+
+    def group(self, group=0):
+        start, end = self.spans[group]
+        return self.string[start:end]
+
+    def __repr__(self):
+        return f"ScanMatch({self.spans[0]}, {self.group()[:40]!r})"
+
+
+class ForwardSearch:
+    """
+    First match of a pattern at or after a position, remembered: the first match after a later position is
+    the same one as long as it is not behind it, and a missing match stays missing. Asked for increasing
+    positions, the text is searched once.
+
+    Args:
+        pattern (re.Pattern): Pattern to find.
+        text (str): Text to search.
+    """
+
+    def __init__(self, pattern, text):
+        self.pattern = pattern
+        self.text = text
+        self.searched_from = None
+        self.found = -1
+
+    def find(self, start):
+        """
+        Returns the start of the first match at or after `start`, -1 if there is none.
+        """
+        if self.searched_from is None or start < self.searched_from or -1 < self.found < start:
+            match = self.pattern.search(self.text, start)
+            self.searched_from = start
+            self.found = match.start() if match else -1
+        return self.found
+
+
+def substitute(scanner, repl, text):
+    """
+    Replaces every match of `scanner(text)` with `repl(match)`, as `re.sub()` does with a function.
+    """
+    pieces = []
+    position = 0
+    for match in scanner(text):
+        pieces.append(text[position:match.start()])
+        pieces.append(repl(match))
+        position = match.end()
+    if not pieces:
+        return text
+    pieces.append(text[position:])
+    return ''.join(pieces)
+
+
+def _is_word(char):
+    return char.isalnum() or char == '_'
+
+
+def _whitespace_start(text, end, bound):
+    # Start of the whitespace that ends at `end`, not before `bound`
+    start = end
+    while start > bound and text[start - 1].isspace():
+        start -= 1
+    return start
+
+
+def _first_line_start(text, start, end):
+    # First `^` in [start, end) for a run of whitespace, -1 if there is none
+    if start == 0 or text[start - 1] == '\n':
+        return start
+    newline = text.find('\n', start, end)
+    return newline + 1 if newline != -1 else -1
+
+
+def _iter_marks(text):
+    """
+    Yields (start, end) of the ChatGPT UI markers; end is -1 for a "Всегда показывать подробности"
+    that no "Копировать" follows.
+    """
+    copies = ForwardSearch(MARK_COPY_PATTERN, text)
+    for match in MARK_START_PATTERN.finditer(text):
+        if match.group() == MARK_COPY_EDIT:
+            yield match.start(), match.end()
+            continue
+        # `.+?Копировать`: at least one character before it
+        copy = copies.find(match.end() + 1)
+        yield match.start(), copy + len('Копировать') if copy != -1 else -1
+
+
+def _marker_word(text, start, bound):
+    """
+    Matches `^\\s+(\\w+)$\\s+$\\s+` backwards from a marker at `start`, not before `bound`.
+
+    Returns:
+        Tuple[int, int, int] | None: Start of the match, start and end of the word.
+    """
+    word_end = _whitespace_start(text, start, bound)
+    if word_end == start or text[word_end] != '\n' or text.find('\n', word_end + 1, start) == -1:
+        return None
+    word_start = word_end
+    while word_start > bound and _is_word(text[word_start - 1]):
+        word_start -= 1
+    if word_start == word_end or word_start == bound or not text[word_start - 1].isspace():
+        return None
+    line = _first_line_start(text, _whitespace_start(text, word_start, bound), word_start)
+    if line == -1 or line == word_start:
+        return None
+    return line, word_start, word_end
+
+
+def iter_marker_spacing(text):
+    """
+    Finds `(^\\s+$)\\s+$(\\s+MARK)` (MULTILINE | DOTALL): at least three line breaks of whitespace before
+    a marker. Group 1 ends at the next-to-last line break, group 2 starts at the last one.
+    """
+    position = 0
+    for start, end in _iter_marks(text):
+        if start < position or end == -1:
+            continue
+        line = _first_line_start(text, _whitespace_start(text, start, position), start)
+        if line == -1:
+            continue
+        last = text.rfind('\n', line + 1, start)
+        before = text.rfind('\n', line + 1, last) if last != -1 else -1
+        if before == -1:
+            continue
+        yield ScanMatch(text, ((line, end), (line, before), (last, end)))
+        position = end
+
+
+def iter_marker_headings(text):
+    """
+    Finds `(^\\s+\\w+$\\s+$\\s+MARK)` (MULTILINE | DOTALL): a word on its own line, a blank line and a marker.
+    """
+    position = 0
+    for start, end in _iter_marks(text):
+        if start < position or end == -1:
+            continue
+        found = _marker_word(text, start, position)
+        if found is None:
+            continue
+        yield ScanMatch(text, ((found[0], end), (found[0], end)))
+        position = end
+
+
+def iter_marker_code_blocks(text):
+    """
+    Finds `^\\s+(\\w+)$\\s+$\\s+MARK(.+?^$)` (MULTILINE | DOTALL): group 1 is the language word, group 2
+    runs from the marker to the next empty line.
+    """
+    blank_lines = ForwardSearch(BLANK_LINE_PATTERN, text)
+    position = 0
+    for start, end in _iter_marks(text):
+        if start < position or end == -1:
+            continue
+        found = _marker_word(text, start, position)
+        if found is None:
+            continue
+        blank_line = blank_lines.find(end + 1)
+        if blank_line == -1:
+            return  # no block further on can end either
+        line, word_start, word_end = found
+        yield ScanMatch(text, ((line, blank_line), (word_start, word_end), (end, blank_line)))
+        position = blank_line
+
+
+def _is_table_end(text, index):
+    return (text[index - 1] == '\n' and index + 2 <= len(text) and text[index].isspace()
+            and text[index + 1].isspace() and (index + 2 == len(text) or text[index + 2] == '\n'))
+
+
+def iter_table_blocks(text):
+    """
+    Finds `^((---\\|)+---\\s*$)(.+?)(^\\s{2}$)` (MULTILINE | DOTALL): a table separator line, the table
+    body and the line of two spaces that ends it.
+    """
+    table_ends = ForwardSearch(TABLE_END_PATTERN, text)
+    position = 0
+    for separator in TABLE_SEPARATOR_PATTERN.finditer(text):
+        start = separator.start()
+        if start < position:
+            continue
+        cells = start
+        while text.startswith('---|', cells):
+            cells += 4
+        if not text.startswith('---', cells):
+            continue
+
+        # `\s*$` takes the whitespace after the separator up to its last line break
+        separator_end = cells + 3
+        blank_end = WHITESPACE_PATTERN.match(text, separator_end).end()
+        head_end = blank_end if blank_end == len(text) else text.rfind('\n', separator_end, blank_end)
+        if head_end == -1:
+            continue
+        table_end = table_ends.find(head_end + 1) if head_end < len(text) else -1
+        if table_end == -1:
+            # The regex backs off into that whitespace: the last end line inside it ends the table
+            table_end = next((index for index in range(head_end, separator_end, -1)
+                              if _is_table_end(text, index)), -1)
+            if table_end == -1:
+                continue
+            head_end = table_end - 1
+
+        yield ScanMatch(text, ((start, table_end + 2), (start, head_end), (cells - 4, cells),
+                               (head_end, table_end), (table_end, table_end + 2)))
+        position = table_end + 2
+
+
+def iter_code_blocks(text):
+    """
+    Finds ```` ```(\\w+)(.*?)``` ```` (DOTALL): a fence with a language word, the code and the next fence,
+    wherever they are in a line.
+    """
+    fence = text.find(FENCE)
+    while fence != -1:
+        word_end = WORD_PATTERN.match(text, fence + len(FENCE)).end()
+        if word_end == fence + len(FENCE):
+            fence = text.find(FENCE, fence + 1)
+            continue
+        closing = text.find(FENCE, word_end)
+        if closing == -1:
+            return  # no block further on can be closed either
+        yield ScanMatch(text, ((fence, closing + len(FENCE)), (fence + len(FENCE), word_end), (word_end, closing)))
+        fence = text.find(FENCE, closing + len(FENCE))
+
+
+def iter_request_blocks(text):
+    """
+    Finds `##### Вы сказали:\\n(.*?)\\n\\s*###### ChatGPT сказал:` (DOTALL): group 1 is the request up to
+    the line break before the answer heading.
+    """
+    position = 0
+    while True:
+        request = text.find(REQUEST_START, position)
+        if request == -1:
+            return
+        body = request + len(REQUEST_START)
+        answer = text.find(ANSWER_HEADING, body)
+        while answer != -1:
+            newline = text.find('\n', _whitespace_start(text, answer, body), answer)
+            if newline != -1:
+                break
+            answer = text.find(ANSWER_HEADING, answer + 1)
+        if answer == -1:
+            return  # no request further on has an answer either
+        end = answer + len(ANSWER_HEADING)
+        yield ScanMatch(text, ((request, end), (body, newline)))
+        position = end
@@ -2,61 +2,147 @@
 pip install PyInstaller
 pip install --upgrade PyInstaller pyinstaller-hooks-contrib
 
-pyinstaller --windowed --onefile --name "GPT chat to Obsidian" main.py --icon=ChatGPT_Obsidian.ico --version-file=version.txt
+pyinstaller --windowed --onefile --name "GPT chat to Obsidian" main.py --icon=ChatGPT_Obsidian.ico --version-file=version.txt ^
+    --add-data "ChatGPT_Obsidian.png;."
 """
 
-import base64
+import multiprocessing
 import os
-import re
 import sys
-from datetime import datetime
-from configparser import ConfigParser
-import quopri
-# from pathlib import Path
-
-import chardet
-import html2text
-from email import policy
-from email.parser import BytesParser
-from bs4 import BeautifulSoup
-
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon, QPixmap
+import threading
+
+from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtGui import QFontDatabase, QIcon
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLineEdit, QPushButton,
-    QFileDialog, QMessageBox, QLabel, QCheckBox, QGroupBox, QHBoxLayout
+    QFileDialog, QMessageBox, QLabel, QCheckBox, QGroupBox, QHBoxLayout, QProgressBar,
+    QDialog, QDialogButtonBox, QPlainTextEdit, QListWidget, QListWidgetItem
+)
+
+from converter import (
+    CONVERSION_STAGES, STAGE_PAGE_WRITE, ConversionCancelled, ExportOptions,
+    cache_location, convert_mhtml, export_markdown, open_cache, count_turns, warm_up
 )
+from pagegroups import check_page_groups
+from perfreport import open_report, stage
+from searchindex import SearchIndex, index_path
+from settings import Settings, SettingsError, SettingsFile, save_config
+from watcher import EVENT_CONVERTED, EVENT_FAILED, EVENT_QUEUED, FolderWatcher, watch_options
 
-from markdownify import markdownify
 
+ICON_NAME = "ChatGPT_Obsidian.png"
 
-CONFIG_PATH = "config.ini"
 
-ICON_BASE64 = b"""
-iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAHjmSURBVHhe7b1rsB3Xfd15QeJJEiBpUuJDJEXLFMnIYDF8iQpLsqyHJVnyJI7CScbjJBOPqlwjfcgkmUrJ1peZVGrGcfmDXZkqK3HF865yJlGseBRPSREVRZUMY4mkaIogRFKUBAMkCD4gEJd4XdwLYbDOPevijz/27t797t5n/aoa+9mP0+firLX/3b17SQghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgiRJ4deObgDy7woWmDTPBVCCCFGBQT/9dd+dNWhF0/dfPDl/deh7sYbbnnl+pu2H9i9e/fLs06iNjIAQgghRsUFwv+97Q8/9+z+2197+fStaPv4L9x/eMsVx/7Pt79r7SsyAc2QARBCCDEKKPzffuz5+5eO3f4+Cv+mte13Hntzddudu69fuunma5euvnbLv1ve9K3f+cjH3/PI9dfdeHK+uqiIDIAQQohBofD/2d7NH33iySfetbJ89e2vH7jkYxD9eZelK3ZuWXnPe+/YKF+64/hv3fjOU1/48Mfu/9a8SlREBkAIIcRg7Nmz5wYI/+FX1t6FEb8XfvLge9++tHPnznlpaRYFwKWA+96/6/9WFKAeMgBCCCF6B8LPa/z/8esvfIRh/nnzBfzUHdcu/eQ7rp+XzgMTcMWNh3599z03Pi0TUB0ZACGEEL1B4V9ZvuJdj37jB78YG/FbPvzzu+e5i8GlgHs/sPTbuiGwOjIAQgghOgfX+fc8efAuCr+9uW/eJQhv/IvBSwF6KqA6MgBCCCE6w97gV0X4gb/xLwYvBeiGwGrIAAghhOgEhPvtI30p4X7Lez/wzqXt28u7zx4LPP7GE7oUUA0ZACGEEK3iw/1VhR/EbvyLoacCqiMDIIQQohWs8OOxvrK7+4souvEvhi4FVEMGQAghRCN4nT/1sb4yHnjo5qUrr7xyXkpHlwKqIQMgJscDX/5X/2ievYjHPvZXfm2eFUJ0jBf+Otf5Pak3/sXgpQA9FVCODIAYnCJBj/DZeRriN+dpKTILQtSH4f62hJ/UCf17dD9AGjIAojcKhL5I0LskahZkDoSIw+l7+Vjf8SOX3j1vakTVG/+K4P0AmiUwjgyA6ISI2A8l9HW4yBzIFIhFp8r0vVVpGvr36H6AcmQARKsY4Z+S2KeyYQpkBsQiEZq+F/VtiT/wL/tpA10KKEYGQDTGjfZzFP4QMzMgIyByBdf4kdadxa8KbYb+PbNIwKZv/c7f/JVPfmleJebIAIhaLKjoh1BUQGQJr/Pj/fwvPnd5q+F+Txs3/hXx1ltXfkVPBVyMDIBIRqJfisyAmDR8rK/J9L1VueeBty1dc+3V81I36FJAGBkAUUrm1/W7QpcIxKSwN/j1Ifyg7Rv/itBTARcjAyCCaLTfGjICYtTwef4ub/CL0XXo36KnAi5GBkBcxFz8JfrtIiMgRgXD/V3f4Bejj9C/R1GAC5EBEBso1N8LMgJicIYI91v6DP17YAJue/cbf11RABkAcQ4J/yDICIjeYbj/6adeePD1/bs+1OYsflXoK/S/tnZmafPmS+eldXhDoJ4KkAFYaCT8o0BGQHSODffzNb1DCD/oIvTvhZ5lnxJeClj01wbLACwgEv5RIiMgWofC39X0vVWpG/oPjeRTwbqE29ANgevIACwYusFv9PymTIBoCoQfaRdv62vCz/7cn6st5EWEDAKFH/Whdl0KkAFYKCT+k0EmQNRm6Lv7Y9y5+/qlm26+dl6qR1kkwI/2bRnETMCiThAkA7AAKOQ/SXRJQFTGTt+7snz1KEb9oGroP0XoKfA29W0g1M/25/0Ai/hooAxA5mjUP3kUDRClQPj7nL63KrzrPybEIWEmts72A36dUL2tA768yPcDyABkikb9WaFogAjC5/ntLH5jEn4QuuvfirbHCrftY8uhvE0tts73QwoW9VKADECGaNSfLYoGiBljvc7v8aH/IpEmVqyBFWq7nl0H2PW4jq9jHvgyLwUs0qOBl8xTkQkS/6z5rInsiAUFo37c3f/try/93T/658/+HYz68Uz/2MQfhMTf4sXY9mEdsW1I7TokVs88220ZsIxICs7vrLAAKAKQERL/hUGRgAXlkS8//u4xh/stDP178fWiyzJgHbFtoKg9tB/b35Z9H6Rg0S4FyABkgsR/4ZAJWCB4k9++50++78XnLh90Mp8UfuqOa5d+8h3Xz/IhMQZFdWX9fXuoLZbaPh7UL9JTATIAE8eEhCX+i4duDswcXOv3r+ods/ATTvhD4QUhMfYpSGmz+SrtwJc9b7l++8I8FSADMGE06hdzFA3IjJDwo34K4v/ge9++tHPnzkKRBSGBDomz7xfrH8rH2kGoD0B5US4FyABMFIm/cMgEZMBU7u6PwdB/kdB6wSWxfrZ/6rq2zhOrt6APTEDurw2WAZggEn8RQSZgolD4OZnP0C/tqYud8McSEl3W+ZTE6kHRukX9PbF6gEsBub8rQAZgYkj8RQmtmABzb0llZEKqMfZZ/FJJCf2HBNtT1BYjtE5qXQz0zf2GQBmACbGA4j+7ya1FFuXclZqABIFvcq4KvzcZhHU4i9+Y3tZXl1Do30Px9SIcE+VYf2DrUrcX4sc//vHSJZdcspFasB1w6Y7jv3XjO099IccJgmQAJkLm4h8UjLaFokD0cjyvZeZpyM/cy/c9VqZ6Z38RCP3XFeGqpG677jFYM4BtIAqQ61MBMgATIEPxv0AAhv7hd8YgV5M1BWZ/F7kaAXud/7nHt39qajf4xXjo/e9Yuuyyy1oV5Vi/UH3ZNsvaIfiAkQBiIwO53g8gAzByMhP/0f/AB6IEMgT9c1GEYMqmwN/gN/VwvyUl9B8i1QgUkbqNUHgf2HrmbQqY37p1S5aPBsoAjJhMxH/jx3yKP+KKDoyGSf4d5XSd38MX/TQV8jK80FcxD1bkSVEdhd+DNkQBkM/ppkAZgJEycfGftOjHMGZARmBYRv/3xev8Tz/1woOv79/1IYT78cKeeXMWVAn9x4CYg6YmImYKysSebRT+mAlgv9wuBcgAjJSJGoDZD3NOoh9CRmBUjMoMMNyPiXwOv7L2LjzPn5vwg7qhf1BlBE9C69TZTkj8iRV+bwRYzu1SgAzACJmg+C+E8HtkBEbHoH+HNtw/1Yl8Umg79F9HyFPwYs+UbcAKvc0XQROASwFTfzRQBmBkTEz8F1L4PRON1uRMr3+X/rG+HMP9lvd+4J1L27dvqy3aRYLflRkgXuC9IQBlRgDtuVwKkAEYERMSEgm/Q9GAUdLp36m9u38qr+ltCkP/p0+vbgglRbQLaAiqGgN/XLZcJO4pYP3NmzdvmIApXwqQARgJExF/CX8JMgKjpPW/W476c7y7P0Zfd/2HqGo0QoKPshd/1oXaQtg+iIJMfapgGYCRMHIDIOGvyISiOYtE479jH+5fBOEnTUP/fWDFHnhxLxN81rMPia1zw01XTHqWQBmAETB28Zfw10PRgNFS2QjYcP+U39ZXl3seeNvSNddevRH6B14kh8YeD4XainZIwEN1xG7PYvtP/VKADMDASPzzR9GA0ZJkBBbl7v4YQ4b+q2AFm3lfB4pEP4bdDrDbn/KlABmAARmxMCjk3yIyAKMnaHT9df7c7+6PwRf9eBEcgpgQE1tG3kLBZurx27L4Nr8+TMAU3xoY/rRikZn9GEr828FcBhDj5bP+e8Ko/4lvLP+1R7/x3GzUv2/vmb+0iOL/wEM3z9KQYJKithSwPhdLqM6Luxdl2+7FnOv4Nub9tpj6PBa/bRikXZdfdR/uDcHfzrx69CgCMBAjHRUq5N8SRlA08p8IWzZt+vwf/vn3/HeLdnd/jNgjfyEBLCLWP1Tv9+H7pJSL4DZj2O0xz/5+XVv+8Y/PLG3dum12P8Dypm/9zkc+/p5HpnApQAZgACT+eTPS71cksOPspS++799sfSKXV/XWxV73t6IHKJBFUDzrwvXtduxx2G37vqHUE6vnOsxbYusAGACAdyNM6VJA/W9I5ITEvwUg/BL/aXNy05mbvv6hU38R4f5FFX/w03ffOPvsFES7oC4mhIDrMO/7xsq2nutbWMdjAGXbKutHUMZi94u8Xfw6F/Y9/1KjMycv//uIIE3hUoAiAD0zQoGQ+Ddk/p0CCX8GbF7etPSOz2+ZlxaPshf9eKEEto5CGepDytpC2wOxOpZtvgi7fUtoXW4zZduIBGzevGXpuhsvm8SjgTIAPSLxzwsJf34suvinPPJHEbQCGqoDFE6LFdNQyj4WtltCdWXYfRC/X27Xbh/5tTXcC7E+0rdtAMLPNuRxKWAKLwy68EyIRULi3wBj5iT+Ihvuf89twcseFDsKIxbi61C+UBzXy74+BvpwW3abFtSH+pXB9Qjzvs72O7+v8wJv+1toBE6cODErj/2pgLSzJhozstG/xL8m+B5HGMkRojF45A8v3cFd/xaKXUz0ANq4QDC90ALUMWU/X+Y6sXWJ7+f7+zIJ1fttA/RjPddZP77zI30L6tBmeeXgiQ+uHrvib2D2SMwpMa8eFRd/cpE7Ev+aaNSfN4sc/r9z9/VLV1555QWP/HEBFEMvikwB2riuJ1SPsq1jnvsArPPrAtvPE2tjvd2X34fvQ1D24r8eDVhfCPO4ZHDk9dUPYupoPFo6qxwZ8TMoWmNEI0aJfw006hc5g3n+b7r52o2b/rzwAVtn8xBLLhb2Ydu6eJ4XVtu/rAx8GXAfRaCP7cc8tufbAOvLoMjDENAU2DyBoeIEQWOMAlx8VkWuSPwr4oRf4i+ygy/5ofhDALnYsgd1VkBt3vb3fQjyvp+lrBwj1M8eK/cZ2x7rLzy286N7gDKEHmmozYIowMsvHptdCsDMkmMzAXoKoGPGMHLEDGePfvSTn5kXRQnz7wxI9BeERQz/P/jety/t3Lnzgjf8hbDCCaxIhoQ0Vk/YXtYvFW6LcJuh/bBf0X7Rx97xTyj8Nu8F33PmzHr7jh2XzWYJHNsLg+LfusiG1bNnl+dZUYBG/GJRwLv9vfhDFEPCaAXUgjquaykSV8B23y+0LRCr5/r2+JCiHKpj3paZWtbbzws9RT4m+OzL1HLppet1J0+efyoAr5WeFUaAIgAdMobR/zkU+k9gJN/V0MzeAtkikzmfixIBwHP+9777Hdu2bt2SNPIHFFOmY8Eek019m6XKZygb5Re1hUD/G266YlQTBMkAdMgIREXiX8L8OwKLJv4XiX3bfyvm3HpGda4XSfzxnD8f9fOi6aFQVhHNVGLb5PHEjsvWc/22jo+Czzyh0PvUEqrz4HLAtm3bZ7MEjmWCIBmADpEBGDcLNuq/QPCH/LsIGINBv4NFMABW/O0sf6ki2pbIVgH7q2oCbH3smH09RZ14ka8r+BbeCwBw6QUvDLr3A0u/vXv37pfn1YMgA9AREv/xYgQod/HfEP0x/y04Q9D7d5K7AfBv9vMCSNEEIcEEdp2YsDaBx+XzgGXfBxQdCwQa8/Kz3Qt6TPStuMfyVYEBwP0ATN92y5WjuBQgA9ARAxsAiX+ABRD+0Yzy69K3Gchd/O2LfbxQepElIVEtEtpUsL7dZwzuxx9f6jFUOVYv6GUmwFLFEDACQBMwlksBMgAdMLD4AxkAw6IIf27feR9mIGcDUCT+ICbGsb6poloGthPad6ie+7T7Z77qMYWEHYTqWQdY3wY2EoBHA7ftPDXopQAZgA4Y2ABI/A0jMGNdMYnwflt0YeIWVfzrCmjb2GNASnx9KA1hRTuGFXnAddoUeYsVfJ9u2bJ146mAt79r7StDmAAZgJYZgeDIAJyjC8EYCVmO9lNp83vN1QBgXv+yqX3HAkXdY+v98ReZAOCNQFG5iQGIibsFdYDtFtThHgVeChhigiAZgJYZ2AAsvPhnLPxA5m5OG99zjgaAU/viMb+pQdH34m/rbGqxQs4b/6zQAy/2dYU/BS/2Rdzykz/x75aPv/HEEJcCZABaRgZgGHIXfvwj8b+Yut97juKP1/nyjX5FhAS0CyjWNm/riD0W3595D7dl8YIPbF1bYl93xF8ETMAQlwJkAFpE4j8MA5/3LpHwJ1L1byA3A2Dn9fd4sQyJZ99Q4Ls4Lm8EKPxdjfhDhqCK+OMzb9myZZBHA2UAGmBGH2RIEVo4A1B39DcBJPw1qPL3kJMB+JkP3bHEqX1JipiyT6rwpvbjNkN5wjoL21P3E4Lib4W+7QhAiCqC7+FnvfzyK2ZPBdz4zlNf6OvRQBmAijjRH4vwLKr45yb8QNf5G1L2t5GL+Pt5/ccGxZ8pseLuxd72Z73vAyj0Fiv+VvS9IWgDO9oH3gCkXgKwn2uIKIAMQAlO8MEYRWdhRKPKKG9iaNTfIrG/k9zEPySOQ0Hh9ngh96lts4TqAMXci7ylbcEPQRPQxuif4DPzfoA+TIAMQAAn+mMXmoUQfwm/qMpDX/nD3109e/bT82JW4o95/ZEPCWSMmKC2CbaP/RCWbUpiZV8fEvgQ1hhYA9BWBMALfp3r/RZ+Rv95GQno49FAGQDDREUmawMg4RdNeN9XvvgvT5398cNbTiyd/sn/eevWefVkKZvdrwgvNF1h94F9AtRZgfd1IaoIf5noNzUBFH/mLXWjAP482TKe5ujjhUEyAOeYuMhkawDm30tuwg90nb8n9uzZc8N/s/+FZ3/6n2zfduzN1dmoeao0Ef8+KRI2j2+vKvo2b1PQVPTLaHvkb0FbH5cCFtoAZDC6zFJINOoXbfHIlx9/99e/9Orn9u0985fmVZOE4j/mCX4gZhS1KsLv+6K8trZ6Lr1Q4EN5UCT6vpyKHfGDumJfRtG56uNSwMV3bCwAEBgzusxxhDlZMv5eZmZN4t8fh145uOPgy/uve+3l07fOqyYJpvYdm/iHBMsKWajdYtt9X5Qp8h5bH+pjDQKoKv4U+i7EH5/LLzHxBydPrCy9/OKxDx783vaH9zx58K55dasslAGQ8I8X993kBEb9CvkPwOxH89jt79u0tv3OedXk4Lz+Yxv5Q7iAF7QQ7GsJ1Vmxjgk365H6PhT+2LpDE/7M6+cs1LZ5yyVLq6unl3ZdftV9K8tXvAuGdt7UGgtxCWAuLCAncclCVDL9boDC/QPzf/yvf/if/ccvXfIPjx+59O551aSITe0LsYiJbZdgn16o/HGwPXR8PO7Y8UO4rYj7kTzKFPeY2Ps+vj2GH/m3Meq3nzX2mVOwlwLaniAoewOQ6agSTNoASPhFl+Dmvz/bu/mj/8//te+fTPHmv4fe/46lyy67bOnUqZWZeIwBCpg9nlRRCwlhSBQp9CRWThX2FKzYNzUAKZ8xhbXVH88iAEy3bdu+dPnVa63PEjiOv6wOgMBkLP6Txnwv2Yk/hF/iPzzffuz5+x/9xg9+cV6cDHjG/70feOdM/DHyh4CMBRyLPZ4UYWN/9rXrnK8Li22Z2Ftj0ASIPpemI3//fdURfwDRt6ysnJpdCpjdD3DO3M6rG5NlBGABhH+So3+N+kUf4FrpE99Y/mt/9M+f/TtTCv+PfXY/n28DirzPA9/WNRD/OibAnhfS5vfHKAD20fajgRcedQZo1D8+8J1o1C/64vXXfnTV4VfW3jWlm/84u9+YxB/440G+zePzI3zm+xB8QsGvK/4+bev8QPjtpYDTK2tLL+0/+sHVY1f8jbaeCsjGADiRESMgd+HHIuEfFxj9I/z/3LP7b59XjR6I/3vee0flqX37hMflR7pNsaN84PNob8MMeGFnGSmEn/mqtH0+AMQeQPgp/rwkgEcDXzt0av3RwBYuBWRxCWABhX/UwjP/PkCO34nC/SMGBuDf/osf/YP/+PUXPjKF8P+QE/xA1IsEjO0hUxKrL8KKfSjfhtCXQcG3wg/KxD/lXDXFCr3FRgEA8nh18I23rf3K29+19pUmUwW3b196RuI/LjIe8QOF+0cOwv/7Dj61NIXw/9Cz+8VEHHUUvJiw1RG8IvEPEatvAyv+KYTEn+epzrkIQfGH0FPsQ+KP/PHjx5ZwKQDRribzA0zaACyg+I8WfBcZfx8K90+EQy+eunll+erbx/7o3xhm94sJV9FItyoc1dvRvR3tM+/bga1rAzv6J8iXjf49PG84T22eKyvyFHqbMg+Q4lIAJrqC6Z1V1mCSBiBzsZkc5rvI7fvYEH6J//jBNVHMmDb2qX/veeBto5ndLzayZdpU4CjmXtRtmXnStvATP+qnIUiNBuB82HPTBCvkTCHwzHtQx3r2O/rG8uzRQMx3UTcKMLl7ACT84xmJzr8LkKPw6zr/xIAB+IPP7//86wcu+dhYIwCx2f26hGJFMa8rXli/7rpW6Jm3Qu/LbWFH/Tb1bTGaCn0KXvw50veGgPWe2+58a+0XBq3vYSJI/MdDzqN+jfinB0ZACP8jP1bxxwQ/EH/M7teGsKRuA8Jtxd+O6m2ehOpA6v5ShNwaAtCV+Hus+Ns0FXsu60ABt2lM2FHHdpZDPPfcgVvwVECdSwH1P0nPSPzHQ6bfha7zTxj8+I01/M/Z/TZv3rwxtW8TESHcRpkwVzUbVfvHKBvhdyH6IazYc0mF31Ub35kVe4o6U4ttBzHhJ9s277it7qWAZp+oJyT+GwwuUBl+F7rOnwEY/WPq37Hd/c8JfiD+fvTdFAq13ybrkVoxt3mLX7/NYwQQeix2xN8HGO1zxM+0Kv78+XNaBS/6FPaQMSB+HcvJk+tG5s3l1aV933+91gRBo78HQOJ/AYMagIe+8oe/u3r27KfnxRzIfsQ///9TypTPw+zZ///3Tz48tjf/UfyRrysaTeF+Ieplx5DSpwoUfZuCUDSgK6qG+AnOA40Q822cGy/2NAGhuhTQn8fJaYI/8Vfv/N9mFQmM2gBI/C9iMMHK7LvI9ia/gOCnfmezcwKmdl5w89+3v770d/+/r774t8dy/b/KM/5WbIqgAFlhstht+G3addnm1wex+ip4oQ+ZgC7xoh+70S9Wb7HnDdQ9NxR3mw+lMSj0OGacR0SUPJs3X7r01ltXfqXKewJGawAk/kEGMQAZfReLIPxtfE+TOk947/9zj2//1Fju/u9qgh8rPiGhpkgBK1zIh/q3iRd9m+9a+CHiPsRfd+Tv4bljPoWQ2Nt8keCz75YtW2bnLST0Fh4fxB/AAFSZHXCUBkDiH6V3A5CT+Ev4KzN6I4DwP978N5b3/nch/hQeK+IUJVJHqNqgD4FPhUbAin/KKD9Gm+cxJPoo4zsrGtWnwO9+bW1t6fKr137r3g8s/XaqAbjwr2gESPzHQybfBUQsZ/HH99PVdzTbtjEZowLizzf/zasGpe7sfvgBt2ITEx7We/Enfjsg1rdtIGA27Qsv9p62IgGpWIFHnmWK/Y7Lti3t3HXF0pVX7Zo9Erpz586lrVu31RJ/ft8U/9XV00vXXLd577w5iVEZAIm/aJmZ8Ocm/vh/0vP/lZkJGKMRwKNPePHP0KP/lNn9vDhbvFDbvmizSwhfz3LRPtuAo/+iCECXpoAjfC6sC5mBOoTOd9H3wBA+2in2eHEPFoj9ZZddtrHu2tqZ2VIGhd6Csj2G48dOLJ08ffwF5K99y0+8MatMIPwpBkDiPy4m/n1kOeo3Ijwbmc8q+2O2T3MMo2AM7/3H7H7XXHv17Bn/IuwPdkyYbX2sT4hQ35hI9U1f1/9DZqALcK7t+cb1+m3bti/t2HHZhtgjb8UepAp+DL9fm+cjgYeP7z1cZTbAUfyFTFRsZtdHxajYEP6cxH9g4feMxgjwzX9Djv4fev87Zj/4nOAH2B/mEGj34ux/3ImvZ9kvqdvrmj7uBYiJPMttjP557uw5xDnGAsG3Yo8Q/vbt2y76DpqIvYX7Jf57Rfi/Lhce8QBMUPzt6FImYBxkKfxgRMLv2TAC68V+wfV/hP/x5r95Va9wdj/8+OMH2f5AeyGIgfW4rv+RD23D//BbfFvqMdTBinwfgu8JhfhtGUagigngueP3gQXnz4/skWLBd+7Pb1tiD3gMntB3irqVlVPzUnW6+ytJYGLin63IeKb2veQq/BP5HgaJBvDmPzz6N6/qDYj/ve9+x2x2P46+Yj/aIfhDjhSLXS/2I48+oTaLbU89liJi4t73jX4h7Gi/KBoQg98Xzyu2Q8Gn2MdG9l1R9p3F2jETYF36+WQBJiQyCyP8E8NGYrLC/N+YigmbHWufJgBT/z737P7e3/vP2f0gChB/Kw7Mx36obT3yXFgOpRbUFYlRaJ0mhIQepsAaA/QZ0hCUCX0MO7qn2GPxd+O3PbIPgfqi766ovWi9FAYzABNAwj9Osg73T8gYh+glGjDUe//t1L7+uqsXZv4w88fbl0FsHYJ2LLa/79M1McFnnW3v2gjUFfv10f3WiwQfYu+/gy6J7Yvfc6i96PtGf4T/V1fr3wMwyERAI/+Rg8CUTn4y0GfoZcQ70u8n6XuZIkYwpyr8IWbfF2j7O3vky4+/++tfevVzfc78Zyf4sT/K9kcb9SzXEerQuqjz2wrVdQXEncLOPAW/b2AA/LV+D9rXTUpYUMeI/bsBqd8t1jn6xvLS8vLK0q5d25bObFp54YY7X/57f/NXPvmleZdSej9DYxd//FjlKDITZxFG/DmJP+BnavXSAF93itH/0OIPUOZiy0XEhKlsPZLarw38qN6O9n1bH0D0KfwQeyxDj+yrEvsbidXHQF8+/of5B5aPHXnmxhtueWVWkUivZ2nE4r8RVl4vipGQ7feSsfCHaO3SAG7+O/i97Q/Pi51TJP6gjtBgO1iP69ptVBGAVNoasVPwmfYVCbCCz1A+r9ljGbPYe/j9tnHMa2vrN/9t2bJ5aWXt5At33HnL89fftP3ArDKR6Zy57tCof5wswqh/kWglGsCb//qY/IdT++IZf4q2BeWiH/TYjzzXSxH7lD5lpIzUy8Qc7X0JPmGUwQr+2Ef3ntD3Z4+f7UhTPxf7rq5eePd/1WmAQW9ncqQ/ehr1j48sR/1O+BdN/C2NogG8+a/r8D+n9vWz++GHlz/U9sc99EMfqgO+PtavLWLCbeuLTIJfvyszgGPYvHnLbKHYT0Hwq3x/+CzoH1ondTs8H/bxvzvuuHn/tl3H9laZBhj0cmZHKP4K+Y+Pje8kR/E/lyy68Ftm56KqEcDd/31M/QvxD03tyx/ush/qsQmWFXeKNxYv+hR124d1bYN9hwQf527sgu+JHW/R3wnW8e1VPnds9r8q0wCDaZ3pdshSZCZOtsI/QvM7JpKNAG7+Y/h/XtUJD7737bM3tZXN619EmUEYAxDfIoGnQKdQ1o/bwhIa3U9N8KtQxRyk/t1gm3b2vyaPAXZ+5kf2A6hR//jI7jtxwi/xLyfJCHQd/se8/riTvMnc6qn0IXpW3Jn3Ym3LyIfWKcP3o9hjWR/hr4s9BR9YsfPCh3KqGA4Jj9GmdsFnZRvx5SpwXaQ2/I+bAJ977sAtVW8ABJ3+FUr8xaIh4W9EoRF4/od/urOL8D8m+PmZD90xG5nGxL8PwW4bL+6eWB3rQ+0W28+G8nGuqozufZ/U9YYGx0ihJzZv25CngNeF2+Ld/2THjuLvqYjxn+V2kPiLTjGiJeFvzgVGAAse/7vmst03rze3B8T/z99/68bUvjGa/nh72t5eChipYykTdosVeSv0WHDO1vMXij1TCwXQfu4hzkHb8LPisyDP1Nazrg72HDHv7/5vQr2jSmBEP4YSf9EZFKhz2ZlozSpFW/CcfvYzB174Vttz/3NqXwgYxN/+SNsf8alD4QcUdB+2j4FzQLG3C0GeIscFIPX9fMq8XW8K+GP1n9l/HtbVgefIsrZ68bYwCdA8W4mLt54XEn/RGRL+/ji56cxNX//Qqb84LzYmNK+//ZHmj3joB3hqcPSOJcUI4DNz8fC8ALb7lO22L9MQ3FdRnzHA4/Ofk8fv8f1Ssf2ZR8pzxNn/2uDio26BkYz+Jf6iE9yoX/TE6mVnN/3g0+2EP9/z3ju24ce07IY/+2OcAxR+sm4Mzgs+RSuF0LlJ3UZsXTLG8+4/F8s4Viwo2+Nu+hm4TcB0dfX0LG2LCz9RC0j8Ra444Zf4T5B9Bw4s/XD//qUf/uDQ0tatW+a1+VEW4oegcKkL1qX4ecq2XbbfJsdVhzKx5ue0i4d1TY+d69vtYNson15p9wmVfs9yP0j8RetI+KcPxP/s2bOz/NceeXKW5gpH+lZEQsLSBC+CFEbWU7RA2T79tjxl7SS1nyd0fKFt2X5oD/Wpcgzchl1C9dgvolWh8D9eBFSX+msGUFhU5IYb9YsB2by8aekdn68+aj/y5o+OYtRP8QfIIwqwfXsvLxTsHQgGFgpK21AIrSDaOooW4DHYvp6iNrutMvw+y/D9UC5at8qx1MXvn/uLhf/xIqBtu448Py9WottP0j8a/YtWcMIv8Z8oGPW/ceTYlfPiBTz++PNH59kssMJEIWOdT9siJIi+rsk+vRimkrpP3w9l1tk2W1/3mDyhcxeC+wuF/zkHwM6rLq08CRAo33siIxglSfxFYzIW/tm7FubLQmBD/iFgDF488PrsOfYp4sXDCooVrBSRqYoVQe7X1qUQ6896pl0cf4jQ8di62PE2IXWb6BcK/6MOLwK65q1b91V9ERDo58x2j8RfNCZn4cf/Dy6sQ+NUqBL+D4X8Yzy759A5A3DhnfFTwoq8zbdNbD92X7aeQLhiImf7WVCPdZDG+lQhVWQBj9euU2X9FOz2Uz4j2mPhf74H4MYbbnlllqlI87N7jhGM/oWojRv158SG8M/LM6ZsBMqA+MdC/iFgFA6/fmRyUQAvGl60qlImQty23YfPY4lth+3Ml2G3U2XdWLvdBghtz+4T+VD/pvjtoJyy7djd/3gPwPLxN57AewCqvgkQFH/r00Cjf1Gb3Ef968UwzgiMltTRf9H1/k2bNs1zF/PkYy9NMgpA4SgT7xTKRAj74H5sX5unaHJhHddjCvw2bDlEaBsh0O63hTouhHmm9hhQV3Y8VbHb5pIK1g2F/zH6b/IeAJB+FEJkxKKN+oswJmCy0QAf8reCXyT+AOsePXp0MlEAigeFCktVUamKFTCmNg98H4uts+sSvw2Lb/N9UA6t5+uZD/W1x8R2f4xt4Y+rbD+Y0yH0yl+M/pvS+BMO/COq0b+ohBP+hRv1xzCmYVJGgBP7EC/8LMMcMB8yBN99+tAKogCpc+QPhRWLLoUqtE0rXFbAkGd/f3x2Icyz3u/L9rd54veBMhb29dsj7BMiVB/rW4fYMYGi/WC9kydWgmJPU7Dv4FOztA7xoxo/En+RzCIIfxv/H5wRGJyi8L+9y9+KfUjgfZvv8/Qz39924sSJJbz4xjOUKSgSja7gPlPED33Q3x+nXZfttg/zvh6wLtSHKbZv98G8bff4PsBvp2vq7i829//gEYCBR/9CJCHhr44xAaOMBviQf+yO/1h9iO98+8AKpgf2gu/nz+8LK1pcgK9vk5hA+WMg7O9TYsvI+/YQdls2HyJ0TKFjRJ3dRigf20dTsN2628a7/0Phf8v3Xvzyrnm2Mu3+9fSHRv+iFDfqz4nOhN9i9jEaI+BD/mWEogEkFAU4dWrlnFi0K/gUpDKhstRtawu7D+RjIsa2GG0cK7Yf2w73zeNjP9b7sq1v49g83H4b4PjKwv+IDtyy65eunxVq0P4ZEGJgnPBnOepfL/aDMwK94cP/sYl9IORFQh8C2wlt608f37eC6YHbDPuHxAf4sqcrkUrBClksD3zZHy/audjPzcVj+8W2RWLre5qewyrr2748lrr7x/op4f/9y39waJ6tTO0zM+DISqN/ESRj4Qe9jPqLMCagNyOA9/Yj9SF/UlX4Cdfz6+/Z+4Nta2tnzv1odxf29yJlyxCLIsEICVxXFB2Lr7d9fQqK6iy2zgtobF3fz54j5LGgza9j+xWR2s/CfVbZjyfFhG69bO2Fd970seV5sTLnz4gQEyV34ccyFtNrTEgvRgCCHAv5W/EuutYfaov1R/2B/a918pIgL0KA5VBbSDh8n6YUbY/iFetj63msoXWYZxthObYAuy6wZeTtftgnRqid69vtNIXHVnY8Zayurs5z57H3A9j3ANSZBhjU+tQa/YuxsAjCP8a/+a6NAML/l3zu0EVCHRu5A/QNCXuoL+tC/VNeFVzlEgHFJSQIrLMp822KUozQMZGi47agnxU85rHYvIXbJr4MWMd1/XZsGX1j28Bi+1lYb7fbhLrbw9+T/ZvCca6tXrwNhv5pBG64aecX77r7tm/OCjW4+IwJMQHcqD83Riv8HmcEWuPM8upMnK14W/H3Yo86LkWkrIM+fFVwTOirXCIoEgMKFEA/Wx4af9z+WEns89nP4T+XX4ef3RLbLkjti/pQm1+/Dty23Yf/nFWwf1O4+z92/R/YewDqTgMMmp+F/tDoXyjcP1KMCWhsBDa9uLa0+TdeDwozBTwk3CGs4IPYOr6erwrmj3KVEX8RITHydaE+Y4ICZ4/TCmDsM9r6kEiG2v22YvWAdaFtE/YJrd8G2G6dbVvxx/Ej/F/0+J9tqxv+B/EzJcTIULh/3Jjjb8UIEIpzquhbUvt7o+BfFdzlTYH4wecC8SgSsD7gsXgobm0coxXJ0P7Y7tvsejF8H7u+308T6hwbKTKU2A7C/0UT/RS1VaHy2cg47CpGihv150QWwu9pYgQ2vbS2tOUfHb5AuCnOVqS9YMdI6cc+1miApq8KpkDYxdZ7ygSkisBYQvsKwX7Yj9+XPXYQa7eEtlMEtuG3w/VD27ewPXYcpMrxeELbqbo9Cr83lKi3pqAo/G85fGLPgXm2FsVndTwo/L+g5Dzqz034Pc4IlILQ/5bfODwvnQeC7EfyvlxEVbPAFE8fNHlVMMTBi4YVKC9WqSJXlRSRKts2t+G3xfVC7WwLbRt1sXVtf+RRb7dLbD+/jTbxx2X3ZY8hhTLhB7F3/3dBtaMXoicyHvVvMP982WNMQDQiwJF/kVhXEX0SMg+eovY2XhUcEhDWWeoIShHYVur2YsdkCW2raB3blrquP47U7XcF9mGP3e+zzjF4wQfWGMTe/W8puj+gCu39tQnREhmP+i2zz2eMTtaURjvO6T7Ev47It4E1CvYYEAVIfVUwhcIKBvIxAWG+joikgO2mbtsfZ5uEjsHXdXUOmoBjavOcUPh9FMCXU8L/uAcA/d5848zN86paVPp0A43IFP5fIAb6GxuShTMC2zdd8oV5cUbouv/QWEOQ+qpgilhI3LgQCi7quhLeFLhvf8yhY/J9Uohtfwrw+2mD0N8O66wxWFk5NcuHCI36MQnQPFuL4f7yhDAYAVwk8bdsGIH1Yr58/m3v/NtbVzbNnluG+G/+n15Pvk7fNRR9HA+PCbMRxl4VXAUIChcSy/eFFbhYntQ5vikKvz9mltv4LBB7K/gWnN/Q5D/E3/nfxmUAGQAxOEb4F1X8LVlHAw69cnDHtx97/v6f/t8veZ7iD+zofwxmgBEALDie2KuCi8APOkXD5qdKl8c/hPkh/nOFjqXpZ4fYe8EHrMPfVdnkPwTCj2mAD736ylPzqtqM3QAo/J8/Ev6L2YgG5GQEIP6vv/ajq/Y9f/J9L+4/eivEnyJr8eUhsVGA06dXk6IAEBAv+F5AYoKC+qZiM0WG/MxW8Ls6Dj/qZyTA1p85Uyz+HPHz+v9PvfO6y2cVDVAEQIjxkp0RwOj/xecu/8jRN45fydH1mKFBwXG+9OLhJUQByqCI0Ahw8YTEPtRvDIz1uNoE3wU/Z+i7qQKFHSAPgbeCH6Ls7n8IP0wAIwDLx448c81bt+6bN9dCBkCI8bNhBNaL02TPkwfv4uifwj+m0b4Hx8gF4CVBeFVwCjEBYb01Baxj/zGKLY+tKWM1Evx89ntom9glANYXhf/t6J/3Atxx5y3P33jDLa/UfQ8ASP425j8+CtUKMRyTjQYg/P/0Uy88yNE/6iisRaT06RJGABgFaPKq4JD4jUkQuz4WbL8rca1L6Hj6/E4YEcDkPxT5EPYGQPTbvGX9GPEioFmmJuP56xNCpDC5ywIQf4z+X9+/60MY/c+rS0f/ENyyPjHaMA5239weXxJUBkSEgmcX1gPWAVtP2NYXXe+v789ThD3vnraO04b8m4b/gY0CrKydfOGa6zbvbfIiIDBmA6AbAIWIMxkjgBv/Hv3Gcw8/+c3Xfhaj/1RxLhL/sm3UNQ5FYJt4SRBfFVyGFRkuqONixYd1lpA4iX6p+x3Y0H4ZMAYI/9tRfgi20wgcPr73cJPwP9BfmBDTZtT3B+zZs+eGr/7xnodt6D9VnItEvguBj4HjwP6qRAGsmFtxpxEAtk5ciDdDbYJt45zzeynaV9Xj4Ei/aLTvKbv7n9gIwLbNO26bFRqivzwh8mB00QCE/g+9eOpmH/oHVsBjQp8i8mWRAJLaj9j+PA6m/lXBnpigezGxRgD5MRuBvo+tyf78eQ6JeFVhT8GLfooJQJQA4f+i6/8Ews9+uAQwyzRkvH9xQoiqjOqygA/9z6svwgt9VbEugttKMROWUH97XEWvCg6JixV70oUIdQWPdcwmBRSd+66pEva3pIT/AcTfmoA2kAEQIj9GcVnAPvMfE3Vfj3IVsS7rWybkVbDbKnpVcEhwIEy2HnmWUwRqLGZh7KbFnldLH8fNEX8VI5Dy6l8b+md6+sRmXQIQQhQyWDQA1/4Pv3r6Vj7zHxNqX18m6G1QZR/WLHjjEHtVcExsWO/bU8QpxSTkQJdCzW13cS4h/hR95FPC/yA1/E/QF5MAHXjppcbTAAMZACHOv6e+8J31E2WQywIY/ePaP/J9iHpXFB07ogBvvvlm9F4AEhMcK0hdCt+UKBNne55Szhn6+HVS1isjJPBVhJ/Ewv80BUh92L9owqCqyACIRWYm9njc1C9sQ6dM6O2yAG7+w+i/7Nr/1AiZgWeeOnjBq4IhYFVGmFX65koVQbbnq8m5a3rebYi/quiTorv/bbjfp4gAHLni31wxq2jIWP/6NAeA6JILhH+96kKcEciJTqMBdtKfsYp/nXsAuI43AU8/8/3Zq4K3bl2fF8COMCEyWGICZ9soSFXEMBeKxNiez1Rsf7/tts9zXfEHqeF/Gw1g/upjv3BslmnIWA3A4DcwiWwpFH6PMQFZRgPa/n9m7/yfV3VCHREndS5JFK2DVwXbewGsyMSEhvXoa/tZwYqtu0jgfNhzYvHnJ3QOPXadon6gTNybiH8KFHs7+mf+LTds3Yf3AMwKDSg+A8OhCIBom41R/3oxHWMYsosGYGnLCPC5/5Xlq2/vevRfR8Tbwu+brwqmoKQKd6xfipC1TeoxD4k9Rn+8oTakzIfOpd+GJ3QnvxX91Dv9QyD8X/b4H9tslAD5M5tWXti268jz86pGjNUACNEWG8Lf1FQaE5CtEVgvVgfij9H/17/06uc4+scovclI3dLGdto8FmsCUP72t36wkvKq4CaiXiZYTejTbNTFGizk/TGzjLTtcwXhx2Lv9G8Cjs8KewgfAUAZ+V2XX33bzqsuPdD0RUBg/N+6EPVpRfgtZntZGoG60QCI/5/t3fzR114+fat97t+PltsS4Tq0ETWwx4/tcZuIAuBVwV6UPF6YWOZ6FDdi+5dteyrgM/nzUIWq57gNQo/4NTEBa6sXHqMf5YNQBAAsHz/ywjVv3bqv6YuAQNJf1PwHAaMEIabAxqh/vdg+GRuBWpcFEPp/9Bs/+EVO+WvFkfiRswVtReYgtl7fhD4XwLHjVcEpUQBLTOwJ2rsQtKGpYmb4+ZFyIczzPNk21HE/tr4OdvTflFD4P5YHKHsT0Bbp34IQ42dD+LsUf4szAjmRbAQQ/j/48v7rmjz2NwaBLzIgJNSHx/61R55cQhQghZgAWsGy4kaaCtkYiH322GdDf7Qh5eIJrYs6Wx/bbxXaMAE4phRBZx+k3hTgBsCmbwIESWck0x84kQ+9C7/H/B/J1gisFy8Gj/3te/7k++bFKGUiX9aeItBNSDEhRX0YBajyquCYcHmxCvVrgy62G9sm6kML2zy2nefD9rP5FHFH/1QTYMP8bY7+sZ03l1fnpWIo+ooACBFnUOG3mOPI0giEogEc/dvX/caAQHYt4n3hPweNQcqrgj0QJYpZkahVEbAiUoQzdDxdEPqMXIg/llA7y2Xnx65XhBd8awiawPX9iN6O9i0os86v0wbN/5qEGIaNUf96cTw4I5ATF1wWeOgrf/i7uPkPo3//ut8QEMmUUXaMJuu2jT8WGgK+KjglCkC8KIVELCSUMcpErkz0Ccplghqi6FjZ5vvYcqgPt4E6u3jKPntVYAS4NBV/sLq6GhR7O9oHVvS7EH5y8RkcB4UhR7HwjGbUX4QxAVkagdWzZz/9mQMvfCtl9A/sqLksEoD2sj5jwpqb//Sf9laOApCQ6FUVNS+MqetzPSu2TbDbQd5/NtZbfJ8iytqbAsG3SxvYu/9Dwu5H+7bM/Pe/98rxWaYFmn3DQvTLaEf9MYxRydEILJ3cdOam7/yV1bvmxWTKRvNWUIcmxYhYw4IoQOxVwR4reMxD2Ky4sd4Kps2HhNBuw+7DYvsQlNE/tk5V7DGE9kWY9308aOcyRcpe5GOFHqk1AiHD0JR2vmUhumVD+Kck/pacjcCZay65ZPXXr5mX4oxF0KuSctzswzT2qmCPFbIU8QsREmvWlW3Trou+IaGuCtbnNuz2mLf7BH5/vhzDb6ct2hzxA770h+H/MiFnuzUDNn/y8n/1J7NMC3RzBoVoh8kLvydnI0CmFLpvC35mpnhV8NGjR5OiABYrlpZQPfNos6Jpy0Ui6dtYRuq3WYTt69ex9bE+Y4PX/Nvi0kvXt4Xwvxd/ijphOST8AG8CBG3MAgjifx1CDEtWwu9xRiArqo70czAM+Mx2Ad99+tAFLwlKxQqzFU4v2GxDvRVt9mNdVWLrFG3L74vHxHwVUvr7/bVB2yN/D8L/XvBpCGKCD1iHFO8BuHf3J56ZNzWm2jcjRPdsjPrXi3ljTMCkjcDZt537kUq4DBDCG4YyQzAGw5ByDJge+NSplQ0xpLCFBM7WQdiw+H4UPN/O+hChfYXgNgHW4VKG3bdfh23++Px2uR7rfX/g1wn1aQKFn3f7t20EysL/th55lr0ZuOOOm/e3NQ0wKP+GheiHDeFfFPEn5jNP3giESBVs9vOGwIP2oU1A6jH+6eP7Zi8JsoIVEi/WWaGL1VEs/XZ8PVK7sC6E3YeH69g+se2k4NdFmUuMJvtLgSH/riIAfu7/EBR7n3ramgUQyACIMbCQwu9xRiAbysSSpPYDVfoOiX1JkBWxmOCij2/z4odySBBD9V60Y/sFsTbU222H9mHbge8DivbdNWXC3pXwg5RX/9rogE+tEVg+/sYTbV3/B8N9I0KsszDh/txpchmgCUNHA2IwClD1JUEUTy+YIQFlXZHgIrXrsm9oHYI2LgTbCK1j60LtRcfYBinibW/qs/2R70r8efc/PrcV8dDI3os9UuatcXju2f23z7OtcPFflBBC1OWcFlOQxyrMfYDPzs+PlwR5UsTQ94mtY8Xdgv52HfYLmQHA/ljQJyTcrGcbU2DrbL1dvwv8Hftlgs7r/BbU+e3UBcJP8Qd+7n8r6N4MoA11SL0p4BMAbXL+Wxofmg1QiIlx9qbNS2ufu3Ze6scEtHE5oO3jxDFxwbYxPXDVRwJToGATK7yEfexiKaqLbY+pXY/9bR0IbaNL6hqCtiIBeOyPC42AFX2Lr6f4W2MQW7cNkr+ZHK9NCiE6YK6lFMAcKTMMaOcCnt1zKGlioLpAZL34ss7CshfpGF7ggd8PsfsKrQf88fQJRZ5C79M2ofCfXjkfyi/C96EJsGagbBbBOgz3bQghFgIrhGOlqlGp2h8TA6VOD1wHiKwX5VidpUiQU9uY99sOkdKnCV7Mi8S9rZC/x4b/U0Wbo3wKPkWfaVdRABkAIUSr4DLA6q9dc4Ho5xoJiBH6vKnTA4eAyBYJsick0DF8X5ZDYo06LiFsfZVjKKKtEbq/zs/ttm0EUsP/wAs9UvTnAuz6+5f/4NA82wr1v5V+0H0AQkwYmoDUCECTSEFsXdQ32W5dYAKsEUAU4M0336wVBSgS3RC2b0yUgd9m1f2AWH9b7/tUMQQpAg0xDxkFrltkItowGHbUXyX8HxJ5YEf+zOMmwHfe9LHlWaElxm4AhBAZkBoBSO0XEvTYul6Ih+SZpw7Wmh64TcpMQCrNRvX19lkk1n6EH6INsbdY4Qc+/O+FPYYXfCv8BNMA77zq0gNtzQIIZACEEK0zexrg188/DdA2VQW9LAIQam8ramCP1U4P3Achsa8rvhZsl9vp67OA2Ije1nMJUWYQqoJQv09t+D8VK/jWNFgTwGmA58VWqPTN6UkAIUQVxjL6LjuGWHvblw6wvZcPHqk0MVAqISEOiX0bgm2324ahsKSM0iHkKf0I+1dZJxWIvRf8UPjfl4GtowlgnTUCALMA3vvA7Y+3NQ0w6M+61Uf3AZxndi50PsQUCN0M2DZdbhu0ZV7sdjAxEKcHLiLUXrROqhC3LdhtExqlpwi37WMFn/nQdtvAjvppBEJ3/1PQvegDL/wsexPQNlMwAOJCPotFRkDkRtdiXpW2IxfYHhZ8zpTpgUNCXUW82xjp901M6CnigMJu8yx7/HptEQvx2/C/F28v8MDWcQkJP2cBbPP6P5ABqMkILodsGIH1ohCLA81CTKTHZiY8oemB22bsI/0UysQ9NqpvU+xD+BG/NQSxu/+tqDPPFP25sGzTrpiKAZDQxVE0QIwWPzVwEWUjbivqbY/Oue0qxqGOybD7+eEPDi1t375tVhbrok1Bp4B7kfd9yoS+rL2I2Cjfg34wBCR2978V85DAe1Pgt7Hv4FPzXHtUNgC6EXCU6LKAGDV1xNLTtuhbuO0q+2DfKp8N63C9xx9//ugsIzawwg+8gFszEKKsvQpW1IE3BGy3qe3jR+9W0ENi702BX78LdAkgL3RZQIySKsJaRorgtrm/Mqrui8f/xpFjV3b1kqApYUUfC8pcqlJnnVQo8Hah+FP4bfif4h4S8pjYh4xBl0zJAEjY0lE0QIyGs287N7r59WvmpfHSRpQiBRsFaPqSoC4Fr0uKRN6P4m0/5mkWfN+uoMB7aARIKPwfMgJW4K34x4xBV9QyALoMMAl0WUCkgv/Lk/n/3NXovs+oAcH0wEePHq0dBehLANvAi31MxCnwKdhtDnkuEAlYXV0tFGxrDLzA2zabByhjFsB5sVWmdglAUYDq6LKAKMWY+m6MQEeD6z5G7Sn7qHoc6E/D8dijBxpFAaYCBTok8N4c+LIH7VXXKSM0yrd1sSgAWVu98KmL0Cg+JvioD/W3YBrgebY1ahsARQEmdw4UDRCF4O+5q7/p2aRAHVwG6GPUnrKPlD7WJKA/y3xJUJPn9puKX9fY47NGwFP1c3Q16qfY87o/r/UTXwZ+8h+KvBd7EBN525dwDoC2pwEGU4sAAI1m66PLAqKUzqIB3Q/WK1N15N4EbxJsGS8JwsRAdYQc6wwZ/k6Fn41pUUQAoI5LjDrnK4YX9aLRvy3b8L8VcD+it2moH+qYt8BY3HDTzi/Oi60yRQMwKiYaCdFlAVGIiwa08vfdJArQhVD3Kf5lnH9JUHUhr7NO21ghRr6qMNv+oc/T12f0wu7LIdDHh/8BRd6nAEIfMgK2TBgBuPGGW15p8z0AoJEBGFD8JF7toGiAKKQLI1AHGzJvk5TQvQXHwKUt+Nn+9PF9K5gYqM1RbVXa3jfNAAQcC/N2PxR31tnULn1ixZ/Cb82ABe02/M9RvE2ZJxB6LBR9Cr/vB3AD4DXXbd57/U3bx3MPgDjPgEaoDRQNEKU4I9CYOgJaVazLqLI9Hi/W4Xr2M9Q1BBR/gCjA+kuCLhTEPuG+Y/CYvDDb9ZBn2ebtuiHsOkMREvuY8BMf/g+lWKy4I891bN7C8qVnt92GtO33AIApG4BRidbETQBQNECU0jQawDkB2hbzNgmJuT1etFsjAJp+HqyP7eIlQYwChITQim5duI3UbbEPUhyTXcceI7dn+zNlHvjPFepv6doQUOCRcoERoBkoAn3eXF6dly4c9fs0JPBst3nCMh8BbDv8DxobgAyErzVyMAFmESII/s5z+n9vBZ/iXgTFug24HabnXxUcFh/Ue9EN4ettmdvw2yqDfe26se0WwXWQ+uMMkdKnCSGhpxEow/ehyFPQbQqs4BP2Yd6mABGAw8f3Hp4XW2XqlwBGF7qWIRKLgvlbn/Tfe52RfFG/KuYA2+G2kGJdRAEwMZAVSk+ZKFoRThVZLp6QoLMv22LrherHDEf+3hSETALAGxdDAm/rrMAD29cKve1n+yMCcPjV07fOi63SigGQ6F2IzodYFPC3XtUITGFqYAhxFSG3hMxBbFusp/gDviSoTMRZh9TnWQYhAS/Cr+9hm90uxd4vZVQ9tjbh6J0pRT408g/Vob8N/wMr+sAKeQi0h0S/L3K4CXCUN7DJBIhFoo4RSKFIhENtRf2rYEfmoM527TohUxADLwmyUYCQSLLOtxXVW0EuE2e/fhF2W1gvdgwhUkxC21jBt8KOfEjoY/i+XsiRclRvjQHK7OMNA4jluyAHAwDGbgJkBMRC4IxAkE0vnftB/I20S5pFwhlqqyK0XZNyLOgTMhc+CsCUgulFF6AOS0h4Q+sBlmNizW3a9dEXi69n6uvGhg3nI2/LKSDsD/jmv5CIA1/vRR+wzm6HdcDmu6A1A1D2n74HRmsCRnBuhOgV8zd/wd/9ttNnD1/7+VMzcWtrtN4HfRgLuw9EAQ69fGQjCmDFFHkr+h7fl2W/jk/Z7sUdsA7YNtRzvTJS+3VJbJTv61IiAXz234o48ELuBd33Cwk/YVsX0wCDViMAEro4sR9EIXLFmd/f3LJp0+f/h623fvyeB9/y76+86vKjsdHvohEzF/5VwRBdCq4VYOYBRdbWkVAdsW1F/Tzom9q/ynbbhoJuR/w0AyliX4QVciv6rAe2jNT3jYFZAJePHXlmXmydXC4BkFFGAYj7QRRiIeDf/aMf/eRnMJvZtbcsf23e1MvIOoUyI+Lbq/ZPxZ4PvCTo8OuIAmyZ11wsorFyndG23RaNhiVlm3X2OyR1wv94aZMN/1sht6Jvsf0A8+wfWw9s23XkeUwDPC+2SusGYAQCN2oTAMw5khEQC8Xu3btfvuvu27550y1XdhLSrEuZEfHtVfvX5cnHXlrCS4IsoZG0F95QnyJCwh0zF2PFj+RZtqldqog/r/uH3tjoRdwaAea9+Nt2m3rwCOCtN9691MU0wCC3CACZhAmQERCLCH7M3nLD1n24DDCvEgZrHvYdOLB04sSJWRQAIh0bYUOcm5gAv35d8a+yz7axoX0L631KI5AChJ8mAGnR3P8UfCwUep/avjYNgfcAdDENMOjEAIwgCjAZZATEIvLQ+9/xrxEFQKic4fK6YfOx0Mbx+22g/J1vH9h4VbAXaksd8bWmwq4f20cRddZpk5jwAyv+dvRv+8QIjf4p4ADibcWeedbbOtsP2HYP+2EWwC6mAQa5RgDA6KMAFmcEhMgWXAbYtuvYXuQx2sUyBRNQdoyhsH/VzxPahn1VcBsia7dBU+GpYybqrNMmXtRpCGxq8zQDMSD8WCj8NAJ89S8F2oq6FXrAPNuBbSuC/bq6/g86MwAjEbNJmQCgaIBYBHgZAPm2RL+N7RRtg+IcEukYVfrGwDG9fPDIxkuCmgrt0ELdFV7orSEICX2R+AMIvxV/5u3jf1bcbZ7C76liBGL1bZJzBIBM0gQoGiByB3c383HAOuIaoq4J4Hqx/aM9Zdt1928JHQtfElSFoUPyfUHBZx6CT/FvA478AfIUei5eyL3wsw8X9iN+/T7p1ACMSMQmZwKAogEiV3BT03333LeXTwO0IZzWSFSlaL0qx1Z3/9gHF27D7hd5TA+8deu2eU05GOmXmYApmwSKPgXfi741BlWB0Fvh5+if4X9iBd0Kua9H3pcBU8D1iS93QecRAJmAZrhogIyAyAbcB4DLAGN/MRAFua64x7AC78G+7AIQBahKWbh/ypcDrOBbMwAYCbD4chEUfI+/+x8CTqH2Am8FHHnfD9g+HtuvKxbhEoBlkiYA5GwEpvqdiGbgPoBvfPTEe/F2wLXPXTurKxLFIWlb/AG3yVG/3wfPhU0xPXCVKMAiYMXeGgHmfVoFGwWIzf1vxd63e9FnHesB2zy2T1e0/1cdYf4j/9n10uDMBHQuqJPEiOZYzmlTJv+dNGXA7/Q3hzjv7/vKF//lqbM/fnherPSSoDpQaEMUtTWhbLtsj/VDveWqq684+p//1Z+5EnMDLDpW+D2+jeUqJsBfAoABWF5e2RBsij1TYuuBbwO2PQb6HHjppaf+6q/e9Ksf/tj935pXt0pvEQAzeh0D+IGdbDQA4HyO7Jw2ZfLfSV3wmeefe3YOZpWZg89rxR8gEtDl5YAiIe5C/EGK+Bfh2/GSID898KJBEfejfsIyUtvX94tB4edlAKSos+F/QGEPCTxAvRV6pOxr80XwSZmuWLRLAJ7JC44xAdkYASOIWWM+58II/5jxo+2uqWs6QtMD50CqQFvhx+LLgHXA1qcCwbcRANz8R9G2gu5Tij7LHtbZ7cTAi4C6plcDMNIR6+QFx0UDcjAC2UcDFln4zWe/iK6jAEXEBNkbA1tuyzRUMQN4SdDRo0fPjUyrhbTHihftlM+EPlbkPWXtIezIP3YTIKDAh1JvBogVfmDF3/az4D0AeFS2q/cAgN4jAGM1AVimLjjOCORAdtEA83kWTvinihfnuiP3IqoaiccePTCbGCg3rHBbI+BNAfsg9W0kVh/Dir4d/TP87wU+lFLM2RcL8qz3/QDrQuBR2Xm2Exb9EoAnC8HJNRow5e/FHP/s88wqxSQoEueQGagq5nWiCHhJ0JtvvnlOSLZWFrquqXI86GtH6j7Pbdl6gHouLDeBgo/Uij9NQUjgQyn7WVFHHkuq6JM77rh5Px6V7epFQGAQAzDyUaqiAeNkkkZAwl+dIS8DhIDIdynq2H5RVCHUju0/89TBlTFGAbxYx4Bol/VluxV45tmWuj+PF3qUQ6F/O/mPF3afWkMQMwe+voyuXgQEFAGIo2jAOJmMQZPw54M1AWXiXiboVcH+QvvES4JOn16tLYBdExudewEnvn9sfYB1fXuV8xAT+9Don+F/YMXc19m2UBprj/HYE995s8vr/0AGoJjJiE0RLhqQjREYq0EzxyXhzwiKepvingINBRcCU/DSi4dHOzEQBdkLM8te2G1/tNky61jv1wV2nTK8+Fvht7Dei3WR2KONKWAKQnVD0u9f8pyJ/jjOhHMupJPGiGYuAjWK72bC57XXiYBS//9venFtafNvvN664EI4/TZDdWMiFAEAOOa/9V9/ZOn06ZV5zXix4h0Tat9WVEa+Dn70HxN/9PGT/wAr7kXYftYYpLBr17alI8cP/dEvffqWT+P12fPq1lEEIB38YGVzWcBEBHJg47tZL/aL+ZuYHcesUjTnnB63JcoQUIpoaJtl+4kJcJ/wGO2x4riqviRoKCjcXsCtkPs2lJHnAmy+DmXij3b2seF/4oWceaQ2z362DvjthYDp6AMZgOpkZQTOJbosUBOzLwl/B7R5MyBEs0zki2iybhsU7f/xx58/Os+OjiKhTjEERXC9qkD0uYRgvW0vEnGfRx/WIbV5kGIEitraRAagPhtGYL04TVw0IAcj0ItBk/BPnzGM6gmPpeyYaASsIcD0wGN9SVBM3EMiz9E+YR71XFgGti/r6mKjAoSz/4GYiNvU9rH1vi/xZUtRW5vIADQnm2hArkZgvdgO5ruW8PdBhxrd1qi+DSMREvYqPLvn0NLmzc1EsA1CAm7xIg5C/Qja7MI6T6jOkzLqt4TC/xRmL/Ze9G0Z2O3Y/ND0bgAy/fHsRGyGIEcjYES7NmYbs+96Vik65+xN535IRzQnQEjs2zISVcF+uW9MDzyGlwRZYQ+N1D1oQz+k7BcyCW0RGumHiBkFineK2CPlYrF9Y2Cd/ct/cGhe7AxFANoli2gAyMwIbBi0Ot+NhF+QocQ+hTG9JMiKPoTcirlvs8T6NQWCTvEvMwFot5P/hLAizxSLNQZ+AX69EGjbetnaC/fu/sQz86rOkAFon0ZiMzacEZg6G9/NerEcI/5CjBIbBeBLgoaGQk4Rj4k56tnmzYClqK0KRZcBCNr9q38BRRww71NCQ8DF4/tb0IZpgO+6+7ZvdjkNMJAB6I7KYjNmFvGygMR/HIxtauBUhrjJ8LtPH5pND9zm6DkFvz8v6khjx2TFHX2woM7X14WCXyb8lpBAU8jRxnyRuNvUrgtC61mWj7/xBGYB7HIaYNCrAVjQH1RFA8bJhkHz342pk/gvMEMIeF0YBcD0wCdOnLhAPNuiSIT9/li268SOKbRd1NUVfS/0qdf9AcP/XqAp3MC2od4KPNKQuHvht9vzsE/Xo3+gCEA/RMVmiuQWDcDC78YIv8R/RPQVBbCi3/R6v1/fG4ouDAa2+Z1vH1jBI4FVBDSlbxVTwe1hndC2UefrU44hBS/4VUb+sfC/F24r6EVtNg9YBqwbEhmAftkQm/XidMksGgAo+hL+BabLm/y63DawUYC1tbVKgl00Oi8T5lg76/22Wa5yfCHKhB3tVcSfWJH2ULRDom8FHzBv663o275DIQMwDIoGCFGVlgfMQ4f4uzIE+FwvH6w+MVBIyCHSIaG2fX17SPhRZxfWNSEW2q8r/KDs7n9ghdsKOqHgs832TxH9HTsuXdp38Kl5qVtkAIZjIxowdSPgogEyAqIT2p4ToOsR+RDwM33tkSdnaYwy8bXtob4x0fd9Wbb9Q4aiLeoKPwmF/wnF2wu7FXvAsu9v+9i8p+gY2qY3AzAXOYVXL2bDCKwXp0uGlwXE2Ohx0I6R9NBRgqrweJHyJUEQYb+UiTDa0Y/5MtgHKRe/H+b9dm2fujQZ9Xti4uzrvbBT+EP1NkU98yEQAegLRQDGgy4LCJFAX6KM0TSW2P5SjqPrY/Xb5zED+5IgL7YUYaRWkG09sXmPb7Pr+315bN+qUOwp/LwcUOWOfwvv/i/Ci3aRsCPFQhMAvCGIkWUEQCSR62UBIVoBlwHWPnftvNSMVHGmoHpi9X0SOgZ+Lr4kaNu27bMyoNjaUbfNE9TREITaCdtC2yXcTh2hB6GRfVPB92AfEF4vzrZsxRxQ8L2w+7pQnqknVt8VMgDjJCsjcC5RNECMjiYCTpEtMxFDmAS7T7wkCCKZKr5Fgm63wbzvF9qPrUM/u80UKPIhIwDQzjYbDagC3/znBbhMkNFO4Uc+tL5tZ55pCEwDPM92jgzAuMni/gAXDZAREM1IG7h3CkXWim1qRMGTul6dfrPpgd9YPic+W+c161jh9mJOUOYCrHB7EQ/1CWG3V5WQsFtTUGYUYnA9L95FIm2FvEjYbdm3FbHzqksPzLOdkrMByElocrwsICMgajGGNwTWFXsLt5EaJajbDy8JwvTAEGcKNFIr2l6UvZD79rL+AH3sPtrEinzdUT/B+kWT/xAr8myzfWw9+4b62XyMa966dd882yk5GwCQk9Dk+rSAjICoTnP9vYCqgl4kxqnbShX0pqS+JIgiTeEOmYC6gs71muKFnyBvy11gxdyaAWLr2TfUz+ZD3HDTzi/eeMMtr8yLnZKrAfhNikyGQpNFNAC470ecR8aohFkU4NfGNScAt9GWsDeJMuAY7HHgJUGbN2/eEGKbWnH2+djI3lK0jbbBSJ9C32TUb6ky+Y8VeORDZiBkBKrSx4uAQO4RgBkZGoFsbhIEGZq0uszOwfx8iDL6GUAPRltGAmB64NOnV2aCHhJ11oXaQ3Ve9EGorg38SL/utf4YZY/dUegBUyv+SG277U8jAFhXRJ83AIKFMADEGYEc0GODebAh/PNzIEQr0EQgmmBfElQk6mz3dan47fpyGSFhRx3rfXuTSEDK6N+LuRV44ttCwm/rYpw+sfm2a67bvLePNwGChTIAxAhNdkZgvThdMvxuypDw12T2hsBfu2Ymbk3C5YuCf0mQFfUqAg+4DaRe4P22UrdNYfcjfJRZFxJ7bwjahsJNYbeCbo2AzYMqwk8wC+DzP/zTnX2E/8FCGgBgfnSzMgIZRgNyNQKzzybh74cuDULX5qPI4KTsm/cDoC9fEgRRtsIdE3FfT7g+0lSBLwPiXibmbYt9yqx7IcGnqDO14u/bqtDnLIBgYQ0AcWKTA1ldFphnc2JD+CX+edDmtfoQFPAQKfu2BsK+JMgKd0zwi8S9LeG3+NE/6WKUnxL+t3gjwAVlLuzDFNh8GboHYCCMCcjOCKwXp4UxMPgcuSDhb5nUqYG7FukQKaPzPqCBwIJjwkuC7PTAli5EvQgIO8XdpzEzELoM0CcUdI7wUfZ11gywLgXcAzDP9oIMgMH8OGdlBKYUDXDCn4v4b4z614vFZGh8umUcOnsRQ5iOImhI8JKgoUWU4Dh4LKFj8uIPQnVlhEb7VcLtVtiZQuB9PUUfsK4KddZpggxAAGcEcmAjGjBWI5Cp8AON+rtmXDo7WmhI+JIgPz1wl8SEPLTQCCBPmhqWzVvW168a9icUdop+KAU2z5T4sqesvQtkAAowJkBGoCNyFn4sEv7uwdMAa7/ezhsCy6gb1h/L5QCClwRhYiASu9mvLUICnlKHMhZrBqrgBb+OEfCjcivwRSaA69n6ItB++ZVLugdgTJjRW5ZGYL3YP4sg/BL/HukpClA3rG/XG9IM8Dj8S4Lstf+2zQDFOyTiFPgYWKeu+AMv+EyrhP+9gNvUij/rbR7YfBFY7/vfe+V4X+8BADIAiTgjkAuDRAMyFX4g4R+I2ZwAA78gKJWh7w3g/r/37Kuz6YEJhb+NGwGtaFPgrdBbU2D7+nJb0AgwTcWKtxX7GCl9YmAOgLfc0J/4AxmAihgTkF00oGsjYPaRnfBjkfDnz9hC+U14+pnvbzt58kQn4f+yUb1NLUXrNcVHAVLwQs6yFfmQ6NM4+PWLOLNp5YU77rzl+b5eBARyNQCdhrfNKC9LI7BebA8n/DmJ/4bwS/xHQA/aPPTovS34OZ556uBsemDQ9iOAdUbyTUf/ReLO0X+du/8B8xT7UJl1FH62pYJpgPEioHmxcxQBaIAzArnQWjRAwi/6ZPaGwIlcBhgL9iVBbRIT8qYCX0bsmn+d0T+w4s08xT6U2nafT+Hw8b2H+3oPAJABaAFjAhQNmJOp8AMJv8gGXNLgS4K6AIJvlzKaXgKgwNtr/qireu3fQxG3wm5TQBPA1NZVoa/3AIDeDIARySwxopCVETCj+GSM+OfE7HuV8Itc4GUA/5Kgtgjd/FdG0whBKAJAEwDqzrXvBT9mCKwJIDY/NnozAItChkZgIxpQZgRMn5zEf0P4Jf7jZ0pPAxTRx82G3AdSviSoLl6464h/EyjwwIq+Ty246z6FkIBbQ4B2Cj9gf5bHjAxARzgjkANBI8CyEf6sxF/CP0E60s4+nwDo62ZD7gcvCWoy+rZC33QUXwc78mfein+I1GiAF3afAhoBK/q+PEZkADrGmIBcjQBFPyvhxyLhF5YhnwDownzg89gowEsvHj4nWM2nB+7bDHBkb8Xej/ZB3fA/hZ5iXiTq1hQAXx4bORuARjextYkZRWZnBNaz2bAh/BL/6cKnAfocsXdNV+YD2+W2674kCCJvhZ5l1tm2LrAjfkAjEDIBdfCjeivqXuBTTMKYyNkAjA5nBMS4kPCLhQMmiUYJLwl69ZWj58SrPArgRT1mHLq6B8CKO/NIrfjTEADbH6Re/wcUeaQQdiw2b7F9q4DtPP7y7/ceYpIBGABjAmQEhmdj1L9eFGJx8JEF/5KgGBB2O8oHvgxQ7sIEWHEnqLPib0Xfh/+rXA6gyFP4fR7QEACmwOaLwPpXH/uFY/Nib/RqADT6PY8ZbcoIDMOG8Ev886PPNwTmhH9JUBlW3GNC701BW1DgaQZQpvinUCcK4IWf2HrbHuobAuvjPQB9TgMMejUAAzCa+wBiOCMgukfCLxaS2D0R9j4A8ORjLxVGASjoFPxQNKAPOMr3RgDYOuaBFf2yKIAVb47kUUexD6V12XrZ2gvbdh15vs9pgEHuBmAyGBMgI9AdEn6xsPhwfwxGAWITA9mRvjcDfQOBp/Bz9M+UWKGvE/q3RoDETADbbJrKfffct3ee7Q0ZgBFhxElGoF02Rv3rRbEI6N0A1bCRALwquGxiIIh/36N/O5pn3tZ5Qm1VQv8gJORe9Flm3qapbNt1bG+f7wEAi2AARn8ZwOOMgKjPhvBL/EWOtP2oI7eH6YGPHz9WOD3wEKP+2GjfprbdQuGvEgUgFHNvBli2ZgD4fmXcccfN+5H2+R4A0Ps3KGFLx5wrna/qSPhF9qSG9asCI/Ddpw/NogBFI/y+Rv6A4g4o7jYNiX7d8L8lNLoH1hTYPt4MpPDYE995s+/r/6B3AyCqYURMRiCN2XmS8AuQy7sBhoCvCo6N9PsUf0Bxt6N8myfoR0MAQiH/KpcB7Gjeiz1gmaJfVfzBriuu/ul5tlcWxQBM7jKAxxkBcTEbwi/xFxeQz4SAncHQP+8DwII6vCp427btszZSFBHoAzvat3mAvDUDIDTyb3oZwIq+FX9rDIAvx1g+duSZebZXFAGYGMYEyAicR8IvRAP8pQSIP+oQBYDYMwpghd9HBpreE+CF28I238eWaQIA6r3Ic9Rf9SZAP6IPiX9M6P26Y2MQA2BErE8mHwUgRuwW3QjMPr+EXxSRy9MAHKX3AQ0B9olXBYcmBvJRgKZRASvgHrbZET9T5mkG2Jf4m/+qjv4p7qGUAu/TqTCIARDtsMBGYEP4cxP/XEyqaB8/Su8aGo66LwlqCgWdxASeRgD4NkDBrzryB1bQrcgz700BsPkU0H//8h8cmhd7ZTADYIRLNGSBjEDWwj8X/xzfsjg4uhmwPnhJEF4VzEcC2zADXtxDUMyt8MfWYz3TkOjbkX+qGQgJO1IssdG+NwdloP+O43/lPfNirwxmAAYim8sAIZwRyA0Jv2hEjiagq8sCfrvff+71pc2bt8zybdwAaEfqVtRDeWsEfJ6pXbgeRD4m+lUuA1DQbYrFmgCWLWwrY9eubUsnL/9XfzIv9sqiGYCFwJiAHIzAxqh/vZgPEv5+2fTSuR/p3zjc67X0runqsoDfLqYHXn9V8LoJaBOINogJvC0zb1OAvC0DHwWoIvoWCjsFH6nN2zbmq3Bm08oL9+7+xOI9BTDQaDXrKAAxo+WpmoAN4c9N/N2oX/TA1pVNJ6/9/KmjyPd9LT0X1l8V3J4B8EIeMgI+DbX59YuEPzX0TzH3qRV6i60LtReBWQCveevWfX1PAwzWz5jIFmMCpmIEFkX4F1L8hzA+2zdd8oWHnz392ZtuuXLfvEokEIoCvLl87JwItmMCioSceaQ2zzabWtg3Fv5PjQLYkT3TImH3/auAWQDxGuC+pwEGi2oAFiIKQIyYjt0ISPhF65xZOvvaXXff9k28bx3lnC4BdEHR+Vl/VXAzA2AF3abWCDDvBd5j+1qKogBVoOgjpQmIpexXBax7x5239P4aYDK4ATDC1DcLZQKAMwJjYmPUv17Mg4kIf5b3V1hWz55dxg8s3rd+5VWXH9UlgGLs+QlFAU6ePNHoSQAv7kitGYiVQyn7kJDw27C/zRdBIYdA25SExN/28f1jVDUMbTO4ARD9Y0zAGIxAtqP+c4lG/CMB11d3XnXpIKOs3MBLgvz0wFWgYNuUYh4TeeLbWQdQDgm/Hf2nRgIo4BRoK/Ix0Ua9X6+MVKPQFYtuABYuCkCM6A5lBBZh1C+GZ/Y3huuruNHqngff8u8RBdBlgDCh8+KjAJgeeG1tNTkKQKEmFGybso8Vd6Z2fdsP2HVBSPhZTh39Ayv4NqXI+5SkCr9l38Gn5rn+GYUBMEI0BAtrAoAzAn2wIfzz/WaDRv3j5dArB3fc+8Dtj197y/LX5lULQxWzk3J5BNvDS4JC0wMTK8oUei/eNvWib1OuT2yZfQAF35oApLY+FS/qRcLuTcCUGIUBEMNjTEAnRmDLpk2fP5dkK/wTHfVnF4GJgQgALgMgCjCvWggg1lXueYiZBWyDC1h/SdCFggoxJl6kAeuQepGP1SO1ecAyYb0d4YdEPzUCQLFnCnEvEni02b5VwHrfe/HLu+bF3hmNATACNAQLHQUgRpzbNAKzbT360U9+JnPh16h/5PAxKzwOWEUU61I28kZ7WZ+mVP2cqf1x3K8cWl6y9wJYUQYU5pBYU9BDwu5T2wd54MvAj/xtClLNAEXcCjtTC+rYh+uE+hVR1TC0zWgMwAiQCZjTkhGYrWu2lRUZCP/CjP4teN4ajwP2cR9AmZiivQ8j0hY0LDzmrz3y5CwFFGQQEmdb5/NFKfB5iy/7kT9TL/jWDBQRE2jUU/yb0HT9pozKABjRESPAiDeNgF08F7SbdbPCjfonCS7HDPHdjOG84XHAh97/jn89L27QpRko2nasrcnxdPlZALePdP1VwVs2BBpQwAFTL+a2nnUW2wfYPrYv817ofZoq+MCLsh3hE9TZ+rpCHjMYfTFK+znwD8VCjoyqMv+ONsj9nJnPO1nhNwzyNz7A/+vg53zky4+/+1/83ou/98x3Dt4NEcOIlqLW1Yic+0kltb/t1+ZniG2L9eSqq684+olfuP/K1dXVoJAT28a8FXiWfUpsOdQHAg+xjwl9UVsML/Ac8fsU2HwVLr9y6YWVS37wxV/9Ox/47zUT4DjQpYAE8MNql3l1lhjhkvhnQGjWNQhdG8JJvFBW3XZqf9uvzc+Qui28KvhHh9cnBvKizTzF2uaZsh7Yeq7Ldr8NmxKaANAkAgBCAs80JPR1xJ8MOT+FDIAQESD8A4xau0TRrTk33XH833Y5K2BX203Bm4+uwUuC+EigF3SbesEOldGXKeuIrWcKKO52lO9TQkNQBMUfWMFHyjZbz75VwXrLx448M+STKefP4oiY/0iFrjP3haIAC4wTfol/htx3z317q7wcqG9RbUIT85HyOf32MT3w8WMnZnkKtk2Zt6LtBZ4psWW7Xqy/FX/iowDA9wnhRZ9lK/RW/JkHtk8ZOC68B2CoFwGBURqAkSATsIBkKPxgcPE353Vwdu/e/fK2Xcf2zotJ9DGir2oyujAlZZ+T7Uht3+89++pseuDQCN2KvRd+lO06tp54sbf9IehW/ENinyL6Hgp5SPyJF3/gy0XwuIZ6ERA4f5ZHxgiiAEAmYEHA9zwmkWqJjScy1osLReHnxo8u3w44NBTyqiYjtX9X0Qu7XUwMtLJyal66UOCBF3GCeixW/IFfH/htMaUJsLBs632fEBRwm1L8mfcpYFoFHM/hE3sOYIKqeVXvjNYAjAiZgIxxwp/dqH9BxT8Jvh1wXmyNFMG1fayQVxXr1P5Vt5uCP268JAiPBFLQgRdylG27FXjg67k+sHm7HoTUj/Z9avsU4QWdQm8JiT37VDECKcfTNRee/ZExkigAkAnIjJyFH4uEvxiMum69fcd/qHIfQCopI/NYn9RRPSnrD2FGn6rbtRSZB7ttRAHOnDlzkahT9AHabDvNANt9GfjtAbRDQL2wc5Tv0ypiSzG3os7Rvm+zfQDLU2HUBgDIBIi2yVT4wShH/eZ8jwbcdIWXA43lMkAdUkb1VvjrRgFSzAP6YPuvv3b8nBiuRwEo4hRwCrttA74fyn6dEBR/K/YUep+yTwplo3iaAWCFv2w9D9Z5840zN8+LgzB6AwDwgzZ/mczQyARMGHx3YxSjFtCovwaIAnR1GWCMpAh5XWguOD0wBdzihd6ntp15v47FirwVfyv2zLOtDI7graCHBJ/4flUZcg4AcPFZHSmrZ88uz7NDIxMwQYzw5yT+G8I/VvEfyHAlmyH8AHdxGaAPUgW97si/DtgXXhKEiYGAFXMv9DGRZ9kSqgNW4ENinyr8JCbwSK3Ah4TfrzsFJmMA5v+hx3ApAMxMgIzA+DHfk4RfXAAuA9x1923f5KRA8+rsaDLyTzEP6GP38fjjzx+99NKLQ+5WxO2Ivkj4Y3hhD0UAmBJf9lDIKe5W5AHrfJ74chnfPfH7359nB2MyBgCMzQRgkQkYJ074sxL/qQj/FIzX7ntufHroMGxV+hzR1zEPmB4YUYCt2zZfNLr3oN4Lf6yvx4o+sXW+zZc9FHsr+iBmCIAvV+H+Gz7V3xcZYVIGYKQoGjAychV+LBrxtwuiAJiKdUqXAbq8ll8HHI83Jd9/7vUlRgGsyPvRfmjUX2YagBX6kOjb0b7NF8ERPNOQ2FszAGJ9y9i1a9vGNMBDzQIIJmcARhYFIDOxkQkYFmPEshR+iX8SlU0Sngb4cw+e+v0+LwP0OYrvYl92m8jDBFhjgumB8ZIgK+I0AiFhD9WFzAGAyGPxws6yNQTA5ovwIm7FnXkL+8faizizaeUFTAOMv7151SBMzgCAkZoAIBMwAE74sxL/qQr/lIwYngbwUYCuBbrPUXzKvqp+3pRt4iVBmB6Yok9BDwl7TOxjUOS92ANb9iYhRkzgi4SdbVXFH1x6dttt11y3ee+QswCCSRoAMHYTICPQD7kKP5YpCv/A1DpnCMHihSyYE4BRgD4Fegw0+bxYlwYCeW5r34EDs5cE+ZG/He2HRv5FeNFnmXlgRT9UF8KO/q3wM2/bbdnWVwERAKRDhv/BZA3AyJkJkkxAdxiTlaXwS/z7BTcDPvT+d/zrLu4F6DqaMAasgeDnRYqXBGFiIOAjADYqUAUr+tYMpBiBMvxonmJv623ZmoGqHD6+9/A8OxiTNgAjjgIQRQNaxgl/LuKflfBP0ZhhJFb1DYGpNBldTxEbBcD0wKurq8GRvhf/1GgARd+Lvxf5kBEowop5SNS9GWAflquASwDz7KBMPgIwBROARUagGZkKP9CIvx0aXzJBFMBeBmjKIoz8Y9goAF8SBEIiz7rUaECR+FPsreh7YxDDirsXeeDFv47wE14CGJrJGwAwARMANozAelGkkqvwY8lN+M13NUnavAzQ9sh/jIYi5Zj4kiAQEvkqwg8o+BT5kBFIFX0SEnyAeiv0bI/1T+X40SVFABYURQMSMecpS+HXqH9c4DLA29+19pUuXxDURMSndCnBHis+M14ShImBmhISeW8ECOtTsCN6pCwjtSLvhZ/lqlx+5dIoIgBZXZyaoFhsRC0kBus4Y5ST8IPsRvyWAf//tXZeD71ycMfv/c7X/8GffHXtV4++cfzKeXUWQIj7NhE0PNjvf/nX37908sTKrFwVK+40AdYMgFh9Fbz42xQU1VXh0KuvPIW5J/7uZ/+L/3leNQhZRQDmPwJjvxRgwY/lbDGj3YXEfP6Nc4L6TMgy3G8ZUPxbZ8ovCIoREv8m0YiqYF+cHjgVL+KxET3r2Z9prL+H4k1ht1jBt3kr+DafAveBuSdmmQHJ7hLABE0AucAIzH9Qs8Z91txEHyjcP0HwgiDeDNinSDYBx1l0rCHx7yMaYPcRe0lQDCvsdlQfKhMr+ra+CAqyF3YQEnfWcb2qVDUMXdJvPKhHjKhMmZmRyU08jLnJTfAtWY/4LQP/X2v9PO/Zs+eGr/7xnoe/+i9X/mFulwGGgubkwz9379JPXLOj8vP/VvSt+Ifq6gJhpqhbkbeCzXLILKSCdU/9+LU/uuP+U7//N3/lk1+aVw9CtjcBzn8UphgJsMxGxRwlc1lvmh7m+Gefa1aZH9mH+3Nn9+7dL8+zoiUYCcBLgi65pFx2KOYhUafgM8+UdUxTCYk98iBW9vVV2HrZ2gvbdh15HrNPzqsGI9sIADGCkxMXGJuxik3ArOQq+iDLaE0ZA///6sxoPfLlx9/99S+9+rknv/nazyoK0Bx7eeLnP/7upZ27ttR67t+O9EN1bQBxpxnwpsDX1QFPAOy+7+r/EU+cDG02szcAIFMTYAlGOvoSo4DQk5zPuWUhR/wj+H/V2XnXZYD2oQn4yVtuwXwLFz0RQDEnVtxjaREpfUhI9JsKveeVg0dXrrvxym0wADfc+fLf+8jH3/PI0O8CWAgDABbABITo6xLIop1XspCjfpLr6J8gCvAvfu/F33vmOwfvnleJmvgbFFOjACmib+uriD7xom/xRiCWrwIMwH0f2PLLH/7Y/d+aVw3GwhgAsKAmQLTPQgs/yHn0T2AAHv3Gcw+PeU6Avu7mb4o3AIgCPPjety+dXrlYQCn2xIs/83XEvowiQa8r+J4xGYCFmglw/oPR16hY5MlMeCT+eYs/wLsBbr19x3/AnABewMbCGMU/5Vz9cP/+oPiDFPEHVvztOlWgoNtRvU0B822I/9hYKAMAaAK2bNr0+fUaIZKAcexFeMbMIkXRcH2Wd2pPYZRdRl8mJnSuUMeFPPnYS0s7Lts2L12MH917I2BT3zcVjuq94FtD4IXf9k0F1//n2aXlY0eemWcHZ+EMAMCP+KMf/eRnzmUVDRBlbAj/oov/SOjVhF1/0/YDbb4hcEjGZmL2HTgQnBrYijxF36aAfazwsy0FK+pW5JFiocj7fsDWpYKb/5BiG6+9fPrWWeUIWEgDQOY/JDIBIoSE37Go99Dgme15djRUGc2P7fIFIwE4ru89++oKpwe2wg9QpuhbwWe7F3z2ScGLOU1AqJ7Y9lTsyB/UMQ9dstAGAMgEiAASfsdIxL/3SzDXvuUn3uB9APOqUVBlND+2kb8FrwrmvQChETzF34q+NQMktG4RXuAp7qF6S1UB58ifVDUQXbPwBgAYEyAjsNhsjPrXiwIs6sgf4D6Aex+4/fEuXxFcl7GN7OvAKMDmLeelKDSS93XWEIAqZoBizzzx4t8F2MeRK/7NFfPi4MgAzDEjPpmAxUSj/gAjEv/BjBmiAEjHdh9AlZH9mMwCj4XHjyjALDOHo3yb2nrgU0uozmIFnnmbQqStMcgZGQCHMQEyAouBRv0RJP7nufaW5a/l8orgLsxAlW1644J1f3T45JKNAlis2FszYFNg8ymEhJ5lbwzaZPvZlUfm2cGRAQiAHxtjBESebAi/xP9iFjnsH4KvCJ4XJ4cV3VDkoKkpSI1GxPaDVwXHXhJkxd6P/O1o3+ZjUOCRQtz9iJ+Cb/vVwd78Z/OYBAgpni6ZVQyMDEABxgTICOSDhL+EkYn/4KN/3AeAH2w8DcDLAF2MoockVcCb4vfD8htHjl35+mvHZ3mO9G1q64nNp+JH9jQCgGagDezNf/5GwHt3f0LzAEwFIxQyAdNHwl+CxD8M3tp23z337c3lMsAYQRSAlwG8+FPsrQnwbWX4Ub0Vf9CW+Bdxxx0370c0ifeVDI0MQCLGBMgITI+NUf96UYRQ2L8YvL71zz146vcRBeDINbdIQF/gvHGxUQDcC1Ak9iBkClLwo3874vdtbRC6DPDYE995E+nQbwEk/cR9MkM/lJNCwl/C/O8ZjOlvepTfG18T/N1vbv/Ui/uP3sqXBNEI9BVKzwGKP88dwEuCHnjo5qU3l1dnAk8TEEpT4Ug/lrJPG0Dofcjfcu+7b/53t737jb+OiNK8alD011oT86MJZAbGxyxSI/EvZqRmdrSm7dArB3e8/tqProIJePONMze/+NzlH6ERsEIGQmbAjnjFhcaJ+Q//3L1Lu3Ztu0Dkq4p+Km0JfypnLj3yR7/06Vs+LQOQEYoIjAoJfwIjHfWT0UdtaAS+/djz9z/3+PZPcX53bwYobFMU/dhx288Gmn4+bo/YKADw4m/LqcYgNvq3aZvYSADz2M/bb9/xW/d+YOm3ZQAyY+Q/qIuAhD+RkRvWyVyyoQmY5V88dfPTT73w4Ov7d30IZiBkBEQcmgier5//+LsLhb8OFHvStuiXgUcAt/7En/3jX/pbP/PPdA9ApsgIDIqu95cg8e8O3B8AI3Dw5f3X7Xv+5Pvs5YF5lxlNR8w5QwNw10//1Mo773zrNgh+W8JvBd+W24oA+Ov/tox9nL3i+d/65C/fPZrRP9BfYUfICAyGIgEBJvD3mI15Q2Rgz5MH74IROPzq6VsRFXjym6/9rDUCNjJg8+K8QfrLn3xPMNTfxBB4M9CW+JeBa/933H/q9z/y8fc8MpbRP9BfXMeYH14gM9AfMgLnmJARzS56Y+8ToBGIXR6g6C06PCfARgHqQLFn3tKm8Jfd+Q/xx1TSP/eJ3V8Y0+gf6C+uRxQVGISZEQCLZAYm9reW9aUbGAGkNAO4PLCyfPXtulcgjo8C1B31exPQ9Yjfm4FDr77yFOaOGKP4A/21DYCMwGBkHxWY4N/Wwty3YY0A0j/bu/mjj37jB7/ojcCUTEDIuDT5DFyX2/WPBKYaASv8IFTuGtz0t3LJD744tuv+FhmAATE/1kBmoD+yE52JmsqFEf8QuGkQKaMCsZsGcyBkFMrAOlddfcXRD37wriubXAaw9BX6p/g/9P47vrD7nhufHtN1f4sMwEhwZgDIEHRLFpcGJhxNWmjxt/h7BTjLINpyNAMp0DCAqlEAjvbtqL/rEb81A1MRfyADMFIUHeiVSZmBqf9tbNm06fOPfvSTn5kXxZzQTYP79p75S/sOjOLNsa3CUH8Z6IeJge554G2V7wHwRqAoTaXshj8r/h/+2P3fmlePFhmACRCIDgCZgm4YnRnIMDqk0X8JnFMgNrlQ3WvsU8JGATAxUCoUdmIFvqrgVwHbfv6Nf/xP/6tf/m//l7GP/IkMwEQZqSmAeOZkTDbMAOlauBbA7En8Ewk9PeDfPTA1I1DnmLFOnUcCKfR1R/spMCKAbZ/68WujfNa/CBmAjIiIh6WpkFwkiBb8sJtjyEm0LBecgzbEzH1vuZ43IPGvCS8PICrw6Deee9jfMDjVqEDZcaMdoI+dGCiEFfkuxJ74ywBTFX8gA7BAJBiEQqr8eM/3lbOYkUJTlMhCnCeJf3PsfQIpTw5M1Rh4UqIAFHwIMqEZYL4LxjrLXwoyAKIzFsgEiGIk/i3jjQAmFvLTDY+VqqaEUYCURwK9CWhT9HMa+RMZANEpMgGLC+72Xz17dlni3x0hI5DbDYM0AMA/EkiKRv+2rQ1DACNw09uv2bb1srXZ2/3GOstfCjIAonNkAhYSjfp7xN4w+NU/3vPwlJ8csMdqxR/4RwIp8sSLflNij/1N7XG/GDIAohdkAhYKif9AWCOAqMBzj2//lDUCs04TwAu/BVEAir41AF78Y/V1oRmA+O85+Ltfm9LjfjFkAERvyAQsBBL/kQAzwNcST3Gq4ZgJYBRgeXllQ+QtbQl+CGwXz/r/3Af/8h9P9bq/RQZA9IpMQNZI/EfI1I0AsGYAlwc+9vMPzEvrgg/siB+0OeqfFyd9x38IGQDROzIB2TF7FFLiP27Kbhicdxscew8AoQFAPfJ4JBA34sXEvosIwA+P/+4/vXf3J575pb/1M/8sB/EHMgBiEGACtmzatGv17NlPz6vENNGof0LwHgEQu08gJMBDwuPxKaIAEHmKvU9JHTPgR/58r39O4g9kAMSgKBowaST+E8bfMDjmywPWlCAPeDNgVXGvArZ/4KWXZuI/5cf9YsgAiMGRCZgcCvlnBi8P+KmG0caoACiLDFih7hLshxMD8WZAGgHm2zAHuON/6s/6FyEDIEaBTMBk0Kg/Y+x9Anwlsb9PINUMdEksCtBU9G3oP3fxBzIAYjTMTQCQERgfGvUvGPaVxG++cebmsumG+xr9E+wPjwTeufv61kb8ZBHEH8gAiNEhIzA6NOpfUBARwE1vMANjenrARiF4M2Bb2Fn+pj7RTxkyAGK06LLA4GjULzaw9wkgKhC6PNA3MAL+kcAmLJL4AxkAMWoUDRgMjfpFEGsEMLnQUNMNN40C+Ef9cAnh7BXP/9att+/4D7lM9FOGDICYBIoG9IZG/SIZ3icAI4CbBr/7ze2fsk8PzDpFqHPPANex67YRBcDIf/nYkWdymuUvBRkAMRkUDegUCb+oTezpgWe+c/DueZfKpBoE9qt7LwBG/nyv/70P3P54zjf9eWQAxOSQEWgPvbNftAmMAFK8e6CP+wQg/qTuxECY3//aW5a/lvsd/yFkAMRkMUYAyAxUQyN+0Rk0AogKfPWP9zzsjUBsdJ866ifWAGBioL/wF951ZaoBgFnIeZa/FGQARBYoKpCMhF/0hjUCfrph1BeZgRih/jQCVaIAi/KsfxEyACIrZASiSPjFoPj7BKrcMFiEjQLYiYGKkPivIwMgskSXB2bMRB9I+MVY8EYAswyGXkJEYU+JDlgTgChACD72J/E/jwyAyJ4FNAMa7YtJYM2AnWUw9vRAUfifFEUBONHPJ3/57t9edPEHMgBioXBmAORgCDZG+kDCL6aEvU8gNstgSPgt1gSg34c+fM+8dB5O9LMos/ylIAMgFpqJRgck+CJLGBFAHlGBlFkGfQQA+ImB7LP+izTRTxkyAELMCUQHwNCm4AKxBxJ8sQhglkGkjAr4mwYp/IwM+CgAJway4r9oE/2UIQMgRAERUwDaNgYXCT2Q2ItFJ3TT4HN/suvvH3nzR0dDUQEaAT4SKPGPIwMgRA0KjEEtJPRClAMzwFkGYQRw0+CT33ztZ70RgAnAZYBrb/7xlxd1lr8UZACEEEJMitjTA2jDZYKbbrly31tu2LpPI/9iZACEEEJMktATBIgM7Lzq0gN33X3bN3W3fzEyAEIIISaPfYIAXPuWn3hD4i+EEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBDtsLT0/wMCWCYCfKqlEwAAAABJRU5ErkJggg==
-"""
+def resource_path(name):
+    """
+    Returns the path of a bundled resource (next to main.py, or in the PyInstaller unpack folder).
+    """
+    base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, name)
 
-REQUEST_LIST_NAME = '_request list_'
-REQUEST_NUMBER_HEADER = r'# <span style="color:gray">_</span>'
-REQUEST_FOOTER = '# <span style="color:green"> + </span>'
 
+def load_icon():
+    # QIcon reads the PNG itself; the application icon is loaded once and inherited by the windows
+    return QIcon(resource_path(ICON_NAME))
 
-def load_icon_from_base64():
-    icon_data = base64.b64decode(ICON_BASE64)
-    pixmap = QPixmap()
-    pixmap.loadFromData(icon_data)
-    return QIcon(pixmap)
 
+class PipelineWorker(QThread):
+    """
+    Runs a pipeline task on a background thread so the window stays responsive.
 
-def load_config():
-    config = ConfigParser()
-    config.read(CONFIG_PATH)
-    return config
+    The task is called as `task(progress)`, where `progress(stage, done, total)` is passed
+    down to the converter functions. Cancellation (`requestInterruption()`) is checked on every
+    progress call, i.e. between stages and between page writes.
+    """
+    progress = Signal(int, str)  # percent, stage description
+    succeeded = Signal(object)  # task result
+    failed = Signal(str)  # error message
+    cancelled = Signal()
+
+    def __init__(self, task, parent=None):
+        super().__init__(parent)
+        self.task = task
+
+    def run(self):
+        try:
+            result = self.task(self.report)
+        except ConversionCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(result)
 
+    def report(self, stage, done, total):
+        if self.isInterruptionRequested():
+            raise ConversionCancelled()
 
-def save_config(config):
-    with open(CONFIG_PATH, 'w') as f:
-        config.write(f)
+        if stage == STAGE_PAGE_WRITE:
+            # Page writes fill the whole bar on their own
+            percent = done * 100 // max(total, 1)
+            self.progress.emit(percent, f"{stage}: {done}/{total}")
+        else:
+            # A stage converting turn by turn reports its turns, the bar moves within its share
+            index = CONVERSION_STAGES.index(stage)
+            percent = (index * max(total, 1) + done) * 100 // (len(CONVERSION_STAGES) * max(total, 1))
+            self.progress.emit(percent, f"{stage}: {done}/{total}" if total > 1 else stage)
+
+
+class WatchWorker(QThread):
+    """
+    Runs a `watcher.FolderWatcher` until interrupted (`requestInterruption()`), passing its events
+    to the GUI thread.
+    """
+    event = Signal(str, str, str)  # event, file path, detail
+
+    def __init__(self, watcher, parent=None):
+        super().__init__(parent)
+        self.watcher = watcher
+        watcher.on_event = self.event.emit
+
+    def run(self):
+        self.watcher.run(self.isInterruptionRequested)
+
+
+class SearchDialog(QDialog):
+    """
+    Searches the exported requests and answers while typing (see `searchindex.SearchIndex`);
+    a double click or Enter copies the wiki-link of the hit.
+    """
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.setWindowTitle("Поиск по экспортированным чатам")
+
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("Слова из запроса или ответа, например: kafka партиции")
+        self.results = QListWidget()
+        self.status_label = QLabel(f"Запросов в индексе: {len(index)}")
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.query_input)
+        layout.addWidget(self.results)
+        layout.addWidget(self.status_label)
+
+        self.query_input.textChanged.connect(self.search)
+        self.results.itemActivated.connect(self.copy_link)
+        self.finished.connect(lambda _result: self.index.close())
+        self.resize(900, 500)
+
+    def search(self, text):
+        self.results.clear()
+        for hit in self.index.search(text, 50):
+            item = QListWidgetItem(f"{hit.link}\n    {' '.join(hit.snippet.split())}")
+            item.setData(Qt.UserRole, hit.link)
+            item.setToolTip(hit.source)
+            self.results.addItem(item)
+        self.status_label.setText(f"Найдено: {self.results.count()}" if text.strip() else "")
+
+    def copy_link(self, item):
+        link = item.data(Qt.UserRole)
+        QApplication.clipboard().setText(link)
+        self.status_label.setText(f"Ссылка скопирована: {link}")
 
 
 class GPTToMarkdownApp(QWidget):
@@ -64,24 +150,41 @@ class GPTToMarkdownApp(QWidget):
         super().__init__()
 
         self.md_text = ""
+        self.turn_count = 0
         self.file_path = ""
-        self.now = None
-        self.page_groups = []
         self.base_path = ""
         self.ui_type = ""
 
         self.test_list = {}
 
-        self.config = load_config()
+        self.worker = None
+        self.watch_worker = None
+        self.widget_states = []
+        self.perf_report = None  # shown by «Подробности»: the last conversion or export
+        self.conversion_report = None
+
+        # config.ini is compiled once and taken again only after it changes (see `reload_config()`)
+        self.config_file = SettingsFile()
+        self.cache = None
+        self.cache_location = None
+        if not self.reload_config():
+            # The error is shown; conversions and exports report it again until config.ini is fixed
+            self.config = Settings()
+            self.reopen_cache()
 
         # main window setup
         self.setWindowTitle("GPT chat MHTML → Obsidian Markdown")
-        self.setWindowIcon(load_icon_from_base64())
 
         # widgets setup
         self.mhtml_load_file_btn = QPushButton("Открыть и преобразовать MHTML файл")
+        self.clear_cache_btn = QPushButton("Очистить кэш")
+        self.details_btn = QPushButton("Подробности")
+        self.search_btn = QPushButton("Поиск")
         self.mhtml_path_label = QLabel("")
 
+        self.watch_cb = QCheckBox("Следить за папкой загрузки и преобразовывать новые файлы автоматически")
+        self.watch_label = QLabel("")
+
         self.split_pages_cb = QCheckBox("Разбить по страницам")
         self.start_page_number_input = QLineEdit()
         self.apply_start_request_number_cb = QCheckBox("Применить к запросам")
@@ -91,19 +194,39 @@ class GPTToMarkdownApp(QWidget):
         self.range_input = QLineEdit()
         self.unique_sort_cb = QCheckBox("Сортировать и удалить дубликаты запросов внутри страницы")
 
+        self.incremental_cb = QCheckBox("Обновлять постоянную папку exported_<имя файла> (перезаписывать только изменённые страницы)")
+
         self.md_path_label = QLabel("Путь не выбран")
         self.md_choose_btn = QPushButton("Указать папку сохранения")
 
         self.save_label = QLabel()
         self.save_btn = QPushButton("Сохранить")
 
+        self.progress_bar = QProgressBar()
+        self.cancel_btn = QPushButton("Отмена")
+
         # widget properties
         button_height = 40
         self.mhtml_load_file_btn.setFixedHeight(button_height)
+        self.clear_cache_btn.setFixedHeight(button_height)
+        self.details_btn.setFixedHeight(button_height)
+        self.search_btn.setFixedHeight(button_height)
         self.md_choose_btn.setFixedHeight(button_height)
         self.save_btn.setFixedHeight(button_height)
 
         ## sub layouts
+        # sub layout for file loading
+        load_row = QHBoxLayout()
+        load_row.addWidget(self.mhtml_load_file_btn, 7)
+        load_row.addWidget(self.search_btn, 1)
+        load_row.addWidget(self.clear_cache_btn, 1)
+        load_row.addWidget(self.details_btn, 1)
+
+        # sub layout for the watch mode
+        watch_row = QHBoxLayout()
+        watch_row.addWidget(self.watch_cb, 1)
+        watch_row.addWidget(self.watch_label, 1)
+
         # sub layout for page options
         page_row = QHBoxLayout()
         page_row.addWidget(self.split_pages_cb, 1)
@@ -131,11 +254,18 @@ class GPTToMarkdownApp(QWidget):
         group_layout_export.addWidget(self.page_name_template)
         group_layout_export.addWidget(QLabel())
         group_layout_export.addWidget(group_box_pages)
+        group_layout_export.addWidget(self.incremental_cb)
+
+        # sub layout for background task progress
+        progress_row = QHBoxLayout()
+        progress_row.addWidget(self.progress_bar, 9)
+        progress_row.addWidget(self.cancel_btn, 1)
 
         # main layout
         self.layout = QVBoxLayout()
-        self.layout.addWidget(self.mhtml_load_file_btn)
+        self.layout.addLayout(load_row)
         self.layout.addWidget(self.mhtml_path_label)
+        self.layout.addLayout(watch_row)
         #
         self.layout.addWidget(QLabel())
         #
@@ -150,14 +280,20 @@ class GPTToMarkdownApp(QWidget):
         #
         self.layout.addWidget(self.save_label)
         self.layout.addWidget(self.save_btn)
+        self.layout.addLayout(progress_row)
         #
         self.setLayout(self.layout)
 
         # event connections
         self.mhtml_load_file_btn.clicked.connect(self.handle_mhtml)
+        self.clear_cache_btn.clicked.connect(self.clear_cache)
+        self.details_btn.clicked.connect(self.show_details)
+        self.search_btn.clicked.connect(self.show_search)
         self.md_choose_btn.clicked.connect(self.choose_folder)
         self.save_btn.clicked.connect(self.save)
+        self.cancel_btn.clicked.connect(self.cancel_worker)
         self.split_pages_cb.stateChanged.connect(self.on_checkbox_toggled)
+        self.watch_cb.toggled.connect(self.on_watch_toggled)
         self.range_input.textChanged.connect(self.on_range_input_change)
         self.start_page_number_input.textChanged.connect(self.on_start_page_number_input_change)
 
@@ -172,6 +308,8 @@ class GPTToMarkdownApp(QWidget):
 
         # set initial state
         self.activate_all_widgets(self, False)
+        self.progress_bar.setVisible(False)
+        self.cancel_btn.setVisible(False)
 
     def on_start_page_number_input_change(self):
         if self.start_page_number_input.text().strip() not in ("1", "") and self.range_input.text() == "":
@@ -194,6 +332,25 @@ class GPTToMarkdownApp(QWidget):
             self.unique_sort_cb.setChecked(False)
             if self.start_page_number_input.text().strip() not in ("1", ""):
                 self.apply_start_request_number_cb.setEnabled(True)
+        self.validate_range()
+
+    def get_range_error(self):
+        """
+        Checks the range field against the requests of the converted chat.
+
+        Returns:
+            str: Error message or '' (also when pages are not split or the field is empty).
+        """
+        text = self.range_input.text()
+        if not self.split_pages_cb.isChecked() or not text.strip():
+            return ""
+        return check_page_groups(text, self.turn_count)
+
+    def validate_range(self):
+        # Live feedback while typing: red frame and the error in the tooltip
+        error = self.get_range_error()
+        self.range_input.setStyleSheet("QLineEdit { border: 1px solid red; }" if error else "")
+        self.range_input.setToolTip(error)
 
     def on_checkbox_toggled(self, checked: bool):
         if checked:
@@ -206,12 +363,17 @@ class GPTToMarkdownApp(QWidget):
             self.page_name_template.setEnabled(False)
             self.start_page_number_input.setEnabled(False)
             self.apply_start_request_number_cb.setEnabled(False)
+        self.validate_range()
         # print("✅" if checked else "❌")
 
     def activate_all_widgets(self, parent: QWidget, status: bool = True):
         for widget in parent.findChildren(QWidget, options=Qt.FindChildrenRecursively):
             widget.setEnabled(status)
             self.mhtml_load_file_btn.setEnabled(True)
+            self.clear_cache_btn.setEnabled(self.cache is not None)
+            self.details_btn.setEnabled(self.perf_report is not None)
+            self.search_btn.setEnabled(True)
+            self.watch_cb.setEnabled(True)
         if status:
             self.range_input.setEnabled(False)
             self.unique_sort_cb.setEnabled(False)
@@ -223,6 +385,33 @@ class GPTToMarkdownApp(QWidget):
             self.unique_sort_cb.setChecked(False)
             self.apply_start_request_number_cb.setChecked(False)
 
+    def reload_config(self):
+        """
+        Takes config.ini again if it changed since the last conversion or export, so edits of the keywords,
+        [Hard_replacements] or `tag_string_len` apply without a restart.
+
+        Returns:
+            bool: False if the changed file is invalid (the error is shown).
+        """
+        try:
+            self.config = self.config_file.get()
+        except SettingsError as e:
+            QMessageBox.critical(self, "Ошибка", f"Ошибка в config.ini:\n{e}")
+            return False
+        self.request_md_tag = self.config.get("Settings", "request_md_tag", fallback=".")
+        self.test_mode = self.config.get("Settings", "test_mode", fallback="")
+        self.reopen_cache()
+        return True
+
+    def reopen_cache(self):
+        """
+        Opens the conversion cache again if [Settings] `cache_dir` / `cache_max_mb` changed.
+        """
+        location = cache_location(self.config)
+        if location != self.cache_location:
+            self.cache = open_cache(self.config)
+            self.cache_location = location
+
     def choose_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Укажите путь к проекту Obsidian", self.export_path)
         if folder:
@@ -231,6 +420,80 @@ class GPTToMarkdownApp(QWidget):
             self.config.set("Settings", "default_save_path", folder)
             save_config(self.config)
 
+    def clear_cache(self):
+        if self.cache is None:
+            return
+        freed = self.cache.clear()
+        QMessageBox.information(self, "Кэш", f"Кэш очищен: {freed / 2**20:.1f} MB\n{self.cache.cache_dir}")
+
+    def show_details(self):
+        """
+        Shows the performance report of the last conversion/export: time, CPU, peak memory
+        and sizes per stage (peak memory and profile only with `perf_memory` / `perf_profile`).
+        """
+        if self.perf_report is None:
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Подробности: " + os.path.basename(self.perf_report.source))
+        text = QPlainTextEdit(self.perf_report.format())
+        text.setReadOnly(True)
+        text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(dialog.reject)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(text)
+        layout.addWidget(buttons)
+        dialog.resize(900, 500)
+        dialog.exec()
+
+    def on_watch_toggled(self, checked: bool):
+        """
+        Starts or stops watching `default_load_path`: new MHTML files are converted into the stable
+        `exported_<file name>` folders of the Obsidian project (see `watcher.FolderWatcher`).
+        """
+        if checked:
+            if self.watch_worker is not None:
+                return  # still stopping, will not restart until finished
+            watcher = FolderWatcher(
+                self.load_path, self.export_path, watch_options(self.config),
+                jobs=self.config.getint("Settings", "watch_jobs", fallback=2),
+                settle_seconds=self.config.getfloat("Settings", "watch_settle_seconds", fallback=3.0),
+                use_cache=self.cache is not None)
+            self.watch_worker = WatchWorker(watcher, self)
+            self.watch_worker.event.connect(self.on_watch_event)
+            self.watch_worker.finished.connect(self.on_watch_finished)
+            self.watch_worker.start()
+            self.watch_label.setText(f"Слежение: {self.load_path} → {self.export_path}")
+        elif self.watch_worker is not None:
+            self.watch_cb.setEnabled(False)
+            self.watch_label.setText("Слежение останавливается: ждём текущие преобразования…")
+            self.watch_worker.requestInterruption()
+
+    def on_watch_event(self, event, file_path, detail):
+        name = os.path.basename(file_path)
+        if event == EVENT_QUEUED:
+            self.watch_label.setText(f"В очереди: {name}")
+        elif event == EVENT_CONVERTED:
+            self.watch_label.setText(f"Преобразован: {name} → {detail}")
+        elif event == EVENT_FAILED:
+            self.watch_label.setText(f"Ошибка: {name}: {detail}")
+
+    def on_watch_finished(self):
+        self.watch_worker.deleteLater()
+        self.watch_worker = None
+        self.watch_cb.setEnabled(self.worker is None)
+        if self.watch_cb.isChecked():
+            self.watch_cb.setChecked(False)
+        self.watch_label.setText("")
+
+    def show_search(self):
+        path = index_path(self.export_path)
+        if not os.path.isfile(path):
+            QMessageBox.information(self, "Поиск", f"Индекс поиска ещё не создан — он появится после первого экспорта:\n{path}")
+            return
+        SearchDialog(SearchIndex(path), self).exec()
+
     def get_start_page_number(self):
         if not self.split_pages_cb.isChecked():
             spn = 0
@@ -242,335 +505,134 @@ class GPTToMarkdownApp(QWidget):
                 self.start_page_number_input.setText("1")
         return spn
 
-    def parse_page_groups(self, text: str):
+    def start_worker(self, task, on_success, error_title):
         """
-        Parses a string of page number groups and returns either unique sorted sets or ordered lists.
-
-        The input string may contain comma-separated numbers and ranges (e.g., '1-3,5,(7,9-11)').
-        Parentheses indicate grouping of requests into one page.
+        Runs `task(progress)` on a `PipelineWorker`, locks the widgets and shows the progress bar.
 
-        Returns:
-            Tuple[List[List[int]], List[str]]:
-                - groups_set or groups_list: List of groups containing integers.
-                - groups: Corresponding raw group strings.
-
-        Raises:
-            ValueError: If a non-numeric value or invalid range is detected.
+        Args:
+            task (callable): Pipeline task, receives the progress callback.
+            on_success (callable): Slot called with the task result in the GUI thread.
+            error_title (str): Title of the error dialog.
         """
-        # whether the "unique sorted" checkbox is enabled
-        unigue_sorted = self.unique_sort_cb.isChecked()
-
-        # Remove all spaces from the input text
-        text = text.replace(' ', '')
-
-        # Final output containers:
-        groups = []  # String representations of groups (for display or debugging)
-        groups_set = []  # Lists of unique, sorted integers per group
-        groups_list = []  # Lists of integers in the order they appear (with duplicates)
-
-        # Regex pattern: match either a bracketed group (e.g. (1,2,3)) or a single element
-        pattern = r'\((.*?)\)|([^,()]+)'
-        matches = re.findall(pattern, text)
-
-        for group_str, single in matches:
-            # Use the group in parentheses if found, otherwise use the single value
-            raw = group_str if group_str else single
-            items = raw.split(',')
-
-            group_set = set()  # To store unique integers
-            group_list = []  # To store integers in order of appearance
-
-            for item in items:
-                if '-' in item:
-                    # Handle a range like "5-8" or "10-7"
-                    start, end = item.split('-')
-                    try:
-                        int(start)
-                        int(end)
-                    except ValueError:
-                        QMessageBox.critical(self, "Ошибка",
-                                             f"Некорректный диапазон:  {start}-{end} . Проверьте формат ввода.")
-                        raise
-
-                    # Support both ascending and descending ranges
-                    if int(start) > int(end):
-                        group_set.update(range(int(start), int(end) - 1, -1))
-                        group_list.extend(range(int(start), int(end) - 1, -1))
-                    else:
-                        group_set.update(range(int(start), int(end) + 1))
-                        group_list.extend(range(int(start), int(end) + 1))
-
-                elif item:
-                    # Handle individual number
-                    try:
-                        int(item)
-                    except ValueError:
-                        QMessageBox.critical(self, "Ошибка",
-                                             f"Некорректный номер запроса: {item}. Проверьте формат ввода.")
-                        raise
-
-                    group_set.add(int(item))
-                    group_list.append(int(item))
-
-            # Store processed group information
-            groups.append(raw)  # Original raw string for this group
-            groups_set.append(sorted(group_set))  # Unique, sorted version
-            groups_list.append(group_list)  # Full list with duplicates in input order
-
-        # Return result based on checkbox state
-        if unigue_sorted:
-            return groups_set, groups
-        else:
-            return groups_list, groups
-
-    def save(self):
+        # Remember the widget states to restore them as they were after the task
+        self.widget_states = [(widget, widget.isEnabled())
+                              for widget in self.findChildren(QWidget, options=Qt.FindChildrenRecursively)]
+        for widget, _enabled in self.widget_states:
+            widget.setEnabled(False)
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("%p%")
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setEnabled(True)
+        self.cancel_btn.setVisible(True)
+        self.cancel_btn.setEnabled(True)
+
+        self.worker = PipelineWorker(task, self)
+        self.worker.progress.connect(self.on_worker_progress)
+        self.worker.succeeded.connect(on_success)
+        self.worker.failed.connect(lambda message: QMessageBox.critical(self, error_title, message))
+        self.worker.cancelled.connect(lambda: self.save_label.setText("Операция отменена"))
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.start()
+
+    def on_worker_progress(self, percent, stage):
+        self.progress_bar.setValue(percent)
+        self.progress_bar.setFormat(f"{stage}  %p%")
+
+    def on_worker_finished(self):
+        for widget, enabled in self.widget_states:
+            widget.setEnabled(enabled)
+        self.widget_states = []
+        self.progress_bar.setVisible(False)
+        self.cancel_btn.setVisible(False)
+        self.worker.deleteLater()
+        self.worker = None
+
+    def cancel_worker(self):
+        if self.worker is not None:
+            self.cancel_btn.setEnabled(False)
+            self.worker.requestInterruption()
+
+    def closeEvent(self, event):
+        # Do not leave the pipeline running without the window
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.worker.wait()
+        if self.watch_worker is not None:
+            self.watch_worker.requestInterruption()
+            self.watch_worker.wait()
+        super().closeEvent(event)
+
+    def get_export_options(self):
         """
-        Processes the current Markdown text, splits it into blocks based on headers,
-        and prepares each block for export with new headers and request IDs.
+        Collects export parameters from the widgets.
 
-        Generates page groups and passes them along with the processed content
-        to `merge_blocks()` and then to `save_blocks()` for writing to disk.
+        Returns:
+            ExportOptions: Current export parameters.
         """
-        # Determine the starting request number
-        if self.apply_start_request_number_cb.isChecked():
-            rqn = int(self.start_page_number_input.text().strip())
-        else:
-            rqn = 1
-
         # Get and sanitize the page name template
         page_template = self.page_name_template.text().strip()
         page_template = 'page' if page_template == '' else page_template
         self.page_name_template.setText(page_template)
 
-        # Get current timestamp and create base export directory
-        self.now = datetime.now().strftime("%Y%m%d%H%M%S")
-        self.base_path = os.path.join(self.export_path, f"exported_{self.now}")
-        os.makedirs(self.base_path, exist_ok=True)
-
-        # Mark request headers with a unique delimiter to allow block splitting
-        md_text = re.sub(REQUEST_NUMBER_HEADER, 'x' * 50 + REQUEST_NUMBER_HEADER, self.md_text)
-
-        # Split the Markdown text into blocks based on the delimiter
-        blocks = re.split('x' * 50, md_text)[1:]  # Skip the first empty split
-
-        for idx, block in enumerate(blocks):
-            # Replace placeholder in header with actual request number
-            new_header = REQUEST_NUMBER_HEADER.replace('_', str(idx + rqn))
-            text = block.replace(REQUEST_NUMBER_HEADER, new_header)
-
-            # Extract the first section after the header until the next header
-            pattern = fr"({new_header}.*?)(?=\n#)"
-            match = re.search(pattern, text, flags=re.DOTALL | re.MULTILINE)
-
-            request_item = match.group(1).strip()
-
-            # Replace the block with a structured triple: (full text, extracted header block, request number)
-            blocks[idx] = ([text], [request_item], [idx + rqn])  # request_item+'\n\n---'
-
-        # Merge blocks and determine page grouping
-        merged, page_groups = self.merge_blocks(blocks)
-
-        # Save all the resulting pages
-        self.save_blocks(merged, page_groups)
-
-    def merge_blocks(self, blocks):
-        """
-        Merges Markdown content blocks according to user-defined page group ranges.
-
-        Each group of blocks is combined into a single page. Request headers are modified
-        to include wiki-links with page numbers.
-
-        Args:
-            blocks (List[Tuple[List[str], List[str], List[int]]]):
-                A list of blocks, each containing text, header, and request number.
-
-        Returns:
-            Tuple[List[Tuple[List[str], List[str], List[int]]], List[List[int]]]:
-                - merged blocks
-                - associated request ID groups
-
-        Raises:
-            ValueError: If a requested index is out of the valid range.
-        """
-        # Regex pattern to find the gray-colored request number span
-        pattern = r'(# <span style="color:gray">)\s*(\d+)\s*(</span>)'
-
-        # Get the base name for the page (used in wiki-style links)
-        page_name = self.page_name_template.text()
-
-        # Get the starting page number (defined elsewhere, e.g. from user input)
-        spn = self.get_start_page_number()
-
-        # Inner function to build a replacement function for re.sub
-        def make_replacer(page_name, fixed_number=None):
-            def replacer(match):
-                # Determine the page number: either fixed or taken from match
-                if fixed_number is not None:
-                    page_number = fixed_number
-                else:
-                    page_number = int(match.group(2))
-                # Create a wiki-style link with the padded number (e.g. 001)
-                return f'[[{page_name} {f"{page_number:03}"}{match.group(1)}{match.group(2)}{match.group(3)}|{match.group(2)}]]'
-
-            return replacer
-
-        # Parse the page groups based on the user's input in the range field
-        self.page_groups, _page_err = self.parse_page_groups(self.range_input.text())
-
-        # Determine page grouping strategy
-        if not self.split_pages_cb.isChecked():
-            # If page splitting is disabled, treat all blocks as one group
-            page_groups = [list(range(1, len(blocks) + 1))]
-        elif not self.range_input.text().strip():
-            # If range input is empty, each block goes on its own page
-            page_groups = [[i] for i in range(1, len(blocks) + 1)]
-        else:
-            # Use user-defined page groups
-            page_groups = self.page_groups
-
-        merged = []
-
-        # Process each group of blocks
-        for idg, group in enumerate(page_groups):
-            merged_group = ([], [], [])  # (texts, headers, request numbers)
-
-            # Create a replacer function using current group page number
-            replacer = make_replacer(page_name, idg + spn)
-
-            for i in group:
-                # Ensure the block number is within valid range
-                if 1 <= i <= len(blocks):
-
-                    # [(['text1'],['header1'],[number1]),(['text2'],['header2'],[number2])]
-                    # (['text1'],['header1'],[number1])
-
-                    # Append the text (cleaned), number, and replaced header
-                    merged_group[0].append(blocks[i - 1][0][0].strip())  # Full text
-                    merged_group[2].append(blocks[i - 1][2][0])  # Request number
-
-                    # Apply link formatting to the request header
-                    block = re.sub(pattern, replacer, blocks[i - 1][1][0].strip())
-                    merged_group[1].append(block)  # Header with links
-                else:
-                    # If the block index is out of bounds — raise an error
-                    QMessageBox.critical(self, "Ошибка",
-                                         f"Искомый запрос {i} [{_page_err[idg]}] вне допустимого диапазона 1-{len(blocks)}")
-                    raise
-
-            # Add processed group to the final merged result
-            merged.append(merged_group)
-
-        # Return the merged result and the associated page groups
-        return merged, self.page_groups
+        return ExportOptions(
+            split_pages=self.split_pages_cb.isChecked(),
+            range_text=self.range_input.text(),
+            unique_sorted=self.unique_sort_cb.isChecked(),
+            page_template=page_template,
+            start_page_number=self.get_start_page_number(),
+            apply_start_request_number=self.apply_start_request_number_cb.isChecked(),
+            incremental=self.incremental_cb.isChecked(),
+        )
 
-    def save_blocks(self, merged_blocks, page_groups):
+    def save(self):
         """
-        Saves each group of merged Markdown blocks to separate files and writes
-        an index file listing request headers.
-
-        Adds navigation links and tags to each file based on keywords and configuration settings.
-
-        Args:
-            merged_blocks (List[Tuple[List[str], List[str], List[int]]]):
-                List of content groups to be saved.
-            page_groups (List[List[int]]):
-                The request ID groups assigned to each output page.
+        Splits the current Markdown text into request blocks, merges them into pages
+        and saves them into a new `exported_<timestamp>` directory (see `converter.export_markdown()`).
         """
+        # Invalid page groups are reported before anything is exported
+        range_error = self.get_range_error()
+        if range_error:
+            QMessageBox.critical(self, "Ошибка", range_error)
+            return
 
-        # for test only!
-        if bool(self.test_mode):
-            print(f'test_mode: {self.test_mode}')
-            for k, v in self.test_list.items():
-                self.save_text_file(v[1], os.path.join(self.base_path, f'__{k}.{v[0]}'))
-
-        # Optional subfolder inside base_path (unused here)
-        # folder_path = f'exported_{self.now}/'
-        folder_path = ''
-
-        # Extract base file name without extension
-        file_name = os.path.splitext(os.path.basename(self.file_path))[0]
-
-        # Starting page number from user-defined input or default
-        spn = self.get_start_page_number()
-
-        # Page name template; fallback to 'page' if empty
-        page_page_template = self.page_name_template.text().strip()
-        page_page_template = 'page' if page_page_template == '' else page_page_template
-
-        # Number of tags per row when writing tag blocks
-        tag_string_len = int(self.config.get("Settings", "tag_string_len", fallback=""))
-
-        # Get keyword list from config and convert to tag format
-        raw_value = self.config.get("Keywords", "words", fallback="")
-        keywords = [line.strip() for line in raw_value.strip().splitlines() if line.strip()]
-        keywords = self.convert_tags(keywords)
-
-        request_ids = []
-
-        # Open main request list file
-        with open(os.path.join(self.base_path, f'{REQUEST_LIST_NAME}.md'), "w", encoding="utf-8") as headers_file:
-
-            # Write range_input comment if present
-            if self.range_input.text().strip():
-                headers_file.writelines(f'%%  Запросы:  {self.range_input.text().strip()}  %%')
-
-            headers_file.writelines(f'\n### <span style="color:green">Source file:  </span>{file_name}\n')
-            headers_file.writelines(self.file_path + '\n\n---')
-
-            # Iterate through each merged block to generate individual markdown files
-            for idx, group in enumerate(merged_blocks):
-                content = "\n\n".join(group[0])  # Combined request body text
-                headers = "\n\n".join(group[1])  # Combined headers text
-
-                # Handle request ID(s) depending on page grouping
-                if not page_groups and self.split_pages_cb.isChecked():
-                    request_ids.append(group[2][0])
-                else:
-                    request_ids = group[2]
-
-                # Turn request ID list into a string like "(1, 2, 3)" or "(5)"
-                request_id_list_str = str(tuple(request_ids)).replace(',)', ')')
-
-                # Prepend request ID as Markdown header if grouped pages are used
-                if page_groups:
-                    headers = '# ' + request_id_list_str + '\n' + headers
-
-                # Create output filename with padded index (e.g. "page 001.md")
-                filename = f"{page_page_template} {idx + spn:03}.md"
-
-                # Build navigation links (previous, index, next)
-                prev_link = f"[[{folder_path}{page_page_template} {idx - 1 + spn:03}|{page_page_template} {idx - 1 + spn:03}]]  <" + " " * 10 if idx > 0 else ""
-                header_link = f"[[{folder_path}{REQUEST_LIST_NAME}|{REQUEST_LIST_NAME}]]" + " " * 10
-                next_link = f">  [[{folder_path}{page_page_template} {idx + 1 + spn:03}|{page_page_template} {idx + 1 + spn:03}]]" if idx < len(
-                    merged_blocks) - 1 else ""
-
-                # Show request ID range in a hidden block (Obsidian comment)
-                range_info = f"\n%%  Запросы:  {request_id_list_str}  %%\n" if self.range_input.text().replace('%',
-                                                                                                               '').strip() else ""
-
-                # Combine navigation into a Markdown block
-                nav = f"\n---{range_info}\n{prev_link}{header_link}{next_link}\n\n---\n"
+        if not self.reload_config():
+            return
 
-                # Auto-tag based on keyword presence in content
-                tags = [f"#{word[1]}" for word in keywords if word[0].lower() in content.lower()]
+        options = self.get_export_options()
+        # spn is 0 without page splitting, but the request number shift still needs the typed value
+        if options.apply_start_request_number:
+            options.start_page_number = int(self.start_page_number_input.text().strip())
 
-                # Format tags into blocks of `tag_string_len` words
-                tag_block = "\n".join(" ".join(tags[i:i + tag_string_len]) for i in range(0, len(tags), tag_string_len))
+        md_text, file_path, config = self.md_text, self.file_path, self.config
+        test_list, test_mode, export_path = self.test_list, self.test_mode, self.export_path
+        # Every export gets its own report starting with the stages of the conversion
+        report = open_report(config, self.conversion_report)
 
-                # Combine final content for the markdown file
-                full_text = f"\n{nav}\n{tag_block}\n\n---\n{content}"
+        def task(progress):
+            with report.collect(), stage('save', len(md_text)):
+                result = export_markdown(md_text, file_path, export_path, options, config, test_list, test_mode,
+                                         progress=progress)
+            if config.getboolean("Settings", "perf_report", fallback=False):
+                report.save(result[0])
+            return result + (report,)
 
-                # Write the page content to its respective Markdown file
-                self.save_text_file(full_text, os.path.join(self.base_path, filename))
+        self.save_label.setText("")
+        self.start_worker(task, self.on_saved, "Ошибка")
 
-                # Append headers to the main index file
-                headers_file.write("\n\n" + headers)
+    def on_saved(self, result):
+        self.base_path, count, writer, self.perf_report = result
 
         # Normalize path for display
         base_path_label = self.base_path.replace('\\', '/')
 
         # Notify user of successful save
-        QMessageBox.information(self, "Готово", f"{len(merged_blocks)} файлов сохранено в: {base_path_label}")
+        bytes_per_second, files_per_second = writer.throughput()
+        speed = f"Запись: {bytes_per_second / 2**20:.1f} МБ/с, {files_per_second:.0f} файлов/с"
+        if self.incremental_cb.isChecked():
+            QMessageBox.information(self, "Готово", f"{count} страниц в: {base_path_label}\n{writer.summary()}\n{speed}")
+        else:
+            QMessageBox.information(self, "Готово", f"{count} файлов сохранено в: {base_path_label}\n{speed}")
 
         # Obsidian may need to be restarted to reflect new files
         QMessageBox.warning(self, "Важно",
@@ -582,536 +644,65 @@ class GPTToMarkdownApp(QWidget):
 
     def handle_mhtml(self):
         """
-        Opens and parses an MHTML (.mhtml/.mht) file, extracts the HTML content,
-        detects its encoding, and converts it to Markdown.
+        Opens an MHTML (.mhtml/.mht) file and converts it to Markdown on a background worker
+        (see `converter.convert_mhtml()`; stages of a file converted before are taken from the cache).
 
-        Uses MIME parsing and encoding detection to robustly decode the HTML.
-        Then passes the decoded HTML to `convert_to_markdown()` for further processing.
-
-        Raises:
-            ValueError: If no HTML part is found in the MHTML file.
-            Displays QMessageBox on error.
+        Displays QMessageBox on error.
         """
         # Open file dialog to select a .mhtml or .mht file
-        self.file_path, _ = QFileDialog.getOpenFileName(
+        file_path, _ = QFileDialog.getOpenFileName(
             self, "Открыть MHTML", self.load_path, "MHTML файлы (*.mhtml *.mht)"
         )
-        if not self.file_path:
+        if not file_path:
             return  # User cancelled the dialog
-
-        try:
-            # Read and parse the MHTML file using email-style parser
-            with open(self.file_path, 'rb') as f:
-                msg = BytesParser(policy=policy.default).parse(f)
-
-            html_content = None  # Will store extracted HTML content
-
-            # If the MHTML is multipart, iterate over parts; otherwise treat as single part
-            if msg.is_multipart():
-                parts = msg.iter_parts()
-            else:
-                parts = [msg]
-
-            # Iterate through each part of the MHTML
-            for part in parts:
-                if part.get_content_type() == "text/html":
-                    # Get raw HTML payload (not yet decoded)
-                    raw = part.get_payload(decode=False)
-                    transfer_encoding = (part.get('Content-Transfer-Encoding') or '').lower()
-                    charset = part.get_content_charset()
-
-                    # Decode quoted-printable content if specified
-                    if transfer_encoding == 'quoted-printable':
-                        raw_bytes = quopri.decodestring(raw)
-                    else:
-                        # decode=True automatically decodes common encodings like base64
-                        raw_bytes = part.get_payload(decode=True)
-
-                    # Build a list of encodings to try
-                    encoding_candidates = []
-                    if charset:
-                        encoding_candidates.append(charset)
-                    encoding_candidates += ['utf-8', 'windows-1251']
-
-                    # Try to decode the raw bytes using each candidate encoding
-                    for encoding in encoding_candidates:
-                        try:
-                            html_content = raw_bytes.decode(encoding)
-                            break  # Successfully decoded
-                        except UnicodeDecodeError:
-                            continue  # Try next encoding
-                    else:
-                        # If all known encodings fail, use chardet to detect encoding
-                        detection = chardet.detect(raw_bytes)
-                        html_content = raw_bytes.decode(detection['encoding'] or 'utf-8', errors='replace')
-
-                    break  # Stop after finding the first HTML part
-
-            # If no HTML part was found in the MHTML
-            if not html_content:
-                QMessageBox.critical(self, "Ошибка", "HTML содержимое не найдено в .mhtml файле.")
-                raise ValueError("HTML content not found in .mhtml file.")
-
-        except Exception as e:
-            # Show error dialog if anything goes wrong during reading or parsing
-            QMessageBox.critical(self, "Ошибка чтения MHTML", str(e))
+        if not self.reload_config():
             return
 
-        # Pass the extracted HTML to the conversion method
-        self.convert_to_markdown(html_content)
+        config, test_mode, cache = self.config, self.test_mode, self.cache
+        report = open_report(config)
+        report.source = file_path
+
+        def task(progress):
+            with report.collect(), stage('handle_mhtml', os.path.getsize(file_path)) as record:
+                result = convert_mhtml(file_path, config, test_mode, progress, cache=cache)
+                record.output_size = len(result.md_text)
+            return file_path, result, report
 
         # Clear the save status label
         self.save_label.setText("")
+        self.start_worker(task, self.on_converted, "Ошибка чтения MHTML")
 
-    def convert_to_markdown(self, html_content: str):
+    def on_converted(self, result):
         """
-        Converts raw HTML content into cleaned and formatted Markdown text.
-
-        Applies multiple regex-based fixes and formatting improvements to enhance Markdown compatibility,
-        including code block detection, request formatting, table restoration, and tag-based replacements.
+        Stores the conversion result and updates the UI.
 
         Args:
-            html_content (str): The HTML content to be converted.
+            result (Tuple[str, ConversionResult, PerfReport]): Source file, conversion result and its
+                performance report.
         """
-
-        markdown_text = ""
-
-        ########### Define the source type and converting ###########
-
-        if "DeepSeek" in html_content:
-            print("DeepSeek")
-
-            # svg_blocks = self.extract_svg_blocks(html_content)
-            #
-            # with open("diagrams.md", "w", encoding="utf-8") as f:
-            #     for block in svg_blocks:
-            #         f.write(block + "\n\n")
-
-            html_content = re.sub(r"""(class="ds-segmented-button ds-segmented-button--selected">)Code""", r'\1mermaid', html_content, flags=re.MULTILINE)
-            html_content = self.fix_deepseek_html(html_content)
-            markdown_text = markdownify(html_content)
-            self.test_list['html2text'] = ('md', html2text.html2text(html_content))
-            self.test_list['markdownify'] = ('md', markdown_text)
-            self.ui_type = 'DeepSeek'
-        elif "ChatGPT" in html_content:
-            print("ChatGPT")
-
-            # if bool(self.test_mode):
-            #     print(f'test_mode: {self.test_mode}')
-            #     self.save_text_file(html_content, 'test0.html')
-
-            html_content = self.fix_chatgpt_html(html_content)
-
-            # if bool(self.test_mode):
-            #     print(f'test_mode: {self.test_mode}')
-            #     self.save_text_file(html_content, 'test1.html')
-
-            html_content = self.canvas_fix(html_content)
-
-            # if bool(self.test_mode):
-            #     print(f'test_mode: {self.test_mode}')
-            #     self.save_text_file(html_content, 'test2.html')
-
-            markdown_text = html2text.html2text(html_content)
-            self.test_list['html2text'] = ('md', markdown_text)
-            self.test_list['markdownify'] = ('md', markdownify(html_content))
-            self.ui_type = 'ChatGPT'
-
-        if bool(self.test_mode):
-            print(f'test_mode: {self.test_mode}')
-            self.save_text_file(html_content, 'test.html')
-
-        # TODO: Add more types
-
-        self.test_list['html'] = ('html', html_content)
-
-        # def convert_with_pandoc(html: str) -> str:
-        #     result = subprocess.run(
-        #         ['C:\Program Files\Pandoc\pandoc', '-f', 'html', '-t', 'markdown'],
-        #         input=html.encode('utf-8'),
-        #         # input=html,
-        #         stdout=subprocess.PIPE
-        #     )
-        #     return result.stdout.decode('utf-8')
-        #     # return result
-        #
-        # self.test_list['pandoc'] = convert_with_pandoc(html_content)
-
-        ########### Start of fix block ###########
-
-        # Define a marker pattern used in specific UI controls (e.g., "Copy", "Edit")
-        if self.ui_type == 'ChatGPT':
-            mark = r"(?:КопироватьРедактировать|Всегда\s+показывать\s+подробности.+?Копировать)"
-
-            # Fix spacing issues around blocks with UI elements
-            pattern = r'(^\s+$)\s+$(\s+' + mark + ')'
-            v_pattern = re.compile(pattern, re.MULTILINE | re.DOTALL | re.VERBOSE)
-            markdown_text = v_pattern.sub(lambda m: f"{m.group(1)}text\n{m.group(2)}", markdown_text)
-
-            # Merge headings with UI controls following them
-            pattern = r'(^\s+\w+$\s+$\s+' + mark + ')'
-            v_pattern = re.compile(pattern, re.MULTILINE | re.DOTALL | re.VERBOSE)
-            markdown_text = v_pattern.sub(lambda m: f"\n{m.group(1)}", markdown_text)
-
-            # Convert marked blocks into fenced code blocks
-            pattern = r'^\s+(\w+)$\s+$\s+' + mark + '(.+?^$)'
-            v_pattern = re.compile(pattern, re.MULTILINE | re.DOTALL | re.VERBOSE)
-            markdown_text = v_pattern.sub(lambda m: f"\n```{m.group(1)}{m.group(2)}```\n", markdown_text)
-
-            # Restore tables broken by markdown conversion
-            markdown_text = self.table_restore(markdown_text)
-
-            # Fix indentation inside code blocks
-            markdown_text = self.fix_code_blocks(markdown_text)
-
-            # if bool(self.test_mode):
-            #     print(f'test_mode: {self.test_mode}')
-            #     self.save_text_file(markdown_text, 'test1.md')
-
-            # fix canvas code blocks
-            markdown_text = re.sub(r' +(```\w+)', r'\1', markdown_text, re.MULTILINE | re.DOTALL)
-            markdown_text = re.sub(r'(?:^\s*\d+\s*$\n?){2,}', r'   \n', markdown_text, flags=re.MULTILINE)
-
-            # if bool(self.test_mode):
-            #     print(f'test_mode: {self.test_mode}')
-            #     self.save_text_file(markdown_text, 'test2.md')
-
-        elif self.ui_type == 'DeepSeek':
-            mark = r"(?:Copy.+?Download.+?```)"
-
-            pattern = r'^\s*(\w+)$\s*$\s*' + mark
-            v_pattern = re.compile(pattern, re.MULTILINE | re.DOTALL | re.VERBOSE)
-            markdown_text = v_pattern.sub(lambda m: f"\n```{m.group(1)}\n\n", markdown_text)
-
-            markdown_text = self.remove_footer(markdown_text)
-
-        # Add placeholder lines before code blocks following Markdown lists
-        pattern = r'(^\s*\*+[^*]+?)\n(\s*```)'
-        v_pattern = re.compile(pattern, re.MULTILINE | re.VERBOSE)
-        markdown_text = v_pattern.sub(lambda m: f"{m.group(1)}\n'\n{m.group(2)}", markdown_text)
-
-        # Apply custom text replacements from config
-        markdown_text = self.fix_text_replace(markdown_text)
-
-        # Format ChatGPT requests into collapsible blocks
-        markdown_text = self.request_format(markdown_text)
-
-        # Additional regex cleanup (headers, tables, etc.)
-        markdown_text = self.fix_text_regexp(markdown_text)
-
-        # Add extra hash to headings for better folding behavior in Obsidian
-        markdown_text = re.sub(r'(#{2,}) ', r'\1# ', markdown_text, flags=re.MULTILINE)
-
-        ########### End of fix block ###########
+        self.file_path, conversion, self.conversion_report = result
+        self.perf_report = self.conversion_report
 
         # Store result and update UI
-        self.md_text = markdown_text
+        self.md_text = conversion.md_text
+        self.turn_count = count_turns(self.md_text)
+        self.ui_type = conversion.ui_type
+        self.test_list = conversion.test_list
         QMessageBox.information(self, "Готово", f"Преобразование завершено:\n{self.file_path}")
-        self.mhtml_path_label.setText(self.ui_type +':  '+ self.file_path)
+        self.mhtml_path_label.setText(self.ui_type + ':  ' + self.file_path)
         self.split_pages_cb.setChecked(False)
+        # the new file defines the widget states, the saved ones must not be restored
+        self.widget_states = []
         self.activate_all_widgets(self, True)
 
-    def request_format(self, text: str) -> str:
-        """
-        Formats question-and-answer blocks from raw Markdown into a structured request block.
-
-        Specifically targets phrases like "Вы сказали" / "ChatGPT сказал" and replaces them
-        with a formatted quote block and request header.
-
-        Args:
-            text (str): The Markdown text to format.
-
-        Returns:
-            str: The formatted text.
-        """
-        text = re.sub(
-            r'##### Вы сказали:\n(.*?)\n\s*###### ChatGPT сказал:',
-            fr"""{REQUEST_NUMBER_HEADER}\n> [!{self.request_md_tag}] Запрос:
-    > \1
-{REQUEST_FOOTER}
-""",
-            text,
-            flags=re.DOTALL
-        )
-        return text
-
-    @staticmethod
-    def table_restore(text):
-        """
-        Fixes Markdown tables that have been broken into separate lines by line breaks.
-
-        Joins wrapped table lines back together to ensure they render as a valid table.
-
-        Args:
-            text (str): The Markdown text containing broken tables.
-
-        Returns:
-            str: The restored table text.
-        """
-        pattern = re.compile(
-            r"^((---\|)+---\s*$)(.+?)(^\s{2}$)",
-            re.MULTILINE | re.DOTALL
-        )
-
-        def process_table_block(match):
-            start = match.group(1)  # Table separator line (e.g., ---|---|)
-            body = match.group(3)  # Actual table body (potentially broken)
-            end = match.group(4)  # End of table block marker
-
-            lines = body.splitlines()
-            processed_lines = []
-            buffer_line = ""
-
-            for line in lines:
-                # Merge lines without proper Markdown table line endings
-                if not line.endswith("  "):
-                    buffer_line += line + " "
-                else:
-                    buffer_line += line
-                    if buffer_line:
-                        processed_lines.append(buffer_line)
-                    buffer_line = ""
-
-            return start + "\n" + "\n".join(processed_lines) + "\n" + end
-
-        text = pattern.sub(process_table_block, text)
-
-        # Fix broken table start rows
-        text = re.sub(r'^\|', '-|', text, flags=re.MULTILINE)
-
-        return text
-
-    def fix_text_replace(self, text):
-        """
-        Applies hard-coded string replacements defined in the configuration.
-
-        Replacements are defined in the format 'original:replacement' per line
-        under the config section 'Hard_replacements'.
-
-        Args:
-            text (str): Input Markdown text.
-
-        Returns:
-            str: Text after replacements.
-        """
-        raw_value = self.config.get("Hard_replacements", "replacements", fallback="")
-        replacements = [line.strip() for line in raw_value.strip().splitlines() if line.strip()]
-        for replacement in replacements:
-            r = replacement.split(':')
-            if r[0][0] == 'r':
-                pass
-                text = re.sub(fr'{r[0][1:]}', fr'{r[1]}', text, flags=re.MULTILINE)
-            else:
-                text = text.replace(r[0], r[1])
-        return text
-
-    def fix_text_regexp(self, text):
-        """
-        Applies regex-based fixes to the Markdown text.
-
-        This includes trimming leading content before request blocks and
-        replacing table pipe starts with dashes for alignment.
-
-        Args:
-            text (str): Input Markdown text.
-
-        Returns:
-            str: Cleaned and modified text.
-        """
-        # Remove content before the first request block
-        text = REQUEST_NUMBER_HEADER + re.sub(
-            fr'^.*?(?=>\s*\[!{self.request_md_tag}]\s*Запрос:)',
-            '\n', text, flags=re.DOTALL
-        )
-        return text
-
-    @staticmethod
-    def fix_code_blocks(text):
-        """
-        Normalizes indentation inside fenced code blocks to avoid rendering issues.
-
-        Args:
-            text (str): Markdown text containing code blocks.
-
-        Returns:
-            str: Text with fixed code block indentation.
-        """
-
-        def replacer(match):
-            code = match.group(2)
-            count = 4
-            # Remove up to 4 spaces of indentation
-            code = '\n'.join(
-                line[count:] if line.startswith(' ' * count) else line
-                for line in code.splitlines()
-            )
-            if code.startswith('\n'):
-                code = code[1:]
-            return f'```{match.group(1)}{code}\n```'
-
-        pattern = r'```(\w+)(.*?)```'
-        return re.sub(pattern, replacer, text, flags=re.DOTALL)
-
-    @staticmethod
-    def convert_tags(tags: list[str]) -> list[tuple[str, str]]:
-        """
-        Converts raw tag strings into (search_string, display_tag) tuples.
-
-        Replaces underscores with spaces and handles encoded slashes and separators.
-
-        Args:
-            tags (list[str]): A list of tag strings.
-
-        Returns:
-            list[tuple[str, str]]: List of (normalized_name, formatted_tag).
-        """
-        return [
-            (
-                re.sub('_', ' ', re.sub('.·', '/', re.sub(r'^.+/', '', w.strip()))),
-                re.sub(r'.·', '·', w.strip())
-            )
-            for w in tags
-        ]
-
-    @staticmethod
-    def fix_deepseek_html(html_text):
-        """
-        Applies regex-based fixes to the Markdown text for DeepSeek.
-        Defines the request block and marks like in ChatGPT.
-
-        Args:
-            html_text (str): Input Markdown text.
-
-        Returns:
-            str: Cleaned and modified text.
-
-        """
-        # print('fix_deepseek_text')
-        def replacer(match):
-            fix_str = match.group(1)
-            fix_str = fix_str.replace('&lt;', '\&lt;')
-            return f"""##### Вы сказали:\n{fix_str}\n\n\n###### ChatGPT сказал:{match.group(2)}"""
-
-        pattern = r'([^>]+?)(</div>(?:<div class="[^"]+">){2}<div class="ds-flex [^"]+" style="align-items: flex-end; gap: 0px;")'
-
-        return re.sub(pattern, replacer, html_text, flags=re.MULTILINE)
-
-    @staticmethod
-    def fix_chatgpt_html(html_text):
-        """
-        Applies regex-based fixes to the Markdown text for ChatGPT canvas.
-
-        Args:
-            html_text (str): Input Markdown text.
-
-        Returns:
-            str: Cleaned and modified text.
-
-        """
-        # print('fix_deepseek_text')
-        def replacer(match):
-            fix_str = match.group(2)
-            fix_str = re.sub(r'</?span[^>]*>', '', fix_str)
-            return f"""{match.group(1)}{fix_str}{match.group(3)}"""
-
-        pattern = r'(<div class="cm-line">)(.+?)(</div>)(?=<div class=)'
-
-        return re.sub(pattern, replacer, html_text, flags=re.MULTILINE | re.DOTALL)
-
-    @staticmethod
-    def remove_footer(text):
-        text = re.sub(
-            r"New chat\n\nDeepThink.+?\.\.\.",
-            '', text, flags=re.DOTALL | re.MULTILINE
-        )
-        return text
-
-    def canvas_fix(self, text):
-
-        # Загрузка HTML
-        soup = BeautifulSoup(text, "html.parser")
-
-        # Поиск всех <main class="...">
-        main_tags = soup.find_all("main", class_="relative flex min-h-0 flex-auto grow flex-col")
-
-        # Замена содержимого
-        for idx,tag in enumerate(main_tags):
-
-            code_tags = tag.find_all("div",class_="cm-content")
-            for idxc, code_tag in enumerate(code_tags):
-                code_md = self.extract_canvas_code_block(str(code_tag))
-                # if bool(self.test_mode):
-                #     print(f'test_mode: {self.test_mode}')
-                #     self.save_text_file(code_md, 'code_' + str(idx) + '_' + str(idxc) + '.md')
-                code_tag.clear()
-                code_tag.append(BeautifulSoup(code_md, "html.parser"))
-
-            canvas_content = str(tag)  # Преобразуем содержимое тега в строку HTML
-
-            # Преобразуем HTML в Markdown
-            markdown_converter = html2text.HTML2Text()
-            markdown_converter.ignore_links = False
-            markdown_converter.ignore_images = True
-            markdown_converter.body_width = 0
-            markdown_converter.protect_links = True
-            markdown_content = markdown_converter.handle(canvas_content)
-
-            # Заворачиваем в <pre><code>...</code></pre>
-            markdown_replacement = f"<pre><code>{markdown_content}</code></pre>"
-
-            # if bool(self.test_mode):
-            #     print(f'test_mode: {self.test_mode}')
-            #     self.save_text_file(markdown_content, 'canvas_'+str(idx)+'.md')
-
-            # Очищаем оригинальный <main> и вставляем Markdown-вставку
-            tag.clear()
-            tag.append(BeautifulSoup(markdown_replacement, "html.parser"))
-
-        return str(soup)
-
-    @staticmethod
-    def extract_canvas_code_block(html_block: str) -> str:
-        soup = BeautifulSoup(html_block, "html.parser")
-
-        # Найти родительский блок с классом cm-content
-        content_div = soup.find("div", class_="cm-content")
-        language = content_div.get("data-language")
-        if not content_div:
-            return ""
-
-        # Извлечь строки кода из <div class="cm-line">
-        lines = []
-        for line_div in content_div.find_all("div", class_="cm-line"):
-            # line_text = ''.join(span.get_text() for span in line_div.find_all("span"))
-            line_text = re.sub(r'<[^>]*>', r'', str(line_div))
-            lines.append(line_text)
-
-        # Собрать кодовый блок с тройными кавычками и языком
-        code_block = f'<pre><code>```{language}\n\n' + '\n'.join(lines) + '\n\n```</code></pre>'
-        return code_block
-
-    @staticmethod
-    def save_text_file(text, file_path):
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(text)
-
-    # @staticmethod
-    # def extract_svg_blocks(html: str) -> list[str]:
-    #     soup = BeautifulSoup(html, "html.parser")
-    #     svg_blocks = []
-    #
-    #     for svg in soup.find_all("svg", class_="mermaid-svg"):
-    #         svg_html = str(svg)
-    #         svg_blocks.append(f'<div align="center">\n{svg_html}\n</div>')
-    #
-    #     return svg_blocks
-
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # the watch mode converts in worker processes (also in the frozen exe)
     app = QApplication(sys.argv)
-    icon = load_icon_from_base64()
-    app.setWindowIcon(icon)  # ✅ for the taskbar
+    app.setWindowIcon(load_icon())  # ✅ for the taskbar and every window
     window = GPTToMarkdownApp()
     window.setFixedSize(1000, 600)
     window.show()
+    # the conversion libraries load while the user picks a file
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
     sys.exit(app.exec())
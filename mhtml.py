@@ -0,0 +1,272 @@
+"""
+Fast MHTML part scanner.
+
+MHTML exports consist mostly of base64 images, fonts and CSS; the chat itself is the first
+`text/html` part. `iter_parts()` memory-maps the file and jumps between MIME boundaries, parsing
+only the part headers; `locate_html_part()` decodes just the HTML part and `iter_image_parts()`
+decodes the images chunk by chunk, without building email objects for the rest of the file.
+"""
+
+import binascii
+import mmap
+from functools import partial
+
+
+# Size of the quoted-printable / base64 chunks decoded at once (cut at line ends)
+QP_CHUNK_SIZE = 1 << 20
+
+
+def _header_end(data, start):
+    """
+    Finds the blank line that ends a header block.
+
+    Returns:
+        Tuple[int, int]: End of the headers and start of the body, or (-1, -1) if not found.
+    """
+    crlf = data.find(b"\r\n\r\n", start)
+    lf = data.find(b"\n\n", start)
+    if lf != -1 and (crlf == -1 or lf < crlf):
+        return lf, lf + 2
+    if crlf != -1:
+        return crlf, crlf + 4
+    return -1, -1
+
+
+def _parse_headers(data, start, end):
+    # the email package is imported on first use, it is a noticeable part of the application start
+    from email import policy
+    from email.parser import BytesHeaderParser
+    return BytesHeaderParser(policy=policy.default).parsebytes(bytes(data[start:end]))
+
+
+def _find_delimiter(data, delimiter, start):
+    """
+    Finds the next boundary delimiter that starts a line.
+
+    Returns:
+        int: Position of the delimiter or -1.
+    """
+    pos = data.find(delimiter, start)
+    while pos != -1 and pos != start and data[pos - 1:pos] != b"\n":
+        pos = data.find(delimiter, pos + 1)
+    return pos
+
+
+def _line_chunks(view, chunk_size):
+    """
+    Yields slices of about `chunk_size` bytes cut right after a line break (the last one may end anywhere).
+    """
+    start = 0
+    while start < len(view):
+        end = min(start + chunk_size, len(view))
+        if end < len(view):
+            # Extend the chunk up to the end of the current line
+            line_end = bytes(view[end - 1:min(end + 1024, len(view))]).find(b"\n")
+            end = end + line_end if line_end != -1 else end
+        with view[start:end] as chunk:
+            yield chunk
+        start = end
+
+
+def iter_quoted_printable(payload, chunk_size=QP_CHUNK_SIZE):
+    """
+    Decodes quoted-printable data chunk by chunk.
+
+    Chunks are cut right after a line break, so neither an `=XX` escape nor a soft line break
+    is ever split.
+
+    Yields:
+        bytes: Decoded chunks.
+    """
+    with memoryview(payload) as view:
+        for chunk in _line_chunks(view, chunk_size):
+            yield binascii.a2b_qp(chunk)
+
+
+def iter_base64(payload, chunk_size=QP_CHUNK_SIZE):
+    """
+    Decodes base64 data chunk by chunk; line breaks are skipped and a group of 4 characters
+    split between chunks is carried over.
+
+    Yields:
+        bytes: Decoded chunks.
+    """
+    pending = b""
+    with memoryview(payload) as view:
+        for chunk in _line_chunks(view, chunk_size):
+            encoded = pending + bytes(chunk).translate(None, b" \t\r\n")
+            usable = len(encoded) - len(encoded) % 4
+            pending = encoded[usable:]
+            if usable:
+                yield binascii.a2b_base64(encoded[:usable])
+    if pending:
+        yield binascii.a2b_base64(pending)
+
+
+def iter_decoded(payload, transfer_encoding, chunk_size=QP_CHUNK_SIZE):
+    """
+    Decodes a part body according to its Content-Transfer-Encoding, chunk by chunk.
+
+    Yields:
+        bytes: Decoded chunks.
+    """
+    if transfer_encoding == 'quoted-printable':
+        yield from iter_quoted_printable(payload, chunk_size)
+    elif transfer_encoding == 'base64':
+        yield from iter_base64(payload, chunk_size)
+    else:
+        with memoryview(payload) as view:
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start:start + chunk_size])
+
+
+def decode_quoted_printable(payload, chunk_size=QP_CHUNK_SIZE):
+    """
+    Decodes quoted-printable data; the result is the same as `quopri.decodestring()` on the whole payload.
+
+    Args:
+        payload (memoryview | bytes): Encoded data.
+        chunk_size (int): Approximate size of one chunk.
+
+    Returns:
+        bytes: Decoded data.
+    """
+    decoded = bytearray()
+    for chunk in iter_quoted_printable(payload, chunk_size):
+        decoded += chunk
+    return bytes(decoded)
+
+
+def decode_payload(payload, transfer_encoding):
+    """
+    Decodes a part body according to its Content-Transfer-Encoding.
+
+    Args:
+        payload (memoryview | bytes): Raw part body.
+        transfer_encoding (str): Lowercase Content-Transfer-Encoding value.
+
+    Returns:
+        bytes: Decoded data.
+    """
+    if transfer_encoding == 'quoted-printable':
+        return decode_quoted_printable(payload)
+    if transfer_encoding == 'base64':
+        return binascii.a2b_base64(bytes(payload))
+    return bytes(payload)
+
+
+def iter_parts(file_path):
+    """
+    Scans the MIME boundaries of a multipart MHTML file.
+
+    The payload is a memoryview into the memory-mapped file, valid only until the next part is requested;
+    decode it (e.g. with `iter_decoded()`) before that and do not keep slices of it.
+
+    Args:
+        file_path (str): Path to the MHTML file.
+
+    Yields:
+        Tuple[email.message.Message, memoryview]: Part headers and the raw part body.
+
+    Returns:
+        bool: False if the file is not a regular multipart MHTML (the scan stopped early);
+            use the full MIME parser then.
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return False
+
+    with data:
+        headers_end, body_start = _header_end(data, 0)
+        if headers_end == -1:
+            return False
+
+        headers = _parse_headers(data, 0, headers_end)
+        boundary = headers.get_param('boundary') if headers.get_content_maintype() == 'multipart' else None
+        if not boundary:
+            return False
+
+        delimiter = b"--" + str(boundary).encode('ascii', 'surrogateescape')
+        pos = _find_delimiter(data, delimiter, body_start)
+
+        while pos != -1:
+            # Close delimiter "--boundary--" ends the multipart
+            after = pos + len(delimiter)
+            if data[after:after + 2] == b"--":
+                return True
+
+            line_end = data.find(b"\n", after)
+            if line_end == -1:
+                return False
+
+            part_headers_end, part_body_start = _header_end(data, line_end + 1)
+            next_pos = _find_delimiter(data, delimiter, line_end + 1)
+            if part_headers_end == -1 or next_pos == -1 or part_headers_end > next_pos:
+                return False
+
+            part_headers = _parse_headers(data, line_end + 1, part_headers_end + 1)
+
+            # The line break before the next delimiter belongs to the delimiter
+            body_end = next_pos
+            if data[body_end - 2:body_end] == b"\r\n":
+                body_end -= 2
+            elif data[body_end - 1:body_end] == b"\n":
+                body_end -= 1
+
+            payload = memoryview(data)[part_body_start:max(body_end, part_body_start)]
+            try:
+                yield part_headers, payload
+            finally:
+                payload.release()
+
+            pos = next_pos
+
+    return False
+
+
+def locate_html_part(file_path):
+    """
+    Finds and decodes the first `text/html` part of an MHTML file by scanning MIME boundaries.
+
+    Only the headers of the parts are parsed; bodies of the skipped parts (images, fonts, CSS)
+    are never copied out of the memory map.
+
+    Args:
+        file_path (str): Path to the MHTML file.
+
+    Returns:
+        Tuple[bytes, str] | None: Decoded HTML bytes and the charset from the part headers (or None).
+            None if the file is not a regular multipart MHTML; use the full MIME parser then.
+    """
+    for headers, payload in iter_parts(file_path):
+        if headers.get_content_type() == "text/html":
+            transfer_encoding = (headers.get('Content-Transfer-Encoding') or '').lower()
+            return decode_payload(payload, transfer_encoding), headers.get_content_charset()
+    return None
+
+
+def iter_image_parts(file_path):
+    """
+    Yields the `image/*` parts of an MHTML file with their bodies decoded lazily.
+
+    Yields:
+        Tuple[List[str], str, Callable[[], Iterator[bytes]]]: References of the image in the HTML
+            (Content-Location and `cid:` of the Content-ID), content type and a function returning
+            a fresh iterator over the decoded chunks (usable until the next part is requested).
+    """
+    for headers, payload in iter_parts(file_path):
+        if headers.get_content_maintype() != "image":
+            continue
+        references = []
+        location = headers.get('Content-Location')
+        if location:
+            references.append(str(location).strip())
+        content_id = headers.get('Content-ID')
+        if content_id:
+            references.append('cid:' + str(content_id).strip().strip('<>'))
+        if not references:
+            continue
+        transfer_encoding = (headers.get('Content-Transfer-Encoding') or '').lower()
+        yield references, headers.get_content_type(), partial(iter_decoded, payload, transfer_encoding)
@@ -0,0 +1,158 @@
+"""
+Single-pass engine for the [Hard_replacements] rules.
+
+Applied one after another, N rules took N passes over the whole Markdown and made N copies of it. `Replacer`
+merges consecutive literal rules into groups applied in one pass each: the originals of a group are found
+by one regex built from their trie, and every match is replaced by the replacement of its rule.
+
+A rule joins a group only if the result is provably that of applying the rules in order
+(see `replace_in_order()`): its original cannot overlap the original or the replacement of any earlier
+rule of the group (see `_can_overlap()`). Then no match of one rule can hide or create a match of
+a later one. Otherwise a new group starts. Whether two regexes can overlap cannot be decided in general,
+so every regex rule is a pass of its own between the groups, unless it has no regex syntax at all.
+`benchmarks.bench_replacements` checks the result against the sequential one.
+"""
+
+import re
+
+
+# A regex rule without these characters in its pattern or replacement is a literal one
+REGEX_SYNTAX_PATTERN = re.compile(r'[\\.^$*+?{}\[\]|()]')
+
+
+def replace_in_order(rules, text):
+    """
+    Applies the rules one after another, every rule to the result of the previous ones.
+
+    Args:
+        rules (Iterable[Tuple[re.Pattern | str, str]]): (compiled regex or literal, replacement) per rule.
+        text (str): Input text.
+
+    Returns:
+        str: Text after replacements.
+    """
+    for original, replacement in rules:
+        if isinstance(original, str):
+            text = text.replace(original, replacement)
+        else:
+            text = original.sub(replacement, text)
+    return text
+
+
+def _can_overlap(first, second):
+    """
+    Whether an occurrence of `first` and one of `second` can share a character in some text. An empty
+    string lies inside any other one: text deleted by a replacement can join a match of the next rule.
+    """
+    if first in second or second in first:
+        return True
+    return any(first.endswith(second[:size]) or second.endswith(first[:size])
+               for size in range(1, min(len(first), len(second))))
+
+
+def _as_literal(rule):
+    """
+    Returns the rule as (original, replacement) strings, None for a regex rule.
+    """
+    original, replacement = rule
+    if isinstance(original, str):
+        return rule
+    if REGEX_SYNTAX_PATTERN.search(original.pattern) or '\\' in replacement:
+        return None
+    return original.pattern, replacement
+
+
+def _trie_pattern(originals):
+    """
+    Regex source matching any of the originals, with their common prefixes factored out: at every position
+    the regex engine follows one branch of the trie instead of trying every original.
+    """
+    root = {}
+    for original in originals:
+        node = root
+        for char in original:
+            node = node.setdefault(char, {})
+        node[''] = None
+
+    def branch(node):
+        alternatives = [re.escape(char) + branch(child) for char, child in sorted(node.items()) if char]
+        if not alternatives:
+            return ''
+        source = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+        return f"(?:{source})?" if '' in node else source
+
+    return branch(root)
+
+
+def _group_pass(group):
+    if len(group) == 1:
+        return group[0]
+    return re.compile(_trie_pattern([original for original, _replacement in group])), dict(group)
+
+
+def plan_passes(rules):
+    """
+    Splits the rules into passes that give the same result as applying them in order.
+
+    Args:
+        rules (Iterable[Tuple[re.Pattern | str, str]]): (compiled regex or literal, replacement) per rule.
+
+    Yields:
+        Tuple[re.Pattern | str, str | Dict[str, str]]: A literal rule, a regex rule, or a group of literal
+            rules: the pattern of their originals with {original: replacement}.
+    """
+    group = []
+    for rule in rules:
+        literal = _as_literal(rule)
+        if literal is not None and not any(_can_overlap(original, literal[0]) or _can_overlap(replacement, literal[0])
+                                           for original, replacement in group):
+            group.append(literal)
+            continue
+        if group:
+            yield _group_pass(group)
+        if literal is None:
+            group = []
+            yield rule
+        else:
+            group = [literal]
+    if group:
+        yield _group_pass(group)
+
+
+class Replacer:
+    """
+    [Hard_replacements] rules planned into passes (see `plan_passes()`).
+
+    Args:
+        rules (Iterable[Tuple[re.Pattern | str, str]]): (compiled regex or literal, replacement) per rule,
+            see `fixups.compile_replacements()`.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        self.passes = tuple(plan_passes(self.rules))
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __repr__(self):
+        return f"Replacer({len(self.rules)} rules in {len(self.passes)} passes)"
+
+    def apply(self, text):
+        """
+        Applies the rules, with the same result as `replace_in_order()`.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            str: Text after replacements.
+        """
+        for pattern, replacement in self.passes:
+            if isinstance(pattern, str):
+                text = text.replace(pattern, replacement)
+            elif isinstance(replacement, dict):
+                text = pattern.sub(lambda match: replacement[match.group()], text)
+            else:
+                text = pattern.sub(replacement, text)
+        return text
@@ -0,0 +1,166 @@
+"""
+Page groups of the export ('1-3,(6,5-7),6,4-2').
+
+Every group is kept as a sequence of `range` intervals (order and direction as typed), so a range like
+'1-100000' is never expanded into a list: bounds are checked per interval and "sort and dedupe" merges
+the intervals instead of building sets.
+"""
+
+import re
+
+
+# Either a bracketed group (e.g. (1,2,3)) or a single element
+GROUP_PATTERN = re.compile(r'\((.*?)\)|([^,()]+)')
+
+
+class PageGroup:
+    """
+    Request numbers of one page as a sequence of intervals.
+
+    Iterating yields the numbers in input order (duplicates included).
+
+    Args:
+        raw (str): Group text as typed (for error messages).
+        ranges (Iterable[range]): Intervals with step 1 or -1.
+    """
+    __slots__ = ('raw', 'ranges')
+
+    def __init__(self, raw, ranges):
+        self.raw = raw
+        self.ranges = tuple(ranges)
+
+    def __iter__(self):
+        for interval in self.ranges:
+            yield from interval
+
+    def __len__(self):
+        return sum(len(interval) for interval in self.ranges)
+
+    def __repr__(self):
+        return f"PageGroup({self.raw!r}, {list(self.ranges)})"
+
+    def unique_sorted(self):
+        """
+        Returns the group with unique numbers in ascending order (overlapping and adjacent
+        intervals are merged).
+        """
+        bounds = sorted((min(interval[0], interval[-1]), max(interval[0], interval[-1]))
+                        for interval in self.ranges if interval)
+        merged = []
+        for low, high in bounds:
+            if merged and low <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], high)
+            else:
+                merged.append([low, high])
+        return PageGroup(self.raw, (range(low, high + 1) for low, high in merged))
+
+    def first_out_of_range(self, count):
+        """
+        Returns the first number (in iteration order) outside 1..count, or None.
+        """
+        for interval in self.ranges:
+            if not interval:
+                continue
+            if interval.step > 0:
+                if interval[0] < 1:
+                    return interval[0]
+                if interval[-1] > count:
+                    return max(interval[0], count + 1)
+            else:
+                if interval[0] > count:
+                    return interval[0]
+                if interval[-1] < 1:
+                    return min(interval[0], 0)
+        return None
+
+
+def parse_interval(item):
+    """
+    Parses one element of a group: a number ('5') or a range ('5-8', '10-7').
+
+    Raises:
+        ValueError: If a non-numeric value or invalid range is detected.
+    """
+    if '-' in item:
+        try:
+            start, end = item.split('-')
+            start, end = int(start), int(end)
+        except ValueError:
+            raise ValueError(f"Некорректный диапазон:  {item} . Проверьте формат ввода.")
+
+        # Support both ascending and descending ranges
+        if start > end:
+            return range(start, end - 1, -1)
+        return range(start, end + 1)
+
+    try:
+        number = int(item)
+    except ValueError:
+        raise ValueError(f"Некорректный номер запроса: {item}. Проверьте формат ввода.")
+    return range(number, number + 1)
+
+
+def parse_page_groups(text: str, unique_sorted: bool = False):
+    """
+    Parses a string of page number groups and returns either unique sorted groups or groups in input order.
+
+    The input string may contain comma-separated numbers and ranges (e.g., '1-3,5,(7,9-11)').
+    Parentheses indicate grouping of requests into one page.
+
+    Args:
+        text (str): Page groups string.
+        unique_sorted (bool): Return unique sorted groups instead of groups in input order.
+
+    Returns:
+        Tuple[List[PageGroup], List[str]]:
+            - groups: Request numbers of every page.
+            - raw group strings.
+
+    Raises:
+        ValueError: If a non-numeric value or invalid range is detected.
+    """
+    # Remove all spaces from the input text
+    text = text.replace(' ', '')
+
+    groups = []
+    raws = []
+    for group_str, single in GROUP_PATTERN.findall(text):
+        # Use the group in parentheses if found, otherwise use the single value
+        raw = group_str if group_str else single
+        group = PageGroup(raw, (parse_interval(item) for item in raw.split(',') if item))
+        groups.append(group.unique_sorted() if unique_sorted else group)
+        raws.append(raw)
+
+    return groups, raws
+
+
+def validate_page_groups(groups, count):
+    """
+    Checks that every request number of the groups is within 1..count (O(intervals)).
+
+    Args:
+        groups (List[PageGroup]): Parsed page groups.
+        count (int): Number of requests in the chat.
+
+    Raises:
+        ValueError: For the first request number out of range.
+    """
+    for group in groups:
+        number = group.first_out_of_range(count)
+        if number is not None:
+            raise ValueError(f"Искомый запрос {number} [{group.raw}] вне допустимого диапазона 1-{count}")
+
+
+def check_page_groups(text, count, unique_sorted=False):
+    """
+    Validates the range field text against the number of requests.
+
+    Returns:
+        str: Error message or '' if the text is valid.
+    """
+    try:
+        groups, _raws = parse_page_groups(text, unique_sorted)
+        validate_page_groups(groups, count)
+    except ValueError as e:
+        return str(e)
+    return ''
@@ -0,0 +1,198 @@
+"""
+Per-run performance report: wall/CPU time, peak traced memory and input/output sizes of every
+pipeline stage, optionally with a cProfile profile.
+
+The pipeline marks its stages with `stage()`; they are recorded only while a report is collecting
+(`with report.collect(): ...` in the thread that runs the pipeline), otherwise `stage()` costs
+next to nothing.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+
+
+REPORT_NAME = '.gpt2md_report.json'
+PROFILE_NAME = '.gpt2md_profile.prof'
+
+_current_report = ContextVar('perf_report', default=None)
+
+
+class StageRecord:
+    """
+    Measurements of one stage.
+
+    Attributes:
+        name (str): Stage name.
+        depth (int): Nesting level (0 — top-level stage).
+        wall (float): Wall-clock seconds.
+        cpu (float): CPU seconds of the process.
+        peak_bytes (int): Peak traced Python heap during the stage (0 without memory tracing).
+        input_size (int): Size of the stage input (bytes for files, characters for text).
+        output_size (int): Size of the stage output, set by the stage itself.
+        note (str): Decision the stage made (e.g. the chosen encoding), set by the stage itself.
+    """
+    __slots__ = ('name', 'depth', 'wall', 'cpu', 'peak_bytes', 'input_size', 'output_size', 'note')
+
+    def __init__(self, name, depth=0, input_size=0):
+        self.name = name
+        self.depth = depth
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_bytes = 0
+        self.input_size = input_size
+        self.output_size = 0
+        self.note = ''
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PerfReport:
+    """
+    Collects `StageRecord`s of one run (conversion and export may be collected one after another).
+
+    Args:
+        memory (bool): Trace the peak heap with tracemalloc (slows the pipeline down noticeably).
+        profile (bool): Run cProfile while collecting.
+    """
+
+    def __init__(self, memory=False, profile=False):
+        self.memory = memory
+        self.stages = []
+        self.profiler = cProfile.Profile() if profile else None
+        self.source = ''
+        self._stack = []
+
+    @contextmanager
+    def collect(self):
+        """
+        Makes this report the one `stage()` records into (in the current thread / context).
+        """
+        token = _current_report.set(self)
+        started_tracing = self.memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.profiler is not None:
+            self.profiler.enable()
+        try:
+            yield self
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+            if started_tracing:
+                tracemalloc.stop()
+            _current_report.reset(token)
+
+    @contextmanager
+    def stage(self, name, input_size=0):
+        record = StageRecord(name, len(self._stack), input_size)
+        self.stages.append(record)
+        parent = self._stack[-1] if self._stack else None
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # The peak is reset for the nested stage, so the parent keeps what it reached so far
+            if parent is not None:
+                parent.peak_bytes = max(parent.peak_bytes, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        self._stack.append(record)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall = time.perf_counter() - wall
+            record.cpu = time.process_time() - cpu
+            self._stack.pop()
+            if tracing and tracemalloc.is_tracing():
+                record.peak_bytes = max(record.peak_bytes, tracemalloc.get_traced_memory()[1])
+                if parent is not None:
+                    parent.peak_bytes = max(parent.peak_bytes, record.peak_bytes)
+
+    def profile_text(self, limit=25):
+        """
+        Returns the top functions of the cProfile profile by cumulative time ('' without profiling).
+        """
+        if self.profiler is None:
+            return ''
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+    def to_dict(self):
+        return {
+            'source': self.source,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'memory': self.memory,
+            'stages': [record.to_dict() for record in self.stages],
+        }
+
+    def format(self):
+        """
+        Formats the stages as a text table (nested stages are indented).
+        """
+        rows = [f"{'stage':<34} {'wall, s':>9} {'cpu, s':>9} {'peak, MB':>9} {'input':>12} {'output':>12}"]
+        for record in self.stages:
+            peak = f"{record.peak_bytes / 2**20:9.1f}" if self.memory else f"{'-':>9}"
+            rows.append(f"{'  ' * record.depth + record.name:<34} {record.wall:9.3f} {record.cpu:9.3f} {peak} "
+                        f"{record.input_size:>12} {record.output_size:>12}  {record.note}".rstrip())
+        profile = self.profile_text()
+        if profile:
+            rows += ['', profile]
+        return '\n'.join(rows)
+
+    def save(self, directory):
+        """
+        Writes the report (`.gpt2md_report.json`) and the profile (`.gpt2md_profile.prof`, if any)
+        into the directory.
+
+        Returns:
+            str: Path of the report file.
+        """
+        report_path = os.path.join(directory, REPORT_NAME)
+        with open(report_path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=1)
+        if self.profiler is not None:
+            self.profiler.dump_stats(os.path.join(directory, PROFILE_NAME))
+        return report_path
+
+
+def stage(name, input_size=0):
+    """
+    Context manager measuring a pipeline stage in the collecting report, if any.
+
+    Yields a `StageRecord`; the stage may set its `output_size`.
+
+        with stage('canvas fix', len(html)) as record:
+            html = canvas_fix(html)
+            record.output_size = len(html)
+    """
+    report = _current_report.get()
+    if report is None:
+        return nullcontext(StageRecord(name))
+    return report.stage(name, input_size)
+
+
+def open_report(config, base=None):
+    """
+    Creates a report as set in [Settings] `perf_memory` / `perf_profile`.
+
+    Args:
+        config (Settings): Loaded config.ini.
+        base (PerfReport): Report whose source and stages the new one starts with, e.g. the conversion
+            of a chat for every export of it (the base report itself is not changed).
+    """
+    report = PerfReport(config.getboolean("Settings", "perf_memory", fallback=False),
+                        config.getboolean("Settings", "perf_profile", fallback=False))
+    if base is not None:
+        report.source = base.source
+        report.stages = list(base.stages)
+    return report
@@ -0,0 +1,251 @@
+"""
+Full-text search over the exported requests and answers (SQLite FTS5).
+
+Every export replaces the rows of its folder in `.gpt2md_search.db` in the Obsidian project folder,
+so the index follows re-exports without being rebuilt. Every row keeps its source file: the rows of
+a folder are never replaced by those of another chat while the folder exists (see `ExportConflict`).
+A hit is returned as a wiki-link to its page.
+
+    python -m searchindex "kafka partitioning"
+    python -m searchindex "партиции kafka" --index D:/Projects/Obsidian/Projects/.gpt2md_search.db -n 50
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+
+
+INDEX_NAME = '.gpt2md_search.db'
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS turns USING fts5(
+    request, answer, tags,
+    export UNINDEXED, page UNINDEXED, number UNINDEXED, source UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+"""
+
+# Words of a search query; every word is matched as a prefix
+QUERY_WORD_PATTERN = re.compile(r'\w+')
+
+SNIPPET_TOKENS = 12
+
+
+class ExportConflict(ValueError):
+    """The export folder is indexed with the turns of another source file."""
+
+
+def same_source(first, second):
+    return os.path.normcase(os.path.abspath(first)) == os.path.normcase(os.path.abspath(second))
+
+
+class SearchHit:
+    """
+    One found turn.
+
+    Attributes:
+        number (int): Request number.
+        export (str): Export folder relative to the project folder.
+        page (str): Page file name.
+        source (str): Source MHTML file.
+        snippet (str): Matching fragment, matches between `[` and `]`.
+    """
+    __slots__ = ('number', 'export', 'page', 'source', 'snippet')
+
+    def __init__(self, number, export, page, source, snippet):
+        self.number = number
+        self.export = export
+        self.page = page
+        self.source = source
+        self.snippet = snippet
+
+    @property
+    def link(self):
+        """Wiki-link to the page, e.g. `[[exported_20250101120000/page 007|page 007 #7]]`."""
+        target = os.path.splitext(self.page)[0]
+        path = '/'.join(part for part in (self.export.replace(os.sep, '/'), target) if part and part != '.')
+        return f"[[{path}|{target} #{self.number}]]"
+
+    def __repr__(self):
+        return f"SearchHit({self.number}, {self.export!r}, {self.page!r})"
+
+
+class RowSpool:
+    """
+    Rows for `SearchIndex.replace_export()` collected in a temporary file, so the texts of a whole chat
+    are not held in memory until the export is published.
+    """
+
+    def __init__(self):
+        self.file = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self.count = 0
+
+    def append(self, row):
+        self.file.write(json.dumps(row, ensure_ascii=False))
+        self.file.write('\n')
+        self.count += 1
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def __iter__(self):
+        self.file.seek(0)
+        for line in self.file:
+            yield tuple(json.loads(line))
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.file.close()
+
+
+def make_query(text):
+    """
+    Turns free text into an FTS5 query: all words must occur, each as a word prefix.
+
+    Returns:
+        str: FTS5 query ('' if the text has no words).
+    """
+    return ' '.join(f'"{word}"*' for word in QUERY_WORD_PATTERN.findall(text))
+
+
+class SearchIndex:
+    """
+    Search index of the exports of one Obsidian project folder.
+
+    Args:
+        path (str): Database file (see `index_path()`).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Batch conversions update the index from several processes
+        self.connection = sqlite3.connect(path, timeout=30)
+        if self.connection.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            with self.connection:
+                self.connection.execute('DROP TABLE IF EXISTS turns')
+                self.connection.executescript(SCHEMA)
+                self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def sources(self, export):
+        """
+        Returns the source files of the indexed turns of an export folder.
+        """
+        return [row[0] for row in self.connection.execute('SELECT DISTINCT source FROM turns WHERE export = ?',
+                                                          (export,))]
+
+    def _check_sources(self, export, source):
+        others = [other for other in self.sources(export) if not same_source(other, source)]
+        if others:
+            raise ExportConflict(f"{export} is indexed with the turns of {others[0]}, not of {source}: "
+                                 f"remove or rename the folder to export {source} into it")
+
+    def claim_export(self, export, source, exists):
+        """
+        Checks before an export that its folder may take the turns of `source`. The rows of another source
+        are dropped if the folder does not exist any more (it was removed or renamed).
+
+        Args:
+            export (str): Export folder relative to the project folder.
+            source (str): Source MHTML file.
+            exists (bool): Whether the export folder exists.
+
+        Raises:
+            ExportConflict: If the existing folder is indexed with the turns of another source.
+        """
+        if exists:
+            self._check_sources(export, source)
+        else:
+            self.remove_export(export)
+
+    def replace_export(self, export, source, rows):
+        """
+        Replaces the indexed turns of an export folder in one transaction.
+
+        Args:
+            export (str): Export folder relative to the project folder.
+            source (str): Source MHTML file.
+            rows (Iterable[Tuple[int, str, str, str, str]]): (number, request, answer, tags, page file name).
+
+        Raises:
+            ExportConflict: If the folder is indexed with the turns of another source (nothing is replaced then).
+        """
+        source = os.path.abspath(source)
+        with self.connection:
+            self._check_sources(export, source)
+            self.connection.execute('DELETE FROM turns WHERE export = ?', (export,))
+            self.connection.executemany(
+                'INSERT INTO turns (request, answer, tags, export, page, number, source) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                ((request, answer, tags, export, page, number, source) for number, request, answer, tags, page in rows))
+
+    def remove_export(self, export):
+        with self.connection:
+            self.connection.execute('DELETE FROM turns WHERE export = ?', (export,))
+
+    def search(self, text, limit=20):
+        """
+        Finds the turns whose request, answer or tags contain all words of the text (best matches first).
+
+        Returns:
+            List[SearchHit]: Found turns.
+        """
+        query = make_query(text)
+        if not query:
+            return []
+        cursor = self.connection.execute(
+            "SELECT number, export, page, source, snippet(turns, -1, '[', ']', '…', ?) FROM turns "
+            "WHERE turns MATCH ? ORDER BY rank LIMIT ?", (SNIPPET_TOKENS, query, limit))
+        return [SearchHit(*row) for row in cursor]
+
+    def __len__(self):
+        return self.connection.execute('SELECT count(*) FROM turns').fetchone()[0]
+
+
+def index_path(project_path):
+    return os.path.join(project_path, INDEX_NAME)
+
+
+def main(argv=None):
+    from settings import CONFIG_PATH, load_config
+
+    parser = argparse.ArgumentParser(prog="python -m searchindex",
+                                     description="Full-text search over the exported requests and answers.")
+    parser.add_argument("query", help="words to find (all must occur, prefixes match)")
+    parser.add_argument("--index", help="index file (default: .gpt2md_search.db in default_save_path)")
+    parser.add_argument("-c", "--config", default=CONFIG_PATH, help="path to config.ini")
+    parser.add_argument("-n", "--limit", type=int, default=20, help="maximum number of hits")
+    args = parser.parse_args(argv)
+
+    path = args.index or index_path(load_config(args.config).get("Settings", "default_save_path", fallback="."))
+    if not os.path.isfile(path):
+        print(f"No search index at {path}", file=sys.stderr)
+        return 1
+
+    with SearchIndex(path) as index:
+        hits = index.search(args.query, args.limit)
+    for hit in hits:
+        print(f"{hit.link}\n    {' '.join(hit.snippet.split())}")
+    if not hits:
+        print("Nothing found.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
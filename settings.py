@@ -0,0 +1,224 @@
+"""
+config.ini loaded into one `Settings` object.
+
+`Settings` is the parsed file. It is a ConfigParser, so any option can still be read where it is used.
+It also holds what the pipeline used to build from config.ini on every conversion and export: the
+compiled [Hard_replacements] rules, the keyword automaton of [Keywords] and the validated numbers of
+[Settings]. They are built on first use and dropped when an option is set.
+
+`SettingsFile` keeps the Settings of one file and reads the file again only when its modification time
+or size changes. The GUI and the batch and watch workers therefore pick up edits of config.ini without a
+restart, and nothing is rebuilt while the file stays the same.
+"""
+
+import configparser
+import os
+import re
+from configparser import ConfigParser
+
+from charsets import DEFAULT_DETECT_MAX_BYTES
+from fixups import compile_replacements
+from multireplace import Replacer
+from tagger import KeywordTagger, convert_tags
+
+
+CONFIG_PATH = "config.ini"
+
+# Settings built from the options by `Settings.build()`
+BUILT_SETTINGS = ('replacements', 'keyword_tagger', 'tag_string_len', 'detect_max_bytes', 'convert_jobs',
+                  'cache_max_bytes')
+
+
+class SettingsError(ValueError):
+    """config.ini cannot be parsed or an option has an invalid value."""
+
+
+class Settings(ConfigParser):
+    """
+    Parsed config.ini with the objects built from it.
+
+    Args:
+        path (str): File to read (None — no options).
+    """
+
+    def __init__(self, path=None):
+        self._built = {}
+        super().__init__()
+        self.path = path
+        if path is not None:
+            self.read(path)
+
+    # The built settings depend on the options: every change drops them
+
+    def read(self, filenames, encoding=None):
+        self._built.clear()
+        return super().read(filenames, encoding)
+
+    def read_file(self, f, source=None):
+        self._built.clear()
+        super().read_file(f, source)
+
+    def set(self, section, option, value=None):
+        self._built.clear()
+        super().set(section, option, value)
+
+    def remove_option(self, section, option):
+        self._built.clear()
+        return super().remove_option(section, option)
+
+    def remove_section(self, section):
+        self._built.clear()
+        return super().remove_section(section)
+
+    def _get_built(self, name, build):
+        try:
+            return self._built[name]
+        except KeyError:
+            value = self._built[name] = build()
+            return value
+
+    def build(self):
+        """
+        Builds all settings now, so an invalid value is reported when the file is loaded.
+
+        Raises:
+            SettingsError: An option has an invalid value.
+        """
+        for name in BUILT_SETTINGS:
+            getattr(self, name)
+
+    def get_int(self, option, fallback=None, minimum=0):
+        """
+        Reads an integer option of [Settings].
+
+        Args:
+            option (str): Option name.
+            fallback (int): Value if the option is missing or empty (None — the option is required).
+            minimum (int): Smallest valid value.
+
+        Raises:
+            SettingsError: The option is required and missing, not an integer or below `minimum`.
+        """
+        raw_value = self.get("Settings", option, fallback="").strip()
+        if not raw_value:
+            if fallback is None:
+                raise SettingsError(f"[Settings] {option}: required integer option is missing")
+            return fallback
+        try:
+            value = int(raw_value)
+        except ValueError:
+            raise SettingsError(f"[Settings] {option}: {raw_value!r} is not an integer") from None
+        if value < minimum:
+            raise SettingsError(f"[Settings] {option}: {value} is less than {minimum}")
+        return value
+
+    @property
+    def replacements(self):
+        """[Hard_replacements] rules compiled and planned into passes (see `multireplace.Replacer`)."""
+        return self._get_built('replacements', self._compile_replacements)
+
+    def _compile_replacements(self):
+        try:
+            return Replacer(compile_replacements(self.get("Hard_replacements", "replacements", fallback="")))
+        except (IndexError, re.error) as e:
+            raise SettingsError(f"[Hard_replacements] replacements: {e}") from None
+
+    @property
+    def keyword_tagger(self):
+        """Keyword automaton of [Keywords] `words`, whole words only with [Settings] `tag_whole_words`."""
+        return self._get_built('keyword_tagger', lambda: KeywordTagger(
+            convert_tags([line.strip() for line in self.get("Keywords", "words", fallback="").splitlines()
+                          if line.strip()]),
+            self.getboolean("Settings", "tag_whole_words", fallback=False)))
+
+    @property
+    def tag_string_len(self):
+        """Tags per line of the tag block ([Settings] `tag_string_len`, required)."""
+        return self._get_built('tag_string_len', lambda: self.get_int('tag_string_len', minimum=1))
+
+    @property
+    def detect_max_bytes(self):
+        """Byte budget of the encoding detector ([Settings] `encoding_detect_kb`)."""
+        return self._get_built('detect_max_bytes', lambda: self.get_int(
+            'encoding_detect_kb', DEFAULT_DETECT_MAX_BYTES >> 10) << 10)
+
+    @property
+    def cache_max_bytes(self):
+        """Size limit of the conversion cache ([Settings] `cache_max_mb`)."""
+        return self._get_built('cache_max_bytes', lambda: self.get_int('cache_max_mb', 512) << 20)
+
+    @property
+    def convert_jobs(self):
+        """Processes a large ChatGPT chat is rendered by ([Settings] `convert_jobs`, 0 — all cores)."""
+        return self._get_built('convert_jobs', lambda: self.get_int('convert_jobs', 1) or os.cpu_count() or 1)
+
+
+def load_config(config_path=CONFIG_PATH):
+    """
+    Reads config.ini; the settings built from it are built on first use.
+
+    Returns:
+        Settings: Parsed file (a missing file gives no options).
+    """
+    return Settings(config_path)
+
+
+def save_config(config, config_path=CONFIG_PATH):
+    with open(config_path, 'w') as f:
+        config.write(f)
+
+
+class SettingsFile:
+    """
+    Settings of one config.ini, read and built again only when the file changes.
+
+    Args:
+        path (str): config.ini path.
+    """
+
+    def __init__(self, path=CONFIG_PATH):
+        self.path = path
+        self.settings = None
+        self.stamp = None
+        self.loads = 0
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self):
+        """
+        Returns the Settings, reading the file again if its modification time or size changed.
+
+        Raises:
+            SettingsError: The changed file cannot be parsed or has an invalid value; the next call
+                tries again.
+        """
+        stamp = self._stamp()
+        if self.settings is None or stamp != self.stamp:
+            try:
+                settings = Settings(self.path)
+            except configparser.Error as e:
+                raise SettingsError(str(e)) from None
+            settings.build()
+            self.settings, self.stamp = settings, stamp
+            self.loads += 1
+        return self.settings
+
+
+_settings_files = {}
+
+
+def cached_settings(config_path=CONFIG_PATH):
+    """
+    Returns the Settings of a config.ini kept for the whole process (see `SettingsFile`):
+    a batch or watch worker converts many files with the same config.ini.
+    """
+    path = os.path.abspath(config_path)
+    settings_file = _settings_files.get(path)
+    if settings_file is None:
+        settings_file = _settings_files[path] = SettingsFile(path)
+    return settings_file.get()
@@ -0,0 +1,189 @@
+"""
+Rendering of one large ChatGPT chat on several cores.
+
+The page is cut into shards of whole turns (at the offsets of `converter.find_turn_starts()`), the shards
+are rendered by a process pool and their Markdown is put back together in order, so the result is the
+same as rendering turn by turn in one process (`converter.iter_turn_markdown()`):
+
+* every shard starts at a request heading with a new html2text converter. The worker of the previous shard
+  checks that its converter reached that heading in the state a new one starts in (see `is_fresh_state()`);
+  if it did not, the rest of the page is rendered again in the calling process;
+* a worker also feeds the first turn of the next shard, so its last turn is cut at the next heading
+  exactly as in one process.
+
+The fix-up passes stay in the calling process and run on the turns as the shards arrive.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from converter import (STAGE_HTML2TEXT, iter_html2text, iter_turn_markdown, new_html2text, prepare_turn_html,
+                       report_progress)
+
+
+# Shards per worker process: smaller shards balance the load and reach the calling process sooner
+SHARDS_PER_JOB = 4
+
+# A shard is not worth a process below this size (characters of HTML)
+MIN_SHARD_SIZE = 256 << 10
+
+# html2text state that only follows the position or the last output and is set again by the request
+# heading a shard starts with (`p_p`, `space`, `br_toggle`, `preceding_data`, `current_tag`), is only read
+# inside a table row or a <pre> that sets it first (`td_count`, `pre_indent`), is only read with `google_doc`
+# (`style_def`) or is only compared with itself (`outcount`)
+TRANSIENT_STATE = frozenset({
+    'out', 'outtextlist', 'start', 'p_p', 'space', 'br_toggle', 'preceding_data', 'current_tag', 'outcount',
+    'td_count', 'pre_indent', 'style_def', 'lasttag', 'lineno', 'offset', '_HTMLParser__starttag_text',
+})
+
+
+def plan_shards(offsets, jobs):
+    """
+    Groups the turns of a page into shards of similar HTML size.
+
+    Args:
+        offsets (List[int]): Turn offsets from `converter.find_turn_starts()` and the page length at the end.
+        jobs (int): Worker processes.
+
+    Returns:
+        List[Tuple[int, int]]: (first turn, end turn) of every shard (indexes into `offsets`);
+            a single shard if the page is too small to be split.
+    """
+    total = len(offsets) - 1
+    count = min(jobs * SHARDS_PER_JOB, offsets[-1] // MIN_SHARD_SIZE, total - 1)
+    if count < 2:
+        return [(0, total)]
+
+    bounds = [0]
+    turn = 1
+    for number in range(1, count):
+        target = offsets[-1] * number // count
+        while turn < total - 1 and offsets[turn] < target:
+            turn += 1
+        if turn > bounds[-1]:
+            bounds.append(turn)
+    bounds.append(total)
+    return list(zip(bounds, bounds[1:]))
+
+
+def is_fresh_state(converter):
+    """
+    Tells whether an html2text converter is in the state a new one starts in, apart from `TRANSIENT_STATE`.
+    """
+    state = vars(converter)
+    fresh = vars(new_html2text())
+    if state.keys() - TRANSIENT_STATE != fresh.keys() - TRANSIENT_STATE:
+        return False
+    return all(state[name] == fresh[name] for name in fresh if name not in TRANSIENT_STATE)
+
+
+def render_shard(shard_html, offsets, lookahead=None):
+    """
+    Renders the turns of one shard (in a worker process).
+
+    Args:
+        shard_html (str): HTML of the shard.
+        offsets (List[int]): Offsets of its turns in `shard_html` and its length at the end.
+        lookahead (str): HTML of the first turn of the next shard (None for the last shard).
+
+    Returns:
+        Tuple[List[str], bool, float]: Markdown pieces (see `converter.iter_html2text()`), whether the next
+            shard can start with a new converter and the html2text seconds.
+    """
+    converter = new_html2text()
+    timings = {}
+    pieces = []
+    fresh = True
+    before_lookahead = 0
+
+    def fragments():
+        nonlocal fresh, before_lookahead
+        for start, end in zip(offsets, offsets[1:]):
+            yield prepare_turn_html(shard_html[start:end])
+        if lookahead is not None:
+            fresh = is_fresh_state(converter)
+            before_lookahead = len(pieces)
+            yield prepare_turn_html(lookahead)
+
+    for piece in iter_html2text(fragments(), timings, converter):
+        pieces.append(piece)
+
+    if lookahead is not None:
+        # The next turn must have been cut off at its heading; it belongs to the next shard
+        fresh = fresh and len(pieces) == before_lookahead + 2
+        pieces.pop()
+    return pieces, fresh, timings.get('html2text', 0.0)
+
+
+def iter_sharded_markdown(html_content, offsets, shards, jobs, progress=None, timings=None):
+    """
+    Renders the shards of a page in a process pool and yields their Markdown pieces in order.
+
+    Only a few shards more than there are workers are submitted at a time, so the HTML is not copied
+    to the pool all at once.
+
+    Args:
+        html_content (str): ChatGPT HTML.
+        offsets (List[int]): Turn offsets and the page length (see `plan_shards()`).
+        shards (List[Tuple[int, int]]): Shards from `plan_shards()`.
+        jobs (int): Worker processes.
+        progress (callable): Optional `progress(stage, done, total)` callback, called before every shard.
+        timings (dict): Optional dict that receives the html2text seconds of all workers under 'html2text'.
+
+    Yields:
+        str: Raw Markdown pieces, as `converter.iter_turn_markdown()` yields them in one process.
+
+    Returns:
+        str: How the page was rendered, for the perf report.
+    """
+    total = len(offsets) - 1
+    workers = min(jobs, len(shards))
+    seconds = 0.0
+    done_size = 0
+    fallback = None
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+
+        def submit(number):
+            first, end = shards[number]
+            lookahead = html_content[offsets[end]:offsets[end + 1]] if end < total else None
+            pending.append(executor.submit(render_shard, html_content[offsets[first]:offsets[end]],
+                                           [offset - offsets[first] for offset in offsets[first:end + 1]],
+                                           lookahead))
+
+        for number in range(min(len(shards), workers + 1)):
+            submit(number)
+
+        for number, (first, _end) in enumerate(shards):
+            report_progress(progress, STAGE_HTML2TEXT, first, total)
+            pieces, fresh, shard_seconds = pending.popleft().result()
+            if number + len(pending) + 1 < len(shards):
+                submit(number + len(pending) + 1)
+
+            seconds += shard_seconds
+            for piece in pieces:
+                done_size += len(piece)
+                yield piece
+            if not fresh:
+                fallback = number + 1
+                break
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    if timings is not None:
+        timings['html2text'] = timings.get('html2text', 0.0) + seconds
+    if fallback is None:
+        report_progress(progress, STAGE_HTML2TEXT, total, total)
+        return f"{len(shards)} shards on {workers} processes"
+
+    # Shard `fallback` cannot start with a new converter: the page is rendered again in this process
+    # and what has been yielded already is skipped
+    for piece in iter_turn_markdown(html_content, progress, timings=timings):
+        if done_size >= len(piece):
+            done_size -= len(piece)
+            continue
+        yield piece[done_size:]
+        done_size = 0
+    return f"{len(shards)} shards on {workers} processes, from shard {fallback + 1} in one process"
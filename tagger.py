@@ -0,0 +1,154 @@
+"""
+Keyword tagger for exported pages.
+
+All keywords from [Keywords] are compiled into one Aho-Corasick automaton, so every page is
+scanned once (lowercased once) regardless of the number of keywords.
+"""
+
+import re
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordTagger:
+    """
+    Multi-pattern keyword matcher (Aho-Corasick automaton with a precomputed transition table).
+
+    Matching is case-insensitive and, like the plain `keyword in content` check it replaces,
+    finds keywords anywhere in the text unless `word_boundaries` is set.
+
+    Args:
+        keywords (List[Tuple[str, str]]): (search_string, display_tag) pairs, see `convert_tags()`.
+        word_boundaries (bool): Match only whole words (no letter, digit or '_' around the keyword).
+    """
+
+    def __init__(self, keywords, word_boundaries=False):
+        self.keywords = list(keywords)
+        self.word_boundaries = word_boundaries
+
+        # Keywords with an empty search string are contained in any text
+        self._always = [idx for idx, (search, _tag) in enumerate(self.keywords) if not search]
+
+        # Trie: transitions and keyword ids ending in every state
+        goto = [{}]
+        outputs = [[]]
+        self._lengths = []
+        for idx, (search, _tag) in enumerate(self.keywords):
+            search = search.lower()
+            self._lengths.append(len(search))
+            if not search:
+                continue
+            state = 0
+            for ch in search:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(idx)
+
+        # Failure links (BFS) turned into a full transition table: one dict lookup per character
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            transitions = dict(delta[fail[state]])
+            for ch, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(ch, 0) if state else 0
+                transitions[ch] = next_state
+                queue.append(next_state)
+            delta[state] = transitions
+
+        self._delta = delta
+        self._outputs = [tuple(output) for output in outputs]
+
+    def count(self, text):
+        """
+        Counts keyword occurrences in the text (overlapping occurrences are counted too).
+
+        Args:
+            text (str): Page content.
+
+        Returns:
+            Dict[int, int]: {keyword index: number of occurrences} for the keywords found.
+        """
+        hits = dict.fromkeys(self._always, 0)
+        delta = self._delta
+        outputs = self._outputs
+        text = text.lower()
+        state = 0
+
+        if not self.word_boundaries:
+            for ch in text:
+                state = delta[state].get(ch, 0)
+                if outputs[state]:
+                    for idx in outputs[state]:
+                        hits[idx] = hits.get(idx, 0) + 1
+            return hits
+
+        lengths = self._lengths
+        last = len(text) - 1
+        for pos, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for idx in outputs[state]:
+                    start = pos - lengths[idx] + 1
+                    if start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if pos < last and _is_word_char(text[pos + 1]):
+                        continue
+                    hits[idx] = hits.get(idx, 0) + 1
+        return hits
+
+    def tags(self, text):
+        """
+        Returns display tags of the keywords found in the text, in [Keywords] order.
+        """
+        return [self.keywords[idx][1] for idx in sorted(self.count(text))]
+
+    def tags_in(self, texts):
+        """
+        Returns display tags of the keywords found in any of the texts, in [Keywords] order
+        (the same as `tags()` of the texts joined by blank lines, scanned one text at a time).
+        """
+        found = set()
+        for text in texts:
+            found.update(self.count(text))
+        return [self.keywords[idx][1] for idx in sorted(found)]
+
+    def tag_counts(self, text):
+        """
+        Returns (display_tag, occurrences) of the keywords found in the text, in [Keywords] order.
+        """
+        hits = self.count(text)
+        return [(self.keywords[idx][1], hits[idx]) for idx in sorted(hits)]
+
+
+def convert_tags(tags: list[str]) -> list[tuple[str, str]]:
+    """
+    Converts raw tag strings into (search_string, display_tag) tuples.
+
+    Replaces underscores with spaces and handles encoded slashes and separators.
+
+    Args:
+        tags (list[str]): A list of tag strings.
+
+    Returns:
+        list[tuple[str, str]]: List of (normalized_name, formatted_tag).
+    """
+    return [
+        (
+            re.sub('_', ' ', re.sub('.·', '/', re.sub(r'^.+/', '', w.strip()))),
+            re.sub(r'.·', '·', w.strip())
+        )
+        for w in tags
+    ]
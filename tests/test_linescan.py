@@ -0,0 +1,84 @@
+import random
+import time
+
+import pytest
+
+import linescan
+from benchmarks.bench_fixups import CASES, FUZZ_TOKENS, spans
+
+
+CRAFTED_TEXTS = [
+    '',
+    'text',
+    # ChatGPT UI markers
+    ' python\n \n КопироватьРедактировать\n    code\n\nafter',
+    'intro\n \n \n \n КопироватьРедактировать\ntext',
+    '\n \n \n Всегда показывать подробности\nthoughts Копировать\n',
+    '\n \n \n Всегда показывать подробности',
+    ' bash\n\n\tКопироватьРедактировать\nls\n\n python\n \n КопироватьРедактировать',
+    # Tables
+    '---|---\n| a | b |\n  \nafter',
+    '---|---|---   \n\n| a | b | c |\n  ',
+    'x ---|---\n| a |\n  \n',
+    '---|---\n  \n  \n',
+    # Fences
+    '```python\n    x = 1\n    y = 2\n```\ntext ```sql select``` end',
+    '```\nplain\n``` ```js\ncode',
+    '````python\n    x\n````',
+    # Requests
+    '##### Вы сказали:\nhi\n\n###### ChatGPT сказал:\nanswer',
+    '##### Вы сказали:\nfirst\n##### Вы сказали:\nsecond\n  ###### ChatGPT сказал:',
+    '##### Вы сказали:\nno line break ###### ChatGPT сказал:\n\n###### ChatGPT сказал:',
+]
+
+# Inputs that made the former patterns retry from every line
+ADVERSARIAL_TEXTS = {
+    'unclosed fence': (linescan.iter_code_blocks, '```python\n' + '    code line\n' * 200_000),
+    'fences without language': (linescan.iter_code_blocks, '```\n' * 200_000),
+    'table without end line': (linescan.iter_table_blocks, '---|---\n| a | b |\n' * 100_000),
+    'long separator run': (linescan.iter_table_blocks, '---|' * 250_000 + '\n' + '|' * 1_000_000),
+    'blank lines before no marker': (linescan.iter_marker_spacing, ' \n' * 200_000 + 'text'),
+    'heading before blank lines': (linescan.iter_marker_headings, ' python\n' + ' \n' * 200_000 + 'text'),
+    'marker blocks without blank line': (linescan.iter_marker_code_blocks,
+                                         ' python\n \n КопироватьРедактировать\n' * 50_000 + 'text'),
+    'details without copy': (linescan.iter_marker_spacing, '\n \n \n Всегда показывать подробности\n' * 50_000),
+    'requests without answer': (linescan.iter_request_blocks, '##### Вы сказали:\nrequest\n' * 100_000),
+}
+
+TIME_LIMIT_SECONDS = 3.0
+
+
+@pytest.mark.parametrize('name', list(CASES))
+def test_scanner_matches_former_pattern(name):
+    pattern, scanner, groups, make_text = CASES[name]
+    texts = CRAFTED_TEXTS + [make_text(size) for size in (0, 1, 2, 3, 10, 50)]
+    for text in texts:
+        assert spans(scanner(text), groups) == spans(pattern.finditer(text), groups), text
+
+
+@pytest.mark.parametrize('name', list(CASES))
+def test_scanner_matches_former_pattern_on_random_texts(name):
+    pattern, scanner, groups, _make_text = CASES[name]
+    rnd = random.Random(name)
+    for _ in range(2000):
+        text = ''.join(rnd.choice(FUZZ_TOKENS) for _ in range(rnd.randint(0, 40)))
+        assert spans(scanner(text), groups) == spans(pattern.finditer(text), groups), text
+
+
+def test_substitute_replaces_like_re_sub():
+    pattern, scanner, groups, _make_text = CASES['fix_code_blocks']
+    text = CRAFTED_TEXTS[11]
+
+    def repl(match):
+        return f'<{match.group(1)}|{match.group(2)}>'
+
+    assert linescan.substitute(scanner, repl, text) == pattern.sub(repl, text)
+
+
+@pytest.mark.parametrize('name', list(ADVERSARIAL_TEXTS))
+def test_scanner_time_is_bounded(name):
+    scanner, text = ADVERSARIAL_TEXTS[name]
+    started = time.perf_counter()
+    for _match in scanner(text):
+        pass
+    assert time.perf_counter() - started < TIME_LIMIT_SECONDS
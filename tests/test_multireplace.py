@@ -0,0 +1,73 @@
+import os
+import random
+import re
+
+import pytest
+
+from multireplace import Replacer, replace_in_order
+from settings import load_config
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.ini')
+
+ALPHABET = 'ab<>\n'
+
+
+def random_rule(rnd):
+    if rnd.random() < 0.15:
+        return (re.compile(rnd.choice(['a+', '^b', '<.', 'b$', 'ab', '>']), re.MULTILINE),
+                rnd.choice(['', 'b', r'\\a']))
+    return (''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(1, 3))),
+            ''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 3))))
+
+
+@pytest.mark.parametrize('rules, text', [
+    # Originals sharing a prefix
+    ([('ab', 'X'), ('abc', 'Y')], 'abcab abc'),
+    ([('abc', 'Y'), ('ab', 'X')], 'abcab abc'),
+    # One original inside another
+    ([('b', 'X'), ('abc', 'Y')], 'abc b abc'),
+    # Overlapping originals: the earlier rule takes the shared character
+    ([('ab', 'b'), ('bc', 'Z')], 'abc bc'),
+    ([('bc', 'Z'), ('ab', 'b')], 'abc bc'),
+    # A replacement creates a match of a later rule
+    ([('a', 'b'), ('bb', 'c')], 'ab abb'),
+    # A deletion joins a match of a later rule
+    ([('X', ''), ('ab', '!')], 'aXb ab'),
+    # Self-overlapping original
+    ([('aa', 'b'), ('ba', 'c')], 'aaaa'),
+    # Regex rules between literal ones
+    ([('<', '['), (re.compile(r'^\[+', re.MULTILINE), r'\\'), ('>', ']')], '<<a>\n<b>'),
+])
+def test_overlapping_rules_match_sequential(rules, text):
+    assert Replacer(rules).apply(text) == replace_in_order(rules, text)
+
+
+def test_independent_literal_rules_are_one_pass():
+    rules = [(f'<tag{index}>', f'<_tag{index}_>') for index in range(200)]
+    replacer = Replacer(rules)
+    text = ''.join(f'x <tag{index}> <tag{index}' for index in range(0, 200, 7))
+
+    assert len(replacer.passes) == 1
+    assert replacer.apply(text) == replace_in_order(rules, text)
+
+
+def test_conflicting_rules_start_a_new_pass():
+    assert len(Replacer([('a', 'b'), ('bb', 'c')]).passes) == 2
+    assert len(Replacer([('ab', 'X'), ('cd', 'Y')]).passes) == 1
+
+
+def test_random_rules_match_sequential():
+    rnd = random.Random(0)
+    for _ in range(5000):
+        rules = [random_rule(rnd) for _ in range(rnd.randint(1, 8))]
+        text = ''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 40)))
+        assert Replacer(rules).apply(text) == replace_in_order(rules, text), (rules, text)
+
+
+def test_config_rules_match_sequential():
+    replacer = load_config(CONFIG_PATH).replacements
+    text = "+ item\nimport <module>\n  + not at line start\n+<module>+\n<module><module>"
+
+    assert len(replacer) > 0
+    assert replacer.apply(text) == replace_in_order(replacer.rules, text)
@@ -0,0 +1,54 @@
+import os
+import sqlite3
+
+import pytest
+
+from benchmarks.mhtml_gen import generate
+from converter import ExportOptions, convert_mhtml, export_markdown
+from searchindex import ExportConflict, SearchIndex, index_path
+from settings import load_config
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.ini')
+
+
+def export_chat(tmp_path, folder, turns, incremental=False):
+    file_path = tmp_path / folder / 'chat.mhtml'
+    file_path.parent.mkdir(exist_ok=True)
+    file_path.write_bytes(generate('chatgpt', turns))
+    config = load_config(CONFIG_PATH)
+    result = convert_mhtml(str(file_path), config)
+    project_path = tmp_path / 'vault'
+    base_path, _count, _writer = export_markdown(result.md_text, str(file_path), str(project_path),
+                                                 ExportOptions(incremental=incremental), config)
+    return str(project_path), base_path
+
+
+def test_answers_are_indexed_without_markup(tmp_path):
+    project_path, _base_path = export_chat(tmp_path, 'a', 5)
+
+    connection = sqlite3.connect(index_path(project_path))
+    rows = connection.execute('SELECT request, answer FROM turns').fetchall()
+    connection.close()
+    assert len(rows) == 5
+    for request, answer in rows:
+        assert '<span' not in request and '<span' not in answer
+        assert '[!' not in request
+
+    with SearchIndex(index_path(project_path)) as index:
+        hits = index.search('span color green') + index.search('docker', limit=50)
+    assert hits
+    for hit in hits:
+        assert 'span' not in hit.snippet and 'color' not in hit.snippet
+
+
+def test_export_of_another_source_does_not_replace_rows(tmp_path):
+    project_path, base_path = export_chat(tmp_path, 'a', 3, incremental=True)
+
+    # Another chat of the same file name goes into the same exported_chat folder
+    with pytest.raises(ExportConflict):
+        export_chat(tmp_path, 'b', 4, incremental=True)
+
+    with SearchIndex(index_path(project_path)) as index:
+        assert index.sources(os.path.relpath(base_path, project_path)) == [str(tmp_path / 'a' / 'chat.mhtml')]
+        assert len(index) == 3
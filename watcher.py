@@ -0,0 +1,268 @@
+"""
+Watch mode: converts the MHTML exports saved into a folder (default_load_path) automatically.
+
+    python -m watcher
+    python -m watcher D:/Downloads/gpt -o D:/Projects/Obsidian/Projects --jobs 2 --skip-existing
+
+The folder is polled; a new or changed *.mhtml / *.mht file is queued once its size and modification
+time have not changed for `settle_seconds` (the browser may still be writing it). Files are converted by
+a small process pool (see `batch_convert.convert_file()`) into the stable `exported_<file name>` folders
+of the export path, so a chat saved again only rewrites its changed pages. Converted files are
+remembered by content hash in `.gpt2md_watch.json` in the export path, so a restart does not convert
+them again.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from batch_convert import MHTML_EXTENSIONS, convert_file
+from cache import ConversionCache
+from converter import ExportOptions
+from settings import CONFIG_PATH, load_config
+
+
+WATCH_STATE_NAME = '.gpt2md_watch.json'
+
+# Watch events passed to `on_event(event, file_path, detail)`
+EVENT_QUEUED = 'queued'
+EVENT_CONVERTED = 'converted'
+EVENT_FAILED = 'failed'
+EVENT_SKIPPED = 'skipped'
+
+
+class ProcessedFiles:
+    """
+    Content hashes of the converted files, persisted as JSON.
+
+    Args:
+        path (str): State file path.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        try:
+            with open(path, encoding='utf-8') as file:
+                self.files = json.load(file).get('files', {})
+        except (OSError, ValueError):
+            pass
+
+    def __contains__(self, key):
+        return key in self.files
+
+    def __len__(self):
+        return len(self.files)
+
+    def add(self, key, source, export):
+        self.files[key] = {
+            'source': source,
+            'export': export,
+            'converted': datetime.now().isoformat(timespec='seconds'),
+        }
+        self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'files': self.files}, file, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+def watch_options(config):
+    """
+    Export options of the watch mode: incremental export, pages split as set in [Settings] `watch_split_pages`.
+    """
+    return ExportOptions(split_pages=config.getboolean("Settings", "watch_split_pages", fallback=True),
+                         incremental=True)
+
+
+class FolderWatcher:
+    """
+    Polls a folder and converts new MHTML files in the background.
+
+    Args:
+        watch_dir (str): Folder the browser saves the chats into.
+        export_path (str): Obsidian project folder.
+        options (ExportOptions): Export options (`incremental` is expected, see `watch_options()`).
+        config_path (str): config.ini passed to the worker processes.
+        jobs (int): Worker processes.
+        settle_seconds (float): How long a file must stay unchanged before it is converted.
+        poll_seconds (float): Interval between folder scans.
+        on_event (callable): `on_event(event, file_path, detail)` for EVENT_* (called from `poll()`).
+        use_cache (bool): Use the conversion cache in the workers.
+    """
+
+    def __init__(self, watch_dir, export_path, options, config_path=CONFIG_PATH, jobs=2, settle_seconds=3.0,
+                 poll_seconds=1.0, on_event=None, use_cache=True):
+        self.watch_dir = watch_dir
+        self.export_path = export_path
+        self.options = options
+        self.config_path = config_path
+        self.jobs = max(1, jobs)
+        self.settle_seconds = settle_seconds
+        self.poll_seconds = poll_seconds
+        self.on_event = on_event or (lambda event, file_path, detail: None)
+        self.use_cache = use_cache
+
+        self.processed = ProcessedFiles(os.path.join(export_path, WATCH_STATE_NAME))
+        # {path: ((size, mtime), unchanged since)} of the files seen in the folder
+        self._seen = {}
+        # {path: (size, mtime)} the file was last queued or skipped with
+        self._handled = {}
+        # {future: (path, content hash)}
+        self._pending = {}
+        self._executor = None
+
+    def skip_existing(self):
+        """
+        Marks the files currently in the folder as handled, so only files saved from now on are converted.
+        """
+        for path, signature in self._scan():
+            self._handled[path] = signature
+
+    def _scan(self):
+        try:
+            entries = list(os.scandir(self.watch_dir))
+        except OSError:
+            return []
+        files = []
+        for entry in entries:
+            if not entry.name.lower().endswith(MHTML_EXTENSIONS):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue  # removed or renamed meanwhile
+            if entry.is_file():
+                files.append((os.path.abspath(entry.path), (stat.st_size, stat.st_mtime_ns)))
+        return files
+
+    def ready_files(self, now=None):
+        """
+        Returns the files that changed since they were last handled and have stayed unchanged
+        for `settle_seconds`.
+        """
+        now = time.monotonic() if now is None else now
+        ready = []
+        present = set()
+        for path, signature in self._scan():
+            present.add(path)
+            seen = self._seen.get(path)
+            if seen is None or seen[0] != signature:
+                self._seen[path] = (signature, now)
+                continue
+            if self._handled.get(path) == signature or signature[0] == 0:
+                continue
+            if now - seen[1] >= self.settle_seconds and _is_readable(path):
+                ready.append((path, signature))
+
+        for path in set(self._seen) - present:
+            del self._seen[path]
+        return ready
+
+    def poll(self):
+        """
+        Scans the folder once, queues the settled files and reports the finished conversions.
+        """
+        self._collect()
+        queued = {key for _path, key in self._pending.values()}
+        for path, signature in self.ready_files():
+            self._handled[path] = signature
+            try:
+                key = ConversionCache.file_key(path)
+            except OSError:
+                continue
+            if key in self.processed or key in queued:
+                self.on_event(EVENT_SKIPPED, path, "already converted")
+                continue
+            future = self._executor.submit(convert_file, path, self.export_path, self.options, self.config_path,
+                                           False, self.use_cache)
+            self._pending[future] = (path, key)
+            queued.add(key)
+            self.on_event(EVENT_QUEUED, path, "")
+
+    def _collect(self):
+        for future in [future for future in self._pending if future.done()]:
+            path, key = self._pending.pop(future)
+            if future.cancelled():
+                continue
+            try:
+                _file_path, base_path, _size, count, seconds, *_timings = future.result()
+            except Exception as e:
+                self.on_event(EVENT_FAILED, path, str(e))
+                continue
+            self.processed.add(key, path, base_path)
+            self.on_event(EVENT_CONVERTED, path, f"{base_path}: {count} pages in {seconds:.1f} s")
+
+    def run(self, should_stop=lambda: False):
+        """
+        Watches the folder until `should_stop()` returns True, then waits for the running conversions
+        (queued ones that have not started are dropped and picked up again on the next start).
+        """
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            self._executor = executor
+            try:
+                while not should_stop():
+                    self.poll()
+                    time.sleep(self.poll_seconds)
+            finally:
+                for future in self._pending:
+                    future.cancel()
+        self._executor = None
+        self._collect()
+
+
+def _is_readable(path):
+    # On Windows a file the browser still writes cannot be opened
+    try:
+        with open(path, 'rb'):
+            return True
+    except OSError:
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m watcher",
+                                     description="Watches a folder and converts new MHTML files automatically.")
+    parser.add_argument("folder", nargs="?", help="folder to watch (default: default_load_path from config.ini)")
+    parser.add_argument("-o", "--output", help="Obsidian project folder (default: default_save_path from config.ini)")
+    parser.add_argument("-c", "--config", default=CONFIG_PATH, help="path to config.ini")
+    parser.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: watch_jobs or 2)")
+    parser.add_argument("--settle", type=float,
+                        help="seconds a file must stay unchanged before conversion (default: watch_settle_seconds or 3)")
+    parser.add_argument("--poll", type=float, default=1.0, help="folder scan interval in seconds")
+    parser.add_argument("--skip-existing", action="store_true", help="convert only files saved after the start")
+    parser.add_argument("--no-cache", action="store_true", help="do not use the conversion cache (cache_dir)")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    folder = args.folder or config.get("Settings", "default_load_path", fallback=".")
+    output = args.output or config.get("Settings", "default_save_path", fallback=".")
+
+    def report(event, file_path, detail):
+        print(f"[{event.upper():^9}] {file_path}" + (f" → {detail}" if detail else ""), flush=True)
+
+    watcher = FolderWatcher(folder, output, watch_options(config), args.config,
+                            jobs=args.jobs or config.getint("Settings", "watch_jobs", fallback=2),
+                            settle_seconds=(args.settle if args.settle is not None
+                                            else config.getfloat("Settings", "watch_settle_seconds", fallback=3.0)),
+                            poll_seconds=args.poll, on_event=report, use_cache=not args.no_cache)
+    if args.skip_existing:
+        watcher.skip_existing()
+
+    print(f"Watching {folder} → {output} ({len(watcher.processed)} files converted earlier), Ctrl+C to stop")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,407 @@
+"""
+Page writers used by `converter.save_blocks()`.
+
+`PageWriter` simply writes every page; `ParallelPageWriter` writes the pages concurrently into a
+temporary folder and publishes the whole export with one rename; `IncrementalPageWriter` keeps a
+manifest of content hashes in a stable export folder and touches only the pages that changed.
+
+Pages are written whole (`write()`) or streamed part by part (`open()` / `write_parts()`), so a page
+with the whole chat never has to be held in memory.
+"""
+
+import hashlib
+import json
+import os
+import re
+import secrets
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+MANIFEST_NAME = '.gpt2md_manifest.json'
+
+# Streamed pages up to this size are buffered and written like whole pages
+STREAM_BUFFER_SIZE = 1 << 20
+
+# Folder next to the exports holding their temporary folders `<export name>.<random>`
+TEMP_DIR_NAME = '.gpt2md_tmp'
+TEMP_FOLDER_PATTERN = re.compile(r'^.+\.[0-9a-f]{8}$')
+# A temporary export folder not changed for this long was left by a killed export
+STALE_TEMP_SECONDS = 6 * 3600
+
+
+def encode_text(text):
+    """
+    Encodes text the same way a file opened in text mode would (platform line endings, utf-8).
+    """
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode('utf-8')
+
+
+def atomic_write(file_path, data: bytes):
+    """
+    Writes data to a temporary file next to `file_path` and renames it over the target,
+    so readers (Obsidian) never see a half-written file.
+    """
+    tmp_path = file_path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(data)
+    os.replace(tmp_path, file_path)
+
+
+class PageStream:
+    """
+    A page written part by part, see `PageWriter.open()`.
+
+    Leaving the `with` block with an exception aborts the page (what remains of it is up to the writer).
+    """
+
+    def __init__(self, name, file, on_close):
+        self.name = name
+        self.file = file
+        self.size = 0
+        self._on_close = on_close
+
+    def write(self, text):
+        data = encode_text(text)
+        self.file.write(data)
+        self.size += len(data)
+
+    def close(self, complete=True):
+        self.file.close()
+        self._on_close(self, complete)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(exc_type is None)
+
+
+class PageWriter:
+    """
+    Writes pages into the export directory.
+
+    Args:
+        base_path (str): Export directory.
+    """
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+        self.bytes_written = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def write(self, name, text):
+        data = encode_text(text)
+        with open(os.path.join(self.base_path, name), 'wb') as file:
+            file.write(data)
+        self.bytes_written += len(data)
+        self.written += 1
+
+    def open(self, name):
+        """
+        Opens a page to be written part by part.
+
+        Returns:
+            PageStream: The page, use it as a context manager.
+        """
+        return PageStream(name, open(os.path.join(self.base_path, name), 'wb'), self._stream_closed)
+
+    def _stream_closed(self, stream, complete):
+        self.bytes_written += stream.size
+        self.written += 1
+
+    def write_parts(self, name, parts):
+        """
+        Writes a page given as an iterable of text parts.
+        """
+        with self.open(name) as stream:
+            for part in parts:
+                stream.write(part)
+
+    def close(self, complete=True):
+        self.seconds = time.perf_counter() - self.started
+
+    def throughput(self):
+        """
+        Returns the write speed since the writer was created.
+
+        Returns:
+            Tuple[float, float]: Bytes per second and files per second.
+        """
+        seconds = max(self.seconds or time.perf_counter() - self.started, 1e-9)
+        return self.bytes_written / seconds, self.written / seconds
+
+    def summary(self):
+        return f"записано: {self.written}"
+
+
+def remove_stale_temp_folders(temp_root, max_age=STALE_TEMP_SECONDS):
+    """
+    Removes the temporary export folders in `temp_root` (the `TEMP_DIR_NAME` folder, nothing outside it)
+    left by exports that were killed: those named like `<export name>.<random>` and not changed for
+    `max_age` seconds. Folders of exports still running are changed whenever a page is written.
+    """
+    try:
+        entries = list(os.scandir(temp_root))
+    except OSError:
+        return
+    now = time.time()
+    for entry in entries:
+        try:
+            if (TEMP_FOLDER_PATTERN.match(entry.name) and entry.is_dir(follow_symlinks=False)
+                    and now - entry.stat(follow_symlinks=False).st_mtime > max_age):
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError:
+            continue
+
+
+def unique_export_path(base_path):
+    """
+    Returns `base_path`, or `base_path_2`, `base_path_3`, … if it exists
+    (e.g. two exports within the same second of `exported_<timestamp>`).
+    """
+    path = base_path
+    number = 2
+    while os.path.lexists(path):
+        path = f"{base_path}_{number}"
+        number += 1
+    return path
+
+
+class ParallelPageWriter(PageWriter):
+    """
+    Writes the pages concurrently through a bounded thread pool into a temporary folder in
+    `TEMP_DIR_NAME` next to `base_path` and renames it to `base_path` on a complete `close()`, so
+    an interrupted export leaves no half-written folder. The temporary folder has a unique name, so
+    exports running at the same time never touch each other's pages; it is removed when the export is
+    cancelled or fails.
+
+    Args:
+        base_path (str): Export directory; it must not exist yet.
+        max_workers (int): Number of writer threads.
+
+    Raises:
+        FileExistsError: If `base_path` already exists.
+    """
+
+    def __init__(self, base_path, max_workers=4):
+        super().__init__(base_path)
+        if os.path.lexists(base_path):
+            raise FileExistsError(f"Export folder already exists: {base_path}")
+        parent, name = os.path.split(os.path.normpath(base_path))
+        self.temp_root = os.path.join(parent, TEMP_DIR_NAME)
+        remove_stale_temp_folders(self.temp_root)
+        # Not tempfile.mkdtemp(): its folder is private (0700) and would keep that mode once published
+        while True:
+            self.temp_path = os.path.join(self.temp_root, f'{name}.{secrets.token_hex(4)}')
+            os.makedirs(self.temp_root, exist_ok=True)
+            try:
+                os.mkdir(self.temp_path)
+                break
+            except (FileExistsError, FileNotFoundError):
+                continue  # taken, or the temporary root was just removed by another export
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.futures = []
+
+    def _write_file(self, name, data):
+        with open(os.path.join(self.temp_path, name), 'wb') as file:
+            file.write(data)
+
+    def write(self, name, text):
+        # Pages are encoded here, only the file I/O goes to the pool
+        data = encode_text(text)
+        self.futures.append(self.executor.submit(self._write_file, name, data))
+        self.bytes_written += len(data)
+        self.written += 1
+
+    def open(self, name):
+        # Streamed pages go straight into the temporary folder from the calling thread
+        return PageStream(name, open(os.path.join(self.temp_path, name), 'wb'), self._stream_closed)
+
+    def write_parts(self, name, parts):
+        """
+        Writes a page given as an iterable of text parts: small pages go to the thread pool,
+        a page that grows beyond `STREAM_BUFFER_SIZE` is streamed from the calling thread.
+        """
+        parts = iter(parts)
+        buffered = []
+        size = 0
+        for part in parts:
+            buffered.append(part)
+            size += len(part)
+            if size > STREAM_BUFFER_SIZE:
+                with self.open(name) as stream:
+                    stream.write(''.join(buffered))
+                    for part in parts:
+                        stream.write(part)
+                return
+        self.write(name, ''.join(buffered))
+
+    def close(self, complete=True):
+        """
+        Waits for the pending writes and publishes the export.
+
+        Args:
+            complete (bool): False if the export was interrupted: the temporary folder is removed then.
+
+        Raises:
+            OSError: If a page could not be written (nothing is published then).
+            FileExistsError: If `base_path` appeared meanwhile (nothing is published then).
+        """
+        try:
+            self.executor.shutdown(wait=True)
+            for future in self.futures:
+                future.result()
+            if complete:
+                self._publish()
+        except BaseException:
+            shutil.rmtree(self.temp_path, ignore_errors=True)
+            self._remove_temp_root()
+            raise
+        if not complete:
+            shutil.rmtree(self.temp_path, ignore_errors=True)
+        self._remove_temp_root()
+        super().close(complete)
+
+    def _remove_temp_root(self):
+        # Left in place while other exports use it
+        try:
+            os.rmdir(self.temp_root)
+        except OSError:
+            pass
+
+    def _publish(self):
+        # os.rename() would replace an empty folder on POSIX: a folder created meanwhile is never merged into
+        if os.path.lexists(self.base_path):
+            raise FileExistsError(f"Export folder already exists: {self.base_path}")
+        try:
+            os.rename(self.temp_path, self.base_path)
+        except OSError:
+            if os.path.lexists(self.base_path):
+                raise FileExistsError(f"Export folder already exists: {self.base_path}") from None
+            raise
+
+
+class IncrementalPageWriter(PageWriter):
+    """
+    Re-exports into a stable folder, rewriting only the pages whose content changed.
+
+    A manifest (`.gpt2md_manifest.json`) stores sha256, size and mtime of every written page.
+    A page is skipped if its hash is the same and the file on disk was not touched since;
+    changed pages are replaced atomically; pages of the previous export that are not written
+    again are removed on `close()`.
+
+    Args:
+        base_path (str): Stable export directory.
+    """
+
+    def __init__(self, base_path):
+        super().__init__(base_path)
+        self.manifest_path = os.path.join(base_path, MANIFEST_NAME)
+        try:
+            with open(self.manifest_path, encoding='utf-8') as file:
+                self.previous = json.load(file)
+        except (OSError, ValueError):
+            self.previous = {}
+        self.current = {}
+
+    def write(self, name, text):
+        data = encode_text(text)
+        digest = hashlib.sha256(data).hexdigest()
+        file_path = os.path.join(self.base_path, name)
+
+        if self._is_unchanged(name, digest):
+            return
+
+        atomic_write(file_path, data)
+        stat = os.stat(file_path)
+        self.current[name] = {'sha256': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        self.bytes_written += len(data)
+        self.written += 1
+
+    def open(self, name):
+        """
+        Opens a page to be written part by part into a temporary file; on close it replaces the page
+        only if its hash differs from the manifest (or the file was touched), otherwise it is dropped.
+        """
+        return PageStream(name, _HashingFile(os.path.join(self.base_path, name) + '.tmp'), self._stream_closed)
+
+    def _stream_closed(self, stream, complete):
+        tmp_path = stream.file.path
+        if not complete:
+            os.remove(tmp_path)
+            return
+        name = stream.name
+        file_path = os.path.join(self.base_path, name)
+        digest = stream.file.digest.hexdigest()
+        if self._is_unchanged(name, digest):
+            os.remove(tmp_path)
+            return
+        os.replace(tmp_path, file_path)
+        stat = os.stat(file_path)
+        self.current[name] = {'sha256': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        self.bytes_written += stream.size
+        self.written += 1
+
+    def _is_unchanged(self, name, digest):
+        entry = self.previous.get(name)
+        if not entry or entry.get('sha256') != digest:
+            return False
+        try:
+            stat = os.stat(os.path.join(self.base_path, name))
+        except OSError:
+            return False
+        if stat.st_size != entry.get('size') or stat.st_mtime_ns != entry.get('mtime_ns'):
+            return False
+        self.current[name] = entry
+        self.unchanged += 1
+        return True
+
+    def close(self, complete=True):
+        """
+        Removes pages of the previous export that were not written again and saves the manifest.
+
+        Args:
+            complete (bool): False if the export was interrupted: nothing is removed then and
+                the pages not reached yet stay in the manifest.
+        """
+        for name in self.previous.keys() - self.current.keys():
+            if not complete:
+                self.current[name] = self.previous[name]
+                continue
+            try:
+                os.remove(os.path.join(self.base_path, name))
+                self.removed += 1
+            except FileNotFoundError:
+                pass
+
+        atomic_write(self.manifest_path, json.dumps(self.current, ensure_ascii=False, indent=1).encode('utf-8'))
+        super().close(complete)
+
+    def summary(self):
+        return f"записано: {self.written}, без изменений: {self.unchanged}, удалено: {self.removed}"
+
+
+class _HashingFile:
+    """
+    Binary file that hashes (sha256) everything written to it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.digest = hashlib.sha256()
+        self.file = open(path, 'wb')
+
+    def write(self, data):
+        self.digest.update(data)
+        self.file.write(data)
+
+    def close(self):
+        self.file.close()